@@ -0,0 +1,510 @@
+"""
+Read sheets as NumPy arrays.
+
+The values are written into preallocated arrays as the engine yields the rows,
+the rows of the sheet are not stored as lists first. Open the reader with
+``lazy=True`` to fill the arrays straight from the engine, a reader which has
+already parsed its sheets fills them from the parsed sheets.
+A Sheet in memory is converted the same way by `sheet_arrays()`.
+"""
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence
+
+from .Grid import ColumnBuffer
+from .Utils import get_column_letter
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .Documents.File.Excel.Sheet import Sheet
+    from .Engines.ReaderBase import BaseReader
+
+# Rows reserved up front at most, some files declare a dimension far larger than their data.
+PREALLOCATE_MAX = 1 << 20
+
+# Marks a missing ``na_value``, None is a valid value for object arrays.
+NO_VALUE = object()
+
+
+def _missing(dtype: "np.dtype", na_value: Any = NO_VALUE) -> Any:
+    """
+    Return the value of the missing cells of an array of a dtype, or NO_VALUE if it has none.
+    """
+    import numpy as np
+
+    if na_value is not NO_VALUE:
+        return na_value
+    if dtype.kind in "fc":
+        return np.nan
+    if dtype.kind in "Mm":
+        return np.datetime64("NaT")
+    if dtype.kind == "O":
+        return None
+    if dtype.kind in "US":
+        return ""
+    return NO_VALUE
+
+
+def _is_empty(value) -> bool:
+    return value is None or (type(value) is str and value == "")
+
+
+class TypedColumn:
+    """
+    A column converted to a given dtype while it is filled.
+
+    Strings are collected as objects and converted at the end,
+    so that a string dtype without a length fits the longest value.
+
+    :param name: The name of the column, for the error messages.
+    :param dtype: The dtype of the array.
+    :param capacity: The number of rows reserved.
+    :param na_value: The value of the missing cells. Default to NaN, NaT, None or ""
+                     depending on the dtype, integer and boolean columns have no default.
+    """
+
+    def __init__(self, name: str, dtype, capacity: int, na_value: Any = NO_VALUE):
+        import numpy as np
+
+        self.name = name
+        self.dtype = np.dtype(dtype)
+        self.na_value = na_value
+        self.values = np.empty(
+            capacity, dtype=object if self.dtype.kind in "US" else self.dtype
+        )
+        self.mask = np.zeros(capacity, dtype=bool)
+        self.length = 0
+
+    def _reserve(self, size: int):
+        import numpy as np
+
+        capacity = max(size, len(self.values) * 2)
+        values = np.empty(capacity, dtype=self.values.dtype)
+        values[: self.length] = self.values[: self.length]
+        mask = np.zeros(capacity, dtype=bool)
+        mask[: self.length] = self.mask[: self.length]
+        self.values, self.mask = values, mask
+
+    def set(self, index: int, value):
+        """
+        Write a value at the given index, an empty value leaves the cell missing.
+
+        :raise ValueError: If the value cannot be converted to the dtype.
+        """
+        if index >= len(self.values):
+            self._reserve(index + 1)
+        if index >= self.length:
+            self.length = index + 1
+        if _is_empty(value):
+            return
+        try:
+            self.values[index] = value
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(
+                f"Cannot store {value!r} of row {index} of column {self.name!r} as {self.dtype}"
+            ) from None
+        self.mask[index] = True
+
+    def finish(self, length: int) -> "np.ndarray":
+        """
+        Return the array of the first ``length`` rows, with the missing cells filled.
+
+        :raise ValueError: If cells are missing and the dtype has no missing value.
+        """
+        if length > len(self.values):
+            self._reserve(length)
+        values = self.values[:length]
+        missing = ~self.mask[:length]
+        if missing.any():
+            fill = _missing(self.dtype, self.na_value)
+            if fill is NO_VALUE:
+                raise ValueError(
+                    f"Column {self.name!r} has {int(missing.sum())} missing cells, "
+                    f"which cannot be stored as {self.dtype}. Pass na_value to fill them."
+                )
+            values[missing] = fill
+        if self.dtype.kind in "US":
+            return values.astype(self.dtype)
+        return _trimmed(values, len(self.values))
+
+
+def _trimmed(values: "np.ndarray", capacity: int) -> "np.ndarray":
+    """
+    Copy a view of a much larger buffer, so that the unused rows are released.
+    """
+    return values.copy() if capacity > len(values) + len(values) // 4 + 16 else values
+
+
+def _finish_inferred(
+    column: ColumnBuffer, length: int, na_value: Any = NO_VALUE
+) -> "np.ndarray":
+    """
+    Return the array of a column whose dtype was inferred from its values.
+    Missing cells are NaN in float columns, NaT in datetime columns and None (or ``na_value``)
+    in object columns. Integer columns with missing cells become float columns,
+    boolean ones object columns.
+    """
+    import numpy as np
+
+    if column.kind is None:
+        return np.full(length, None if na_value is NO_VALUE else na_value, dtype=object)
+    column._reserve(length)
+    capacity = len(column.state)
+    values = column.values[:length]
+    valid = column.state[:length] == ColumnBuffer.VALID
+    if valid.all():
+        return _trimmed(values, capacity)
+    missing = ~valid
+    if column.kind == "i" and na_value is NO_VALUE:
+        if np.abs(values[valid]).max(initial=0) < (1 << 53):
+            values = values.astype("float64")
+        else:
+            values = values.astype(object)
+        capacity = length
+    elif column.kind == "b":
+        values = values.astype(object)
+        capacity = length
+    fill = _missing(values.dtype, na_value)
+    values[missing] = fill
+    return _trimmed(values, capacity)
+
+
+class _Names:
+    """
+    The names of the columns: the header values, or the column letters
+    of the columns without a header. Repeated names get a suffix, e.g. 'Amount.1'.
+    """
+
+    def __init__(self, header: Optional[Sequence], columns: Optional[list[int]]):
+        self.header = header or ()
+        self.columns = columns
+        self.seen: dict[str, int] = {}
+
+    def __call__(self, position: int) -> str:
+        value = self.header[position] if position < len(self.header) else None
+        if _is_empty(value):
+            column = self.columns[position] if self.columns is not None else position
+            name = get_column_letter(column + 1)
+        else:
+            name = str(value)
+        if name in self.seen:
+            self.seen[name] += 1
+            return f"{name}.{self.seen[name]}"
+        self.seen[name] = 0
+        return name
+
+
+class _Source:
+    """
+    The rows of a sheet to convert, with the estimate of their number and the source columns.
+
+    :param rows: The (index, row) tuples of the rows, the header row included.
+    :param estimate: The number of data rows, or None if it is unknown.
+    :param has_header: If True, the first row is the header row.
+    :param columns: The indexes of the selected columns in the file, or None for every column.
+    """
+
+    def __init__(
+        self,
+        rows: Iterator[tuple[int, Sequence]],
+        estimate: Optional[int],
+        has_header: bool,
+        columns: Optional[list[int]] = None,
+    ):
+        self.rows = rows
+        self.has_header = has_header
+        self.columns = columns
+        self.capacity = min(max(estimate or 0, 16), PREALLOCATE_MAX)
+
+    @classmethod
+    def of_reader(cls, reader: "BaseReader", index: int) -> "_Source":
+        has_header = reader._header_row is not None
+        if reader._lazy and reader._sheets[index] is None:
+            rows = reader._used_rows(index)
+            estimate = reader._row_count(index)
+            if estimate is not None:
+                if has_header:
+                    estimate -= reader._header_row + 1
+                estimate -= reader._skiprows
+                if reader._max_rows is not None:
+                    estimate = min(estimate, reader._max_rows)
+        else:
+            sheet = reader.sheet_by_index(index)
+            rows = sheet.iter_populated_rows()
+            estimate = sheet.nrows() - has_header
+        return cls(rows, estimate, has_header, reader._selected_columns(index))
+
+    @classmethod
+    def of_sheet(cls, sheet: "Sheet", header: bool) -> "_Source":
+        return cls(sheet.iter_populated_rows(), sheet.nrows() - header, header)
+
+    def header(self) -> Optional[list]:
+        """
+        Consume the header row and return it, or None if there is no header row.
+        The positions of the next rows are relative to the first data row.
+        """
+        if not self.has_header:
+            return None
+        rows = self.rows
+        first = next(rows, None)
+        if first is None:
+            return []
+        if first[0] != 0:
+            # The header row is empty, the first data row was read.
+            self.rows = _chain_one((first[0] - 1, first[1]), _shift(rows))
+            return []
+        self.rows = _shift(rows)
+        return list(first[1])
+
+
+def _shift(rows: Iterator[tuple[int, Sequence]]) -> Iterator[tuple[int, Sequence]]:
+    for i, row in rows:
+        yield i - 1, row
+
+
+def _chain_one(first, rows):
+    yield first
+    yield from rows
+
+
+def _column_dtype(dtype, name: str, position: int):
+    """
+    Return the dtype requested for a column, or None to infer it.
+    """
+    if isinstance(dtype, dict):
+        if name in dtype:
+            return dtype[name]
+        return dtype.get(position)
+    return dtype
+
+
+def read_arrays(
+    reader: "BaseReader",
+    index: int,
+    dtype=None,
+    na_value: Any = NO_VALUE,
+) -> dict[str, "np.ndarray"]:
+    """
+    Read a sheet as one NumPy array per column.
+
+    The columns are named after the header row if the reader has one,
+    after their letters otherwise. The reader options (usecols, header_row,
+    skiprows, nrows and where) select the columns and the rows.
+
+    :param reader: The reader engine.
+    :param index: The index of the sheet.
+    :param dtype: The dtype of every column, or a dict of column name (or position) to dtype.
+                  The dtype of the other columns is inferred from their values: int64, float64,
+                  bool, datetime64[us], or object for text and mixed columns.
+    :param na_value: The value of the missing cells. Default to NaN, NaT or None depending on the dtype.
+    :return: A dict of column name to array, in the order of the columns.
+    :raise ValueError: If a value cannot be converted, or cells are missing in an integer
+                       or boolean column of a requested dtype and ``na_value`` is not given.
+    """
+    return _fill(_Source.of_reader(reader, index), dtype, na_value)
+
+
+def sheet_arrays(
+    sheet: "Sheet",
+    header: bool = True,
+    dtype=None,
+    na_value: Any = NO_VALUE,
+) -> dict[str, "np.ndarray"]:
+    """
+    Convert a sheet in memory to one NumPy array per column.
+
+    :param sheet: The sheet.
+    :param header: If True, the columns are named after the first row, which is not converted.
+                   Otherwise, they are named after their letters.
+    :param dtype: The dtype of every column, or a dict of column name (or position) to dtype,
+                  see `read_arrays()`.
+    :param na_value: The value of the missing cells, see `read_arrays()`.
+    :return: A dict of column name to array, in the order of the columns.
+    :raise ValueError: If a value cannot be converted to the dtype of its column.
+    """
+    return _fill(_Source.of_sheet(sheet, header), dtype, na_value)
+
+
+def _fill(source: _Source, dtype, na_value: Any) -> dict[str, "np.ndarray"]:
+    """
+    Fill one array per column from the rows of a source.
+    """
+    header = source.header()
+    name_of = _Names(header, source.columns)
+    # The selected columns are known, the other sheets are as wide as their widest row.
+    width = None if source.columns is None else len(source.columns)
+    names: list[str] = []
+    buffers: list = []
+
+    def add_column():
+        position = len(buffers)
+        name = name_of(position)
+        requested = _column_dtype(dtype, name, position)
+        if requested is None:
+            buffer = ColumnBuffer()
+            buffer._reserve(source.capacity)
+        else:
+            buffer = TypedColumn(name, requested, source.capacity, na_value)
+        names.append(name)
+        buffers.append(buffer)
+
+    for _ in range(len(header or ()) if width is None else width):
+        add_column()
+    setters = [buffer.set for buffer in buffers]
+    length = 0
+    for i, row in source.rows:
+        if width is None and len(row) > len(buffers):
+            while len(buffers) < len(row):
+                add_column()
+            setters = [buffer.set for buffer in buffers]
+        # zip() stops at the last selected column, or at the end of a short row.
+        for setter, value in zip(setters, row):
+            setter(i, value)
+        length = i + 1
+    arrays = {}
+    for name, buffer in zip(names, buffers):
+        if isinstance(buffer, TypedColumn):
+            arrays[name] = buffer.finish(length)
+        else:
+            arrays[name] = _finish_inferred(buffer, length, na_value)
+    return arrays
+
+
+def read_numpy(
+    reader: "BaseReader",
+    index: int,
+    dtype=None,
+    structured: bool = False,
+    na_value: Any = NO_VALUE,
+) -> "np.ndarray":
+    """
+    Read a sheet as a 2-D array, or as a structured array with one field per column.
+
+    :param reader: The reader engine.
+    :param index: The index of the sheet.
+    :param dtype: The dtype of the array. A structured dtype gives a structured array,
+                  its fields are matched to the columns by position.
+                  Default to the common dtype of the inferred columns, or object.
+    :param structured: If True, return a structured array whose fields are named after the columns.
+    :param na_value: The value of the missing cells, see `read_arrays()`.
+    :return: The array.
+    :raise ValueError: If a value cannot be converted, or the structured dtype
+                       does not have one field per column.
+    """
+    import numpy as np
+
+    if dtype is not None and np.dtype(dtype).names is not None:
+        dtype = np.dtype(dtype)
+        arrays = read_arrays(
+            reader,
+            index,
+            dict(enumerate(dtype[i] for i in range(len(dtype)))),
+            na_value,
+        )
+        if len(arrays) != len(dtype.names):
+            raise ValueError(
+                f"The dtype has {len(dtype.names)} fields, the sheet has {len(arrays)} columns"
+            )
+        arrays = dict(zip(dtype.names, arrays.values()))
+        structured = True
+    elif dtype is not None and not structured:
+        return _read_matrix(reader, index, np.dtype(dtype), na_value)
+    else:
+        arrays = read_arrays(reader, index, dtype, na_value)
+    length = len(next(iter(arrays.values()))) if arrays else 0
+    if structured:
+        out = np.empty(length, dtype=[(name, a.dtype) for name, a in arrays.items()])
+        for name, a in arrays.items():
+            out[name] = a
+        return out
+    if not arrays:
+        return np.empty((length, 0), dtype=object)
+    dtypes = [a.dtype for a in arrays.values()]
+    common = object if any(d.kind == "O" for d in dtypes) else np.result_type(*dtypes)
+    out = np.empty((length, len(arrays)), dtype=common)
+    for j, a in enumerate(arrays.values()):
+        out[:, j] = a
+    return out
+
+
+def _read_matrix(
+    reader: "BaseReader", index: int, dtype: "np.dtype", na_value: Any
+) -> "np.ndarray":
+    """
+    Fill a 2-D array of a given dtype straight from the rows. Each row is converted
+    by NumPy at once, rows with empty cells are converted cell by cell.
+    """
+    import numpy as np
+
+    source = _Source.of_reader(reader, index)
+    header = source.header()
+    width = len(source.columns) if source.columns is not None else len(header or ())
+    fill = _missing(dtype, na_value)
+    store = object if dtype.kind in "US" else dtype
+    out = np.empty((source.capacity, width), dtype=store)
+    mask = (
+        None if fill is not NO_VALUE else np.zeros((source.capacity, width), dtype=bool)
+    )
+    written = 0  # Rows of `out` initialized so far.
+    length = 0
+
+    def reserve(rows: int, cols: int):
+        nonlocal out, mask
+        if rows > out.shape[0]:
+            rows = max(rows, out.shape[0] * 2)
+        cols = max(cols, out.shape[1])
+        grown = np.empty((rows, cols), dtype=store)
+        grown[: out.shape[0], : out.shape[1]] = out
+        if fill is not NO_VALUE and cols > out.shape[1]:
+            grown[:written, out.shape[1] :] = fill
+        if mask is not None:
+            m = np.zeros((rows, cols), dtype=bool)
+            m[: mask.shape[0], : mask.shape[1]] = mask
+            mask = m
+        out = grown
+
+    for i, row in source.rows:
+        n = len(row)
+        if n > out.shape[1] and source.columns is None:
+            reserve(out.shape[0], n)
+        n = min(n, out.shape[1])
+        if i >= out.shape[0]:
+            reserve(i + 1, out.shape[1])
+        if i > written and fill is not NO_VALUE:
+            out[written:i] = fill  # Empty rows skipped by the engine.
+        target = out[i]
+        try:
+            if n < out.shape[1]:
+                if fill is NO_VALUE:
+                    raise ValueError
+                target[n:] = fill
+            if store is object:
+                target[:n] = [fill if _is_empty(v) else v for v in row[:n]]
+            else:
+                target[:n] = row[:n]
+            if mask is not None:
+                mask[i, :n] = True
+        except (TypeError, ValueError, OverflowError):
+            for j in range(n):
+                value = row[j]
+                if _is_empty(value):
+                    if fill is not NO_VALUE:
+                        target[j] = fill
+                    continue
+                try:
+                    target[j] = value
+                except (TypeError, ValueError, OverflowError):
+                    raise ValueError(
+                        f"Cannot store {value!r} of row {i}, column {j} as {dtype}"
+                    ) from None
+                if mask is not None:
+                    mask[i, j] = True
+        written = length = i + 1
+    out = out[:length]
+    if mask is not None and not mask[:length].all():
+        raise ValueError(
+            f"The sheet has {int((~mask[:length]).sum())} missing cells, which cannot be stored as {dtype}. "
+            "Pass na_value to fill them."
+        )
+    if dtype.kind in "US":
+        return out.astype(dtype)
+    return out.copy() if source.capacity > length + length // 4 + 16 else out
@@ -2,12 +2,12 @@
 Base classes for read engines.
 """
 import io
-import os
 from abc import ABCMeta, abstractmethod
 from os.path import abspath, dirname, join
 from typing import Union
 
-from . import CellRange, Deprecated
+from . import Deprecated
+from .CellRange import CellRange
 
 CUR = dirname(abspath(__file__))
 TEMPDIR = join(CUR, "TempFiles")
@@ -83,7 +83,7 @@ class ReadSheet:
         """
         return list(self._translated[column])
 
-    def read_range(self, rng: CellRange.CellRange):
+    def read_range(self, rng: CellRange):
         """
         Retrieve all values from a specified range.
 
@@ -122,17 +122,19 @@ class ReadBook(metaclass=ABCMeta):
     :ivar __deprecated__: Information about deprecated features.
     :ivar _datas: A dictionary mapping sheet names to their data.
     :ivar _datas_list: A list of sheet data, indexed by sheet order in the workbook.
-    :ivar file_name: The path to the workbook file.
+    :ivar file_name: The path to the workbook file,
+                     or an in-memory stream when the workbook was given as bytes or a stream.
+                     `_parse()` must accept both.
     """
 
     __engine__ = ""
     __deprecated__ = Deprecated.DeprecatedInfo()
 
-    def __init__(self, file: Union[bytes, str, io.IOBase]):
+    def __init__(self, file: Union[bytes, bytearray, memoryview, str, io.IOBase]):
         """
         Initialize the ReadBook object with a file.
 
-        :param file: The file path as a string, a bytes object containing the file data,
+        :param file: The file path as a string, a bytes-like object containing the file data,
                      or an IO stream.
         """
         self._datas = {}
@@ -141,40 +143,30 @@ class ReadBook(metaclass=ABCMeta):
             self.file_name = file
             self._parse()
             self._indexing()
-        elif isinstance(file, bytes):
+        elif isinstance(file, (bytes, bytearray, memoryview)):
             self._dump_bytes(stream=file)
         else:
             self._dump_io(stream=file)
 
     def _dump_io(self, stream: io.IOBase):
         """
-        Reads data from an IO stream and writes it to a temporary file for parsing.
+        Reads data from an IO stream and parses it in memory.
 
         :param stream: An IO stream that contains the workbook data.
         """
         stream.seek(0)
-        data = stream.read()
-        path = join(TEMPDIR, "streaming_cache.tmp")
-        with open(path, "wb") as fp:
-            fp.write(data)
-        self.file_name = path
-        self._parse()
-        self._indexing()
-        os.remove(path)
+        self._dump_bytes(stream=stream.read())
 
-    def _dump_bytes(self, stream: bytes):
+    def _dump_bytes(self, stream: Union[bytes, bytearray, memoryview]):
         """
-        Writes byte stream data to a temporary file for parsing.
+        Parses byte stream data in memory.
+        Each reader gets its own buffer, so several of them can run concurrently.
 
-        :param stream: A bytes object that contains the workbook data.
+        :param stream: A bytes-like object that contains the workbook data.
         """
-        path = join(TEMPDIR, "streaming_cache.tmp")
-        with open(path, "wb") as fp:
-            fp.write(stream)
-        self.file_name = path
+        self.file_name = io.BytesIO(stream)
         self._parse()
         self._indexing()
-        os.remove(path)
 
     @abstractmethod
     def _parse(self):
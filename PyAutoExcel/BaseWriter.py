@@ -3,10 +3,10 @@ Base classes for write engines.
 """
 import io
 from abc import ABCMeta, abstractmethod
-from os.path import join
 from typing import Union
 
-from . import CellRange, Deprecated, Grid
+from . import Deprecated, Grid
+from .CellRange import CellRange
 
 
 class WriteSheet:
@@ -72,7 +72,7 @@ class WriteSheet:
             for i, v in enumerate(values):
                 self.write_cell(row=i, col=col, value=v)
 
-    def write_range(self, rng: CellRange.CellRange, content: list[list]):
+    def write_range(self, rng: CellRange, content: list[list]):
         """
         Write a 2D list of values to a range of cells in the sheet.
 
@@ -189,30 +189,25 @@ class WriteBook(metaclass=ABCMeta):
         return self.__sheet_names
 
     @abstractmethod
-    def save_file(self, file_name: str):
+    def save_file(self, file_name: Union[str, io.IOBase]):
         """
         Abstract method to save the workbook data to a file.
 
-        :param file_name: The name of the file to save the workbook data to.
+        :param file_name: The name of the file to save the workbook data to,
+                          or a binary stream when saving to memory or to an IO stream.
         """
         pass
 
     def save_virtual(self):
         """
-        Save the workbook data to a virtual file and return the data as bytes.
+        Save the workbook data to memory and return the data as bytes.
+        Each call writes to its own buffer, so several workbooks can be saved concurrently.
 
         :return: The workbook data as bytes.
         """
-        import os
-
-        from .ExcelTempFile import TEMPDIR
-
-        file_name = join(TEMPDIR, "excel.tmp")
-        self.save_file(file_name)
-        with open(file_name, mode="rb") as fp:
-            data = fp.read()
-        os.remove(file_name)
-        return data
+        stream = io.BytesIO()
+        self.save_file(stream)
+        return stream.getvalue()
 
     def save_io(self, file: io.IOBase):
         """
@@ -220,7 +215,7 @@ class WriteBook(metaclass=ABCMeta):
 
         :param file: The IO stream to save the workbook data to.
         """
-        file.write(self.save_virtual())
+        self.save_file(file)
 
     def save(self, saver: Union[None, str, io.BytesIO] = None):
         """
@@ -0,0 +1,497 @@
+"""
+Caches of parsed sheets, used by `ExcelReader` to skip parsing unchanged files.
+"""
+import hashlib
+import io
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, Union
+
+from .Documents.File.Excel.Sheet import Sheet
+from .Engines.ReaderBase import BaseReader
+
+# Changing the layout of the cached sheets must change this version.
+FORMAT_VERSION = 1
+MAGIC = b"PAXC"
+SUFFIX = ".pxc"
+CHUNK_SIZE = 1 << 20
+
+
+def cache_key(
+    file: Union[str, bytes, bytearray, memoryview, io.IOBase],
+    options: dict[str, Any],
+    digest_paths: bool = True,
+) -> Optional[str]:
+    """
+    Compute the key of a file read with the given options.
+
+    The key covers the content hash and the size of the file, its modification time
+    if it is a path, and the options which change the parsed sheets.
+    The position of a stream is left unchanged.
+
+    :param file: The path to the file, a seekable binary stream or the content of the file.
+    :param options: The options of the reader, e.g. the engine and the selected columns.
+    :param digest_paths: If False, a path is identified by its absolute path, size and
+                         modification time, without reading the file.
+    :return: The key, or None if the options cannot be part of a key (e.g. a callable filter).
+    """
+    parts = [f"v{FORMAT_VERSION}"]
+    for name in sorted(options):
+        value = options[name]
+        if callable(value) and not isinstance(value, type):
+            return None
+        if isinstance(value, type):
+            value = f"{value.__module__}.{value.__qualname__}"
+        parts.append(f"{name}={value!r}")
+    digest = hashlib.blake2b(digest_size=20)
+    if isinstance(file, str):
+        stat = os.stat(file)
+        parts.append(f"size={stat.st_size}")
+        parts.append(f"mtime={stat.st_mtime_ns}")
+        if digest_paths:
+            with open(file, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        else:
+            parts.append(f"path={os.path.abspath(file)}")
+    elif isinstance(file, (bytes, bytearray, memoryview)):
+        parts.append(f"size={len(file)}")
+        digest.update(file)
+    else:
+        pos = file.tell()
+        size = 0
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+        file.seek(pos)
+        parts.append(f"size={size}")
+    digest.update("\0".join(parts).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def dump_sheets(sheets: list[Sheet]) -> list[Union[bytes, memoryview]]:
+    """
+    Serialize sheets with pickle protocol 5, NumPy arrays are kept out of band.
+
+    :return: The chunks of the serialized form, to be written one after the other.
+    """
+    buffers = []
+    data = pickle.dumps(sheets, protocol=5, buffer_callback=buffers.append)
+    views = [b.raw() for b in buffers]
+    header = MAGIC + struct.pack("<II", FORMAT_VERSION, len(views))
+    header += struct.pack(f"<{len(views) + 1}Q", len(data), *(v.nbytes for v in views))
+    return [header, data, *views]
+
+
+def load_sheets(data: bytearray) -> list[Sheet]:
+    """
+    Deserialize sheets written by `dump_sheets()`.
+    NumPy arrays use the memory of ``data`` without copying it.
+
+    :raise ValueError: If the data is not a serialized list of sheets.
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("Not a cached workbook.")
+    version, count = struct.unpack_from("<II", data, 4)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported cache format {version}.")
+    sizes = struct.unpack_from(f"<{count + 1}Q", data, 12)
+    view = memoryview(data)
+    pos = 12 + 8 * (count + 1)
+    chunks = []
+    for size in sizes:
+        chunks.append(view[pos : pos + size])
+        pos += size
+    if pos != len(data):
+        raise ValueError("Truncated cached workbook.")
+    return pickle.loads(chunks[0], buffers=chunks[1:])
+
+
+class SheetCache(metaclass=ABCMeta):
+    """
+    Base class of the caches of parsed sheets.
+
+    Subclasses must implement `get()` and `put()`,
+    and may override `key()` to identify files differently.
+    """
+
+    def key(
+        self,
+        file: Union[str, bytes, bytearray, memoryview, io.IOBase],
+        options: dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Return the key of a file read with the given options, see `cache_key()`.
+        """
+        return cache_key(file, options)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[list[Sheet]]:
+        """
+        Return the sheets stored under a key, or None if there are none.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key: str, sheets: list[Sheet]):
+        """
+        Store the sheets of a file under a key.
+        """
+        pass
+
+    def __repr__(self):
+        return "%s.%s()" % (self.__class__.__module__, self.__class__.__qualname__)
+
+
+def default_cache_dir() -> str:
+    """
+    Return the default directory of `DiskCache`: $PYAUTOEXCEL_CACHE_DIR,
+    or PyAutoExcel in $XDG_CACHE_HOME (default to ~/.cache).
+    """
+    directory = os.environ.get("PYAUTOEXCEL_CACHE_DIR")
+    if directory:
+        return directory
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "PyAutoExcel")
+
+
+class DiskCache(SheetCache):
+    """
+    A persistent cache of parsed sheets, one file per entry in a directory.
+
+    Entries are written atomically, so several processes can share a directory.
+    The least recently used entries are removed when the total size
+    of the directory exceeds ``max_size``.
+
+    :param directory: The directory of the cache, see `default_cache_dir()`.
+    :type directory: Optional[str]
+    :param max_size: The maximum size of the cache in bytes. Default to 1 GiB.
+    :type max_size: int
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_size: int = 1 << 30):
+        self.directory = directory or default_cache_dir()
+        self.max_size = max_size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key: str) -> Optional[list[Sheet]]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                # A bytearray keeps the NumPy arrays of the sheets writable.
+                data = bytearray(os.fstat(f.fileno()).st_size)
+                f.readinto(data)
+            sheets = load_sheets(data)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # A damaged entry is a miss, it is replaced by the next put().
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)  # The modification time orders the entries for eviction.
+        except OSError:
+            pass
+        return sheets
+
+    def put(self, key: str, sheets: list[Sheet]):
+        chunks = dump_sheets(sheets)
+        size = sum(len(c) if isinstance(c, bytes) else c.nbytes for c in chunks)
+        if size > self.max_size:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            self._remove(tmp)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in ``max_size``.
+        """
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(SUFFIX):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except FileNotFoundError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """
+        Remove every entry of the cache.
+        """
+        try:
+            with os.scandir(self.directory) as it:
+                paths = [e.path for e in it if e.name.endswith(SUFFIX)]
+        except FileNotFoundError:
+            return
+        for path in paths:
+            self._remove(path)
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the entries, in bytes.
+        """
+        try:
+            with os.scandir(self.directory) as it:
+                return sum(e.stat().st_size for e in it if e.name.endswith(SUFFIX))
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(directory={self.directory!r}, max_size={self.max_size!r})"
+        )
+
+
+_default_disk_cache: Optional[DiskCache] = None
+
+
+def default_disk_cache() -> DiskCache:
+    """
+    Return the disk cache used by ``ExcelReader(cache=True)``.
+    """
+    global _default_disk_cache
+    if _default_disk_cache is None:
+        _default_disk_cache = DiskCache()
+    return _default_disk_cache
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Estimate the memory used by an object and all the objects it references,
+    each object being counted once. NumPy arrays count their buffer.
+    Classes, modules and functions are not followed.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, type):
+            continue
+        seen.add(id(o))
+        size += sys.getsizeof(o)
+        if hasattr(type(o), "nbytes") and hasattr(o, "dtype"):
+            if o.base is None:
+                size += o.nbytes
+            else:
+                stack.append(
+                    o.base
+                )  # A view, e.g. of a buffer loaded from a DiskCache.
+            if o.dtype.hasobject:
+                stack.extend(o.ravel().tolist())
+            continue
+        if isinstance(o, memoryview):
+            stack.append(o.obj)
+            continue
+        if (
+            isinstance(o, (str, bytes, bytearray, int, float, bool, complex))
+            or o is None
+        ):
+            continue
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif hasattr(o, "__dict__"):
+            stack.append(o.__dict__)
+        elif hasattr(o, "__slots__"):
+            stack.extend(getattr(o, s) for s in o.__slots__ if hasattr(o, s))
+    return size
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a `MemoryCache`.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+class MemoryCache(SheetCache):
+    """
+    A thread-safe cache of parsed sheets in the memory of the process.
+
+    Paths are identified by their absolute path, size and modification time,
+    so a hit costs a ``stat()``. Other files are identified by a hash of their content.
+    The size of each entry is measured with `deep_sizeof()`, and the least recently
+    used entries are removed when the total exceeds ``max_bytes``.
+
+    The sheets are copied when they are stored and when they are returned,
+    so modifying the sheets of a reader never changes the cache.
+
+    :param max_bytes: The memory budget of the cache in bytes. Default to 256 MiB.
+    :type max_bytes: int
+    """
+
+    def __init__(self, max_bytes: int = 256 << 20):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[list[Sheet], int]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = self._misses = self._evictions = 0
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        file: Union[str, bytes, bytearray, memoryview, io.IOBase],
+        options: dict[str, Any],
+    ) -> Optional[str]:
+        return cache_key(file, options, digest_paths=False)
+
+    def get(self, key: str) -> Optional[list[Sheet]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return [sheet.copy() for sheet in entry[0]]
+
+    def put(self, key: str, sheets: list[Sheet]):
+        sheets = [sheet.copy() for sheet in sheets]
+        size = deep_sizeof(sheets)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._entries[key] = (sheets, size)
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted
+                self._evictions += 1
+
+    def clear(self):
+        """
+        Remove every entry of the cache, the statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._nbytes,
+                self.max_bytes,
+            )
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory used by the cached sheets, in bytes.
+        """
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_bytes={self.max_bytes!r})"
+        )
+
+
+_default_memory_cache: Optional[MemoryCache] = None
+_default_lock = threading.Lock()
+
+
+def default_memory_cache() -> MemoryCache:
+    """
+    Return the memory cache of the process, used by ``ExcelReader(cache="memory")``.
+    """
+    global _default_memory_cache
+    with _default_lock:
+        if _default_memory_cache is None:
+            _default_memory_cache = MemoryCache()
+        return _default_memory_cache
+
+
+def get_cache(cache: Union[bool, str, SheetCache]) -> SheetCache:
+    """
+    Return the cache designated by the ``cache`` argument of `ExcelReader`:
+    True or 'disk' for the default disk cache, 'memory' for the memory cache of the process,
+    or a cache.
+
+    :raise ValueError: If the name of the cache is unknown.
+    """
+    if cache is True or cache == "disk":
+        return default_disk_cache()
+    if cache == "memory":
+        return default_memory_cache()
+    if isinstance(cache, SheetCache):
+        return cache
+    raise ValueError(f"Unknown cache {cache!r}.")
+
+
+class CachedReader(BaseReader):
+    """
+    A reader serving sheets taken from a cache, instead of parsing a file.
+
+    :param file: The cached sheets.
+    """
+
+    __engine__ = "cache"
+
+    def _setup(self):
+        pass
+
+    def _parse(self):
+        for sheet in self._file:
+            self._sheets.append(sheet)
+            self._sheet_names.append(sheet.name)
@@ -6,9 +6,7 @@ Additionally, implement a method to convert the cell coordinates to a tuple form
 """
 from typing import Optional, Union
 
-from openpyxl.utils.cell import coordinate_to_tuple
-
-from .Utils import pos2string
+from .Utils import coordinate_to_tuple, pos2string
 
 
 class Cell:
@@ -3,10 +3,8 @@ A class representing a range of cells in an Excel-style spreadsheet.
 """
 from typing import Optional, Union
 
-from openpyxl.utils.cell import coordinate_to_tuple
-
 from .Cell import Cell
-from .Utils import pos2string
+from .Utils import coordinate_to_tuple, pos2string
 
 
 class CellRange:
@@ -4,15 +4,25 @@ Deprecated class for information on abandoned functions.
 import functools
 import types
 
-from colorama import Fore
-
 from .Utils import init_colorama
 
-init_colorama()
-
 WARNINFO = "engine '%s' is deprecated and will be removed in %s, use %s instead."
 
 
+def warning_color() -> str:
+    """
+    Return the color code of warnings.
+    colorama is imported and initialized when the first warning is printed.
+
+    :return: The ANSI color code.
+    :rtype: str
+    """
+    from colorama import Fore
+
+    init_colorama()
+    return Fore.YELLOW
+
+
 class DeprecatedInfo:
     """
     A class to represent deprecated information for an engine.
@@ -43,7 +53,7 @@ class DeprecatedInfo:
         :type engine: str
         """
         msg = WARNINFO % (engine, self.remove_version, self.instead)
-        print("%sWarning: %s" % (Fore.YELLOW, msg))
+        print("%sWarning: %s" % (warning_color(), msg))
 
 
 class DeprecationMessages:
@@ -97,7 +107,7 @@ def func_deprecated(message: str, warn_id: int):
             else:
                 func.__refcount__ += 1
             if func.__refcount__ == 1:
-                print(f"{Fore.YELLOW}Warning ({hex(warn_id)}): {message}")
+                print(f"{warning_color()}Warning ({hex(warn_id)}): {message}")
             return func(*args, **kwargs)
 
         return wrapped
@@ -122,7 +132,7 @@ class DeprecatedMeta(type):
             class_deprecated_refcount[cls] += 1
         if class_deprecated_refcount[cls] == 1:
             print(
-                f"{Fore.YELLOW}Warning "
+                f"{warning_color()}Warning "
                 f"({hex(class_deprecated_message[cls][1])}): "
                 f"{class_deprecated_message[cls][0]}"
             )
@@ -2,7 +2,9 @@
 The Document class represents an Excel file and provides methods to read and write its content.
 """
 import io
-from typing import Union
+from typing import Callable, Iterable, Optional, Type, Union
+
+from PyAutoExcel.Grid import SheetGrid
 
 from .Reader.Excel import ExcelReader
 from .Sheet import Sheet
@@ -12,12 +14,22 @@ from .Writer.Excel import ExcelWriter
 class Document:
     def __init__(self):
         self._sheets = []
+        self._reader = None  # Reader of a lazily loaded document.
 
     def load(
         self,
         file: Union[str, io.BytesIO, bytes],
         engine: str = "",
         fmt: str = "",
+        lazy: bool = False,
+        workers: int = 0,
+        grid_class: Optional[Type[SheetGrid]] = None,
+        usecols: Union[str, int, Iterable[Union[str, int]], None] = None,
+        header_row: Optional[int] = None,
+        skiprows: int = 0,
+        nrows: Optional[int] = None,
+        where: Union[str, Callable[[list], bool], None] = None,
+        cache: Union[bool, str, "SheetCache", None] = None,
     ):
         """
         Loads an Excel document from a file.
@@ -28,9 +40,59 @@ class Document:
         :type engine: str
         :param fmt: The format of the file. Default, it's auto-detected.
         :type fmt: str
+        :param lazy: If True, each sheet is only parsed when it is first accessed.
+                     The file stays open until every sheet is parsed, so a lazy document
+                     must be closed with `close()`, or used in a ``with`` statement.
+        :type lazy: bool
+        :param workers: If greater than 1, the sheets are parsed in parallel
+                        by up to this number of processes. Ignored in lazy mode.
+        :type workers: int
+        :param grid_class: The grid class used to store the cells of the sheets. Default to DenseGrid.
+        :type grid_class: Optional[Type[SheetGrid]]
+        :param usecols: The columns to read, as column indexes, letters ('A', 'C:F') or header names.
+                        Default to all columns.
+        :type usecols: Union[str, int, Iterable[Union[str, int]], None]
+        :param header_row: The index of the header row, the rows above it are skipped.
+                           Default to no header row.
+        :type header_row: Optional[int]
+        :param skiprows: The number of rows skipped at the top of each sheet, or below the header row.
+        :type skiprows: int
+        :param nrows: The maximum number of rows read after the skipped rows. Default to all rows.
+        :type nrows: Optional[int]
+        :param where: A row filter, as a callable or an expression. Only the accepted rows are stored.
+        :type where: Union[str, Callable[[list], bool], None]
+        :param cache: A cache of parsed sheets, True or 'disk' for the default disk cache,
+                      'memory' for the memory cache of the process. Ignored in lazy mode.
+        :type cache: Union[bool, str, SheetCache, None]
+        """
+        reader = ExcelReader(
+            file,
+            engine,
+            fmt,
+            lazy=lazy,
+            workers=workers,
+            grid_class=grid_class,
+            usecols=usecols,
+            header_row=header_row,
+            skiprows=skiprows,
+            nrows=nrows,
+            where=where,
+            cache=cache,
+        )
+        if lazy:
+            self._reader = reader
+        else:
+            self._reader = None
+            self._sheets = reader.sheets().copy()
+
+    def _materialize(self):
+        """
+        Parse the remaining sheets of a lazily loaded document.
         """
-        reader = ExcelReader(file, engine, fmt)
-        self._sheets = reader.sheets().copy()
+        if self._reader is not None:
+            self._sheets = self._reader.sheets().copy()
+            self._reader.close()
+            self._reader = None
 
     def save(
         self,
@@ -51,7 +113,7 @@ class Document:
                  Otherwise, return None.
         """
         writer = ExcelWriter(engine, fmt)
-        for s in self._sheets:
+        for s in self.sheets:
             writer.add_sheet(s)
         return writer.save(saver)
 
@@ -65,11 +127,26 @@ class Document:
         :param index: Index at which to add the sheet (default is -1).
         :type index: int
         """
+        self._materialize()
         if index == -1:
             self._sheets.append(s)
         else:
             self._sheets.insert(index, s)
 
+    def close(self):
+        """
+        Release the file of a lazily loaded document, it is safe to call this method more than once.
+        The sheets already accessed stay available, the other sheets can no longer be parsed.
+        """
+        if self._reader is not None:
+            self._reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def __repr__(self):
         return f"{self.__class__.__module__}.{self.__class__.__qualname__}()"
 
@@ -80,6 +157,7 @@ class Document:
 
         :return: A list of Sheet objects.
         """
+        self._materialize()
         return self._sheets
 
     @property
@@ -89,6 +167,8 @@ class Document:
 
         :return: The number of sheets in the workbook.
         """
+        if self._reader is not None:
+            return self._reader.nsheets()
         return len(self._sheets)
 
     def sheet_by_name(self, name: str):
@@ -99,6 +179,8 @@ class Document:
         :return: A Sheet object corresponding to the sheet with the given name.
         :raise KeyError: If no sheet with the given name exists.
         """
+        if self._reader is not None:
+            return self._reader.sheet_by_name(name)
         if name not in [sheet.name for sheet in self._sheets]:
             raise KeyError(f"No sheet named '{name}'.")
         return [sheet for sheet in self._sheets if sheet.name == name][0]
@@ -111,6 +193,8 @@ class Document:
         :return: A Sheet object corresponding to the sheet at the given index.
         :raise OverflowError: If the index is out of range.
         """
-        if idx < 0 or idx >= len(self._sheets):
+        if idx < 0 or idx >= self.nsheets:
             raise OverflowError(f"Sheet index out of range: {idx}")
+        if self._reader is not None:
+            return self._reader.sheet_by_index(idx)
         return self._sheets[idx]
@@ -1,16 +1,47 @@
+import contextlib
+import functools
 import io
-from typing import Type, Union
-
-import proglog
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    Union,
+)
 
 from PyAutoExcel.Engines.ReaderBase import BaseReader
+from PyAutoExcel.Arrays import NO_VALUE
+from PyAutoExcel.Grid import SheetGrid
 from PyAutoExcel.Deprecated import process_deprecated as _process_deprecated
+from PyAutoExcel.Tracing import PhaseEvent, file_size, tracing
 
 from ..Register import Register
 from ..Sheet import Sheet
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import numpy as np
+    import pandas as pd
+    from numpy.typing import DTypeLike
+
+    from PyAutoExcel.Cache import SheetCache
+
 readers = Register()
 
+# The built-in engines, imported when they are first used.
+BUILTIN_READERS = {
+    "openpyxl": "PyAutoExcel.Engines.Readers:OpenpyxlReader",
+    "native": "PyAutoExcel.Engines.Readers:NativeReader",
+    "xlrd": "PyAutoExcel.Engines.Readers:XlrdReader",
+    "python-xlsxio": "PyAutoExcel.Engines.Readers:XlsxioReader",
+    "sxl": "PyAutoExcel.Engines.Readers:SxlReader",
+}
+
 
 def add_reader(engine: Type[BaseReader]):
     """
@@ -37,64 +68,405 @@ def remove_reader(name: str):
 
 def install_builtin_readers():
     """
-    Registers all built-in reader engines found in the Readers module.
-    This function searches for subclasses of ReadBook in the Readers module
-         and registers them using their ``__engine__`` attribute.
+    Registers all built-in reader engines of the Readers module.
+    The engines are registered lazily, the Readers module and the library
+         of an engine are only imported when the engine is first used.
     """
     global readers
-    from .....Engines import Readers
-
-    readers.add_from_module(
-        module=Readers,
-        sub_class_filters=[BaseReader],
-        field_name="__engine__",
-    )
+    for name, path in BUILTIN_READERS.items():
+        readers.add(engine_name=name, engine=path)
 
 
-def auto_engine(fmt: str):
+def auto_engine(
+    fmt: str,
+    size: Optional[int] = None,
+    streaming: bool = False,
+    features: Iterable[str] = (),
+):
     """
     Determines the appropriate engine to use based on the file format.
 
+    The installed engines handling the format are ranked by the calibration profile
+    of the machine for the size of the file (see `PyAutoExcel.EngineSelector`),
+    or tried in a fixed order ('xlrd' for 'xls' files, 'native' for 'xlsx' and 'xlsm' files)
+    if there is no profile. Other formats are read by 'openpyxl'.
+
     :param fmt: The format of the file (e.g., 'xls', 'xlsx').
-    :return: The name of the engine to use ('xlrd' for 'xls' files, 'openpyxl' for 'xlsx' files).
+    :param size: The size of the file in bytes, if known.
+    :param streaming: If True, the engine must stream the rows (lazy reading).
+    :param features: The other required features, e.g. ['formatting'].
+    :return: The name of the engine to use.
+    """
+    from PyAutoExcel.EngineSelector import select_reader
+
+    engine = select_reader(fmt, size, streaming, features)
+    if engine is not None:
+        return engine
+    if fmt == "xls":
+        return "xlrd"
+    if fmt in ("xlsx", "xlsm"):
+        return "native"
+    return "openpyxl"
+
+
+def guess_format(file: Union[bytes, bytearray, memoryview, io.IOBase]) -> str:
     """
-    return "xlrd" if fmt == "xls" else "openpyxl"
+    Guesses the format of an in-memory file from its signature.
+    The position of a stream is left unchanged.
+
+    :param file: The content of the file, or a seekable binary stream.
+    :return: 'xlsx' for a zip package, 'xls' for a compound document, or '' if unknown.
+    """
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        head = bytes(file[:8])
+    else:
+        pos = file.tell()
+        head = file.read(8)
+        file.seek(pos)
+    if head.startswith(b"PK\x03\x04"):
+        return "xlsx"
+    if head == b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1":
+        return "xls"
+    return ""
+
+
+def _describe(file) -> str:
+    # Never format the content of an in-memory file, it may be large.
+    return repr(file) if isinstance(file, str) else f"<{type(file).__name__}>"
+
+
+def _select_engine(file, engine: str, fmt: str, streaming: bool = False) -> str:
+    """
+    Returns the given engine, or the engine for the format and the size of the file.
+    """
+    if engine:
+        return engine
+    if not fmt:
+        if isinstance(file, str):
+            fmt = file.split(".")[-1].lower()
+        else:
+            fmt = guess_format(file)
+    return auto_engine(fmt, file_size(file), streaming)
+
+
+def _read_file(
+    engine: Type[BaseReader],
+    file,
+    grid_class: Optional[Type[SheetGrid]] = None,
+    **options,
+) -> list[Sheet]:
+    """
+    Parse all the sheets of a file, in a worker process of `ExcelReader.read_many()`
+    or `ExcelReader.open_async()`.
+
+    :param options: The other keyword arguments of the engine, e.g. usecols.
+    """
+    return engine(file, grid_class=grid_class, **options).sheets
+
+
+def _next_rows(rows: Iterator[list], size: int) -> list[list]:
+    """
+    Take the next rows of an iterator, at most ``size`` of them.
+    """
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            break
+    return chunk
+
+
+def _is_process_executor(executor: Optional["Executor"]) -> bool:
+    """
+    Return True if an executor runs its calls in other processes.
+    concurrent.futures is only imported when an executor is given, it is slow to import.
+    """
+    if executor is None:
+        return False
+    from concurrent.futures import ProcessPoolExecutor
+
+    return isinstance(executor, ProcessPoolExecutor)
+
+
+class ReadResult:
+    """
+    The outcome of reading one file with `ExcelReader.read_many()`.
+
+    :ivar file: The file, as it was given.
+    :ivar index: The position of the file in the input.
+    :ivar document: The document read from the file, or None if reading it failed.
+    :ivar error: The exception raised while reading the file, or None.
+    """
+
+    def __init__(
+        self, file, index: int, document=None, error: Optional[BaseException] = None
+    ):
+        self.file = file
+        self.index = index
+        self.document = document
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns True if the file was read successfully.
+        """
+        return self.error is None
+
+    def __repr__(self):
+        state = "ok" if self.ok else f"error={self.error!r}"
+        return f"{self.__class__.__module__}.{self.__class__.__qualname__}(file={_describe(self.file)}, {state})"
 
 
 class ExcelReader:
     """
     A class for reading Excel files, supporting multiple engines and formats.
 
-    :param file: The path to the file or a file-like object.
+    :param file: The path to the file, a file-like object or the content of the file.
+           In-memory files are passed to the engine as they are, never written to disk.
     :param engine: The name of the engine to use for reading.
            If not specified, it is auto-detected based on the file format.
     :param fmt: The format of the file (e.g., 'xls', 'xlsx').
-           If not specified, it is inferred from the file name.
+           If not specified, it is inferred from the file name,
+           or from the signature of an in-memory file.
+    :param lazy: If True, no sheet is parsed when the file is opened.
+           Sheets are parsed on first access, and `iter_rows()` streams rows
+           straight from the engine without storing them.
+    :param workers: If greater than 1, the sheets are parsed in parallel
+           by up to this number of processes. Ignored in lazy mode.
+    :param grid_class: The grid class used to store the cells of the sheets,
+           e.g. ColumnarGrid for numeric sheets. Default to DenseGrid.
+    :param usecols: The columns to read, e.g. 'A,C:F', [0, 2, 5] or header names such as ['ID', 'Name'].
+           Header names are looked up in the header row of each sheet, a name missing
+           from a sheet selects no column of it. A ValueError is raised once every sheet
+           is read if a name is in none of them. In a list, 1 to 3 uppercase letters
+           which are not a header name are column letters.
+           The other columns are skipped by the engine while parsing. Default to all columns.
+    :param header_row: The index of the header row. The rows above it are skipped,
+           and it is kept as the first row of each sheet. Default to no header row,
+           header names are then looked up in the first row.
+    :param skiprows: The number of rows skipped at the top of each sheet, or below the header row.
+    :param nrows: The maximum number of rows read after the skipped rows, not counting the header row.
+           The engine stops parsing a sheet as soon as they are read. Default to all rows.
+    :param where: A row filter evaluated while parsing, only the accepted rows are stored.
+           Either a callable receiving the values of a row (restricted to `usecols`)
+           as a `PaddedRow`, whose cells past the end of the row read as None,
+           or an expression such as "Account == 'ACME' and B > 100" (see `RowFilter`).
+           It applies to the rows of the window, and the header row is always kept.
+           A sheet without a header name of the expression has no other rows.
+           With `workers`, a callable must be picklable.
+    :param cache: A cache of parsed sheets: a `DiskCache` or a `MemoryCache`,
+           True or 'disk' for the default disk cache, 'memory' for the memory cache of the process.
+           The sheets of a file are taken from the cache if the file and the options are unchanged,
+           and stored in it after parsing otherwise. Ignored in lazy mode, and with a callable filter.
+    :param tracer: A callable receiving a `PhaseEvent` for each phase of the engine run while the file is opened.
+           Use `PyAutoExcel.Tracing.tracing()` to also trace the sheets parsed later in lazy mode.
     """
 
     _engine: BaseReader
 
     def __init__(
         self,
-        file: Union[str, io.BytesIO, bytes],
+        file: Union[str, io.BytesIO, bytes, bytearray, memoryview],
         engine: str = "",
         fmt: str = "",
+        lazy: bool = False,
+        workers: int = 0,
+        grid_class: Optional[Type[SheetGrid]] = None,
+        usecols: Union[str, int, Iterable[Union[str, int]], None] = None,
+        header_row: Optional[int] = None,
+        skiprows: int = 0,
+        nrows: Optional[int] = None,
+        where: Union[str, Callable[[list], bool], None] = None,
+        cache: Union[bool, str, "SheetCache", None] = None,
+        tracer: Optional[Callable[[PhaseEvent], None]] = None,
     ):
-        self._params = f"(file={file!r}, engine={engine!r}, fmt={fmt!r})"
-        if not engine:
-            if fmt:
-                engine = auto_engine(fmt)
+        self._params = f"(file={_describe(file)}, engine={engine!r}, fmt={fmt!r}, lazy={lazy!r}, workers={workers!r})"
+        with tracing(tracer) if tracer is not None else contextlib.nullcontext():
+            engine = _select_engine(file, engine, fmt, lazy or workers > 1)
+            import proglog
+
+            logger = proglog.default_bar_logger("bar")
+            logger(
+                message=f"PyAutoExcel - Reading {file if isinstance(file, str) else _describe(file)}."
+            )
+            parallel = workers > 1 and not lazy
+            options = {
+                "grid_class": grid_class,
+                "usecols": usecols,
+                "header_row": header_row,
+                "skiprows": skiprows,
+                "nrows": nrows,
+                "where": where,
+            }
+            key = None
+            if cache is not None and cache is not False and not lazy:
+                from PyAutoExcel.Cache import CachedReader, get_cache
+
+                cache = get_cache(cache)
+                key = cache.key(file, dict(options, engine=engine))
+                sheets = None if key is None else cache.get(key)
+                if sheets is not None:
+                    self._engine = CachedReader(sheets)
+                    logger(message="PyAutoExcel - Done (cached).")
+                    return
+            self._engine = readers.get(engine)(file, lazy=lazy or parallel, **options)
+            if parallel:
+                self._engine.load_parallel(workers)
+                self._engine.close()
+            if key is not None:
+                cache.put(key, self._engine.sheets)
+            _process_deprecated(self._engine.__deprecated__, engine)
+            logger(message="PyAutoExcel - Done.")
+
+    @classmethod
+    async def open_async(
+        cls,
+        file: Union[str, io.BytesIO, bytes, bytearray, memoryview],
+        engine: str = "",
+        fmt: str = "",
+        executor: Optional["Executor"] = None,
+        **kwargs,
+    ) -> "ExcelReader":
+        """
+        Opens a file without blocking the event loop, the engine runs in an executor.
+
+        Example::
+
+            reader = await ExcelReader.open_async("data.xlsx", lazy=True)
+            async for row in reader.aiter_rows(0):
+                ...
+
+        With a ProcessPoolExecutor, the sheets are parsed in a worker process
+        and sent back, so `lazy`, `workers` and `cache` are not supported
+        and a callable filter must be picklable. With a thread executor,
+        the tracer of the context (see `PyAutoExcel.Tracing`) is kept.
+
+        :param file: The file to read, as accepted by `ExcelReader`.
+        :param engine: The name of the engine to use for reading.
+        :type engine: str
+        :param fmt: The format of the file.
+        :type fmt: str
+        :param executor: The executor running the engine. Default to the executor of the event loop.
+        :type executor: Optional[Executor]
+        :param kwargs: The other arguments of `ExcelReader`.
+        :return: The reader.
+        :rtype: ExcelReader
+        :raise ValueError: If an option is not supported by a process executor.
+        """
+        import asyncio
+        import contextvars
+
+        loop = asyncio.get_running_loop()
+        if not _is_process_executor(executor):
+            return await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    contextvars.copy_context().run, cls, file, engine, fmt, **kwargs
+                ),
+            )
+        kwargs.pop("tracer", None)  # Not called in the worker process.
+        for name in ("lazy", "workers", "cache"):
+            if kwargs.get(name):
+                raise ValueError(f"{name} is not supported with a process executor.")
+            kwargs.pop(name, None)
+        if not isinstance(file, (str, bytes, bytearray, memoryview)):
+            file = file.read()  # Streams cannot be sent to another process.
+        engine = _select_engine(file, engine, fmt)
+        sheets = await loop.run_in_executor(
+            executor, functools.partial(_read_file, readers.get(engine), file, **kwargs)
+        )
+        from PyAutoExcel.Cache import CachedReader
+
+        reader = cls.__new__(cls)
+        reader._params = f"(file={_describe(file)}, engine={engine!r}, fmt={fmt!r})"
+        reader._engine = CachedReader(sheets)
+        return reader
+
+    @classmethod
+    def read_many(
+        cls,
+        paths: Iterable[Union[str, bytes]],
+        workers: Optional[int] = None,
+        engine: str = "",
+        ordered: bool = True,
+        fmt: str = "",
+        grid_class: Optional[Type[SheetGrid]] = None,
+    ) -> Iterator[ReadResult]:
+        """
+        Reads many files in a pool of processes, and yields the results as they are ready.
+        A file which cannot be read gives a result with an error, the other files are still read.
+
+        :param paths: The paths, or the contents, of the files.
+        :type paths: Iterable[Union[str, bytes]]
+        :param workers: The maximum number of processes, defaults to the number of CPUs.
+                        If it is 1, the files are read one by one in the current process.
+        :type workers: Optional[int]
+        :param engine: The name of the engine to use for every file.
+                       If not specified, it is auto-detected for each file.
+        :type engine: str
+        :param ordered: If True, the results are yielded in the order of the files.
+                        Otherwise, each result is yielded as soon as its file is read.
+        :type ordered: bool
+        :param fmt: The format of every file. If not specified, it is inferred for each file.
+        :type fmt: str
+        :param grid_class: The grid class used to store the cells of the sheets. Default to DenseGrid.
+        :type grid_class: Optional[Type[SheetGrid]]
+        :return: A generator of ReadResult, whose document is an ExcelDocument.
+        :rtype: Iterator[ReadResult]
+        """
+        from ..ExcelDocument import Document
+
+        files = list(paths)
+        # The engine class of each file, or the error raised while selecting it.
+        engines = []
+        for file in files:
+            try:
+                engines.append(readers.get(_select_engine(file, engine, fmt)))
+            except Exception as e:
+                engines.append(e)
+
+        def finish(index: int, future=None) -> ReadResult:
+            try:
+                if isinstance(engines[index], Exception):
+                    raise engines[index]
+                if future is None:
+                    sheets = _read_file(engines[index], files[index], grid_class)
+                else:
+                    sheets = future.result()
+            except Exception as e:
+                return ReadResult(files[index], index, error=e)
+            document = Document()
+            for s in sheets:
+                document.add_sheet(s)
+            return ReadResult(files[index], index, document)
+
+        if workers == 1:
+            for index in range(len(files)):
+                yield finish(index)
+            return
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                index: executor.submit(_read_file, engines[index], file, grid_class)
+                for index, file in enumerate(files)
+                if not isinstance(engines[index], Exception)
+            }
+            if ordered:
+                for index in range(len(files)):
+                    yield finish(index, futures.get(index))
             else:
-                if isinstance(file, str):
-                    fmt = file.split(".")[-1].lower()
-                    engine = auto_engine(fmt)
-        logger = proglog.default_bar_logger("bar")
-        logger(message=f"PyAutoExcel - Reading {file}.")
-        self._engine = readers.get(engine)(file)
-        _process_deprecated(self._engine.__deprecated__, engine)
-        self._sheets = self._engine.sheets
-        self._sheet_names = self._engine.sheet_names
-        logger(message="PyAutoExcel - Done.")
+                for index in range(len(files)):
+                    if index not in futures:
+                        yield finish(index)
+                indexes = {future: index for index, future in futures.items()}
+                for future in as_completed(indexes):
+                    yield finish(indexes[future], future)
+        finally:
+            # Files left unread when the caller stops early are cancelled.
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def sheet_by_index(self, idx: int) -> Sheet:
         """
@@ -107,7 +479,7 @@ class ExcelReader:
         """
         if idx < 0 or idx >= self.nsheets():
             raise IndexError(f"Sheet index out of range: {idx}")
-        return self._sheets[idx]
+        return self._engine.sheet_by_index(idx)
 
     def sheet_by_name(self, name: str) -> Sheet:
         """
@@ -118,9 +490,9 @@ class ExcelReader:
         :rtype: Sheet
         :raise KeyError: If no sheet with the given name exists.
         """
-        if name not in self._sheet_names:
+        if name not in self.sheet_names():
             raise KeyError(f"No sheet named '{name}'.")
-        return self._sheets[self._sheet_names.index(name)]
+        return self._engine.sheet_by_name(name)
 
     def sheets(self):
         """
@@ -129,7 +501,7 @@ class ExcelReader:
         :return: A list of Sheet objects.
         :rtype: list[Sheet]
         """
-        return self._sheets
+        return self._engine.sheets
 
     def nsheets(self):
         """
@@ -138,7 +510,7 @@ class ExcelReader:
         :return: The number of sheets.
         :rtype: int
         """
-        return len(self._sheets)
+        return self._engine.nsheets
 
     def sheet_names(self):
         """
@@ -147,7 +519,189 @@ class ExcelReader:
         :return: A list of sheet names.
         :rtype: list[str]
         """
-        return self._sheet_names
+        return self._engine.sheet_names
+
+    def iter_rows(self, sheet: Union[int, str] = 0) -> Iterator[list]:
+        """
+        Iterate over the rows of a sheet, from top to bottom.
+
+        In lazy mode, the rows are read from the engine as they are consumed
+        and are never stored, so memory stays flat whatever the size of the sheet.
+
+        :param sheet: The index or the name of the sheet. Default to the first sheet.
+        :type sheet: Union[int, str]
+        :return: A generator of rows, each row is a list of values.
+        :raise IndexError: If the index is out of range.
+        :raise KeyError: If no sheet with the given name exists.
+        """
+        return self._engine.iter_rows(self._sheet_index(sheet))
+
+    def _sheet_index(self, sheet: Union[int, str]) -> int:
+        """
+        Return the index of a sheet given by index or by name.
+        """
+        if isinstance(sheet, str):
+            if sheet not in self.sheet_names():
+                raise KeyError(f"No sheet named '{sheet}'.")
+            return self.sheet_names().index(sheet)
+        if sheet < 0 or sheet >= self.nsheets():
+            raise IndexError(f"Sheet index out of range: {sheet}")
+        return sheet
+
+    def to_arrays(
+        self,
+        sheet: Union[int, str] = 0,
+        dtype: Union[None, "DTypeLike", dict[Union[str, int], "DTypeLike"]] = None,
+        na_value: Any = NO_VALUE,
+    ) -> dict[str, "np.ndarray"]:
+        """
+        Read a sheet as one NumPy array per column.
+
+        In lazy mode, the values go from the engine straight into arrays reserved
+        from the dimension of the sheet, without building the rows of a Sheet.
+        The columns and rows are selected by the options of the reader
+        (usecols, header_row, skiprows, nrows, where).
+
+        Example::
+
+            with ExcelReader("data.xlsx", lazy=True, header_row=0, usecols=["Date", "Amount"]) as reader:
+                columns = reader.to_arrays(dtype={"Amount": "float64"})
+
+        :param sheet: The index or the name of the sheet. Default to the first sheet.
+        :type sheet: Union[int, str]
+        :param dtype: The dtype of every column, or a dict of column name (or position) to dtype.
+                      The other columns get int64, float64, bool, datetime64[us] or object
+                      from their values.
+        :param na_value: The value of the missing cells. Default to NaN, NaT or None depending on the dtype,
+                         it is required for integer and boolean columns with missing cells.
+        :return: A dict of column name to array. Columns are named after the header row
+                 if `header_row` is set, after their letters otherwise.
+        :rtype: dict[str, numpy.ndarray]
+        :raise ValueError: If a value cannot be stored with the dtype of its column.
+        """
+        from PyAutoExcel.Arrays import read_arrays
+
+        return read_arrays(self._engine, self._sheet_index(sheet), dtype, na_value)
+
+    def read_frame(
+        self,
+        sheet: Union[int, str] = 0,
+        dtype: Union[None, "DTypeLike", dict[Union[str, int], "DTypeLike"]] = None,
+        na_value: Any = NO_VALUE,
+    ) -> "pd.DataFrame":
+        """
+        Read a sheet as a pandas DataFrame.
+
+        The columns are filled as in `to_arrays()` and become the columns of the DataFrame
+        without being copied. In lazy mode, no Sheet and no list of rows is built.
+
+        Example::
+
+            with ExcelReader("data.xlsx", lazy=True, header_row=0) as reader:
+                df = reader.read_frame(dtype={"Amount": "float64"})
+
+        :param sheet: The index or the name of the sheet. Default to the first sheet.
+        :type sheet: Union[int, str]
+        :param dtype: The dtype of every column, or a dict of column name (or position) to dtype.
+        :param na_value: The value of the missing cells, see `to_arrays()`.
+        :return: The DataFrame. Columns are named after the header row if `header_row` is set,
+                 after their letters otherwise.
+        :rtype: pd.DataFrame
+        :raise ValueError: If a value cannot be stored with the dtype of its column.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.to_arrays(sheet, dtype, na_value), copy=False)
+
+    def to_numpy(
+        self,
+        sheet: Union[int, str] = 0,
+        dtype: Optional["DTypeLike"] = None,
+        structured: bool = False,
+        na_value: Any = NO_VALUE,
+    ) -> "np.ndarray":
+        """
+        Read a sheet as a 2-D NumPy array, or as a structured array with one field per column.
+
+        With a plain dtype, each row is converted into a 2-D array reserved from the dimension
+        of the sheet. Without dtype, the columns are read as in `to_arrays()`
+        and stacked with their common dtype.
+
+        :param sheet: The index or the name of the sheet. Default to the first sheet.
+        :type sheet: Union[int, str]
+        :param dtype: The dtype of the array. A structured dtype gives a structured array,
+                      its fields are matched to the columns in order.
+        :param structured: If True, return a structured array whose fields are named after the columns.
+        :type structured: bool
+        :param na_value: The value of the missing cells, see `to_arrays()`.
+        :return: The array.
+        :rtype: numpy.ndarray
+        :raise ValueError: If a value cannot be stored with the dtype.
+        """
+        from PyAutoExcel.Arrays import read_numpy
+
+        return read_numpy(
+            self._engine, self._sheet_index(sheet), dtype, structured, na_value
+        )
+
+    async def aiter_rows(
+        self,
+        sheet: Union[int, str] = 0,
+        chunk_size: int = 1000,
+        executor: Optional["Executor"] = None,
+    ) -> AsyncIterator[list]:
+        """
+        Iterate over the rows of a sheet without blocking the event loop.
+
+        Rows are taken ``chunk_size`` at a time. In lazy mode, each chunk is parsed
+        in the executor, otherwise the rows are already in memory and control is
+        given back to the event loop between chunks.
+
+        :param sheet: The index or the name of the sheet. Default to the first sheet.
+        :type sheet: Union[int, str]
+        :param chunk_size: The number of rows taken at a time.
+        :type chunk_size: int
+        :param executor: The executor parsing the rows in lazy mode, it must run threads.
+                         Default to the executor of the event loop.
+        :type executor: Optional[Executor]
+        :return: An asynchronous generator of rows.
+        :raise ValueError: If the executor is a ProcessPoolExecutor.
+        """
+        import asyncio
+        import contextvars
+
+        if _is_process_executor(executor):
+            raise ValueError("Rows cannot be streamed from a process executor.")
+        loop = asyncio.get_running_loop()
+        rows = self.iter_rows(sheet)
+        try:
+            while True:
+                if self._engine._lazy:
+                    chunk = await loop.run_in_executor(
+                        executor,
+                        contextvars.copy_context().run,
+                        _next_rows,
+                        rows,
+                        chunk_size,
+                    )
+                else:
+                    chunk = _next_rows(rows, chunk_size)
+                    await asyncio.sleep(0)
+                for row in chunk:
+                    yield row
+                if len(chunk) < chunk_size:
+                    return
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+    def close(self):
+        """
+        Release the file held by the engine.
+        Only needed in lazy mode, the file is closed after parsing otherwise.
+        """
+        self._engine.close()
 
     def __repr__(self):
         return (
@@ -158,4 +712,4 @@ class ExcelReader:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+        self.close()
@@ -0,0 +1,231 @@
+"""
+Read the metadata of a workbook without parsing its cells.
+"""
+import io
+import struct
+from typing import Optional, Union
+
+from PyAutoExcel.CellRange import CellRange
+
+from .Excel import guess_format
+
+# States of the sheets, indexed by the visibility of a BOUNDSHEET record.
+XLS_STATES = ("visible", "hidden", "veryHidden")
+
+
+class SheetInfo:
+    """
+    The metadata of a sheet, returned by `scan()`.
+
+    :ivar name: The name of the sheet.
+    :ivar index: The position of the sheet in the workbook.
+    :ivar state: 'visible', 'hidden' or 'veryHidden'.
+    :ivar dimension: The range of cells declared by the sheet, or None if it declares none.
+                     Some applications declare a range larger than the data.
+    :ivar header: The values of the first row, without its trailing empty cells,
+                  or None if header rows were not read.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        index: int,
+        state: str = "visible",
+        dimension: Optional[CellRange] = None,
+        header: Optional[list] = None,
+    ):
+        self.name = name
+        self.index = index
+        self.state = state
+        self.dimension = dimension
+        self.header = header
+
+    @property
+    def visible(self) -> bool:
+        """
+        Returns True if the sheet is visible.
+        """
+        return self.state == "visible"
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(name={self.name!r}, index={self.index}, state={self.state!r}, dimension={self.dimension!r})"
+        )
+
+
+class WorkbookInfo:
+    """
+    The metadata of a workbook, returned by `scan()`.
+
+    :ivar format: The format of the file, 'xlsx', 'xlsm' or 'xls'.
+    :ivar sheets: The metadata of each sheet, in workbook order.
+    """
+
+    def __init__(self, fmt: str, sheets: list[SheetInfo]):
+        self.format = fmt
+        self.sheets = sheets
+
+    @property
+    def sheet_names(self) -> list[str]:
+        """
+        Returns the names of the sheets.
+        """
+        return [s.name for s in self.sheets]
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(format={self.format!r}, sheets={self.sheet_names!r})"
+        )
+
+
+def _trim(row) -> list:
+    row = list(row)
+    while row and (row[-1] is None or row[-1] == ""):
+        row.pop()
+    return row
+
+
+def _scan_xlsx(file, fmt: str, header: bool) -> WorkbookInfo:
+    from PyAutoExcel.Engines.XlsxParser import XlsxPackage
+
+    package = XlsxPackage(file)
+    try:
+        sheets = []
+        for index, part in enumerate(package.sheets):
+            dims = package.dimension(index)
+            info = SheetInfo(part.name, index, part.state)
+            if dims is not None:
+                min_col, min_row, max_col, max_row = dims
+                info.dimension = CellRange(
+                    min_row - 1, min_col - 1, max_row - 1, max_col - 1
+                )
+            if header:
+                rows = package.iter_rows(index, dimension=False)
+                info.header = _trim(next(rows, []))
+                rows.close()
+            sheets.append(info)
+        return WorkbookInfo(fmt, sheets)
+    finally:
+        package.close()
+
+
+def _xls_dimension(book, index: int) -> Optional[CellRange]:
+    """
+    Read the DIMENSIONS record at the start of a sheet substream,
+    without loading the sheet. Return None if the record cannot be read.
+    """
+    # The stream and the offsets of the sheets are internals of xlrd.
+    mem = getattr(book, "mem", None)
+    offsets = getattr(book, "_sh_abs_posn", None)
+    biff_version = getattr(book, "biff_version", None)
+    if mem is None or biff_version is None or offsets is None or index >= len(offsets):
+        return None
+    try:
+        return _read_dimension(mem, offsets[index], biff_version)
+    except (struct.error, TypeError):
+        return None
+
+
+def _read_dimension(mem, pos: int, biff_version: int) -> Optional[CellRange]:
+    """
+    Read the records of a sheet substream from ``pos`` up to its DIMENSIONS record.
+    """
+    while pos + 4 <= len(mem):
+        code, size = struct.unpack_from("<HH", mem, pos)
+        pos += 4
+        if code in (0x0000, 0x0200):
+            if biff_version >= 80:
+                first_row, last_row, first_col, last_col = struct.unpack_from(
+                    "<IIHH", mem, pos
+                )
+            else:
+                first_row, last_row, first_col, last_col = struct.unpack_from(
+                    "<HHHH", mem, pos
+                )
+            if last_row <= first_row or last_col <= first_col:
+                return None  # An empty sheet.
+            # The last row and column of the record are exclusive.
+            return CellRange(first_row, first_col, last_row - 1, last_col - 1)
+        if code == 0x000A:  # EOF of the substream.
+            return None
+        pos += size
+    return None
+
+
+def _xls_state(book, index: int) -> str:
+    """
+    Return the state of a sheet, read from the BOUNDSHEET records when the workbook
+    is opened. A sheet is visible if xlrd does not expose them.
+    """
+    visibility = getattr(book, "_sheet_visibility", None)
+    try:
+        return XLS_STATES[visibility[index]]
+    except (IndexError, TypeError):
+        return "visible"
+
+
+def _scan_xls(file, header: bool) -> WorkbookInfo:
+    import xlrd
+
+    if isinstance(file, str):
+        book = xlrd.open_workbook(file, on_demand=True)
+    elif isinstance(file, (bytes, bytearray, memoryview)):
+        book = xlrd.open_workbook(file_contents=bytes(file), on_demand=True)
+    else:
+        book = xlrd.open_workbook(file_contents=file.read(), on_demand=True)
+    try:
+        sheets = []
+        for index, name in enumerate(book.sheet_names()):
+            info = SheetInfo(
+                name, index, _xls_state(book, index), _xls_dimension(book, index)
+            )
+            if header:
+                # xlrd cannot read a single row, the sheet is loaded then released.
+                sheet = book.sheet_by_index(index)
+                info.header = _trim(sheet.row_values(0)) if sheet.nrows else []
+                book.unload_sheet(index)
+            sheets.append(info)
+        return WorkbookInfo("xls", sheets)
+    finally:
+        book.release_resources()
+
+
+def scan(
+    file: Union[str, bytes, bytearray, memoryview, io.IOBase],
+    fmt: str = "",
+    header: bool = True,
+) -> WorkbookInfo:
+    """
+    Reads the sheet names, the sheet states, the declared dimensions and the header rows
+    of a workbook, without parsing the cells.
+
+    For xlsx, only the workbook part and the beginning of each sheet part are read.
+    For xls, the BOUNDSHEET records and the DIMENSIONS record of each sheet are read.
+
+    :param file: The path to the file, a binary stream or the content of the file.
+    :type file: Union[str, bytes, bytearray, memoryview, io.IOBase]
+    :param fmt: The format of the file ('xlsx', 'xlsm' or 'xls').
+                If not specified, it is inferred from the file name or the signature of the file.
+    :type fmt: str
+    :param header: If True, the first row of each sheet is read.
+                   For xls, this loads each sheet, set it to False to only read the metadata.
+    :type header: bool
+    :return: The metadata of the workbook.
+    :rtype: WorkbookInfo
+    :raise ValueError: If the format is not supported.
+    """
+    if not fmt:
+        if isinstance(file, str):
+            fmt = file.rsplit(".", 1)[-1].lower()
+            if fmt not in ("xlsx", "xlsm", "xls"):
+                with open(file, "rb") as f:
+                    fmt = guess_format(f)
+        else:
+            fmt = guess_format(file)
+    if fmt in ("xlsx", "xlsm"):
+        return _scan_xlsx(file, fmt, header)
+    if fmt == "xls":
+        return _scan_xls(file, header)
+    raise ValueError(f"Cannot scan files of format {fmt!r}.")
@@ -1,23 +1,28 @@
+import importlib
 import inspect
 import types
+from typing import Union
 
 
 class Register:
     """
     A simple decorator-based registration system for classes.
+
+    An engine can also be registered lazily as a "module:Class" string,
+    the module is imported the first time the engine is requested.
     """
 
     def __init__(self):
         self.engines = {}
 
-    def add(self, engine_name: str, engine):
+    def add(self, engine_name: str, engine: Union[type, str]):
         """
         Add an engine to the register.
 
         :param engine_name: The name of the engine.
         :type engine_name: str
-        :param engine: The engine class.
-        :type engine: type
+        :param engine: The engine class, or its "module:Class" path.
+        :type engine: Union[type, str]
         """
         self.engines[engine_name] = engine
 
@@ -33,7 +38,12 @@ class Register:
         """
         if engine_name not in self.engines:
             raise KeyError(f"Engine '{engine_name}' not found.")
-        return self.engines[engine_name]
+        engine = self.engines[engine_name]
+        if isinstance(engine, str):
+            module_name, _, class_name = engine.partition(":")
+            engine = getattr(importlib.import_module(module_name), class_name)
+            self.engines[engine_name] = engine
+        return engine
 
     def add_from_module(
         self, module: types.ModuleType, sub_class_filters: list[type], field_name: str
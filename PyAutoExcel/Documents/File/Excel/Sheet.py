@@ -1,8 +1,20 @@
 
+from typing import TYPE_CHECKING, Any, Optional, Type
+
+from PyAutoExcel.Arrays import NO_VALUE
 from PyAutoExcel.CellRange import CellRange
-from PyAutoExcel.Grid import ListGrid
+from PyAutoExcel.Grid import ColumnarGrid, DenseGrid, SheetGrid, SparseGrid
 from PyAutoExcel.Utils import FinalMeta
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# A sheet with the default grid switches to SparseGrid
+# once it spans at least SPARSE_MIN_CELLS cells and less than
+# SPARSE_DENSITY of them have been written.
+SPARSE_MIN_CELLS = 1 << 16
+SPARSE_DENSITY = 0.1
+
 
 class Sheet(metaclass=FinalMeta):
     """
@@ -10,26 +22,64 @@ class Sheet(metaclass=FinalMeta):
 
     :param name: The name of the sheet.
     :type name: str
+    :param grid_class: The grid class used to store the cells.
+                       ColumnarGrid stores each column as a typed NumPy array.
+                       By default, the sheet starts with DenseGrid and switches to
+                       SparseGrid when it becomes large and mostly empty.
+    :type grid_class: Type[SheetGrid], optional
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, grid_class: Optional[Type[SheetGrid]] = None):
         """
         Initializes a new instance of the Sheet class.
 
         :param name: The name of the sheet.
         :type name: str
+        :param grid_class: The grid class used to store the cells. Default to an automatic choice.
+        :type grid_class: Type[SheetGrid], optional
         """
         self.name = name
-        self.grid = ListGrid()
-        self.data = [[]]
+        self._grid_class = grid_class
+        self._auto = grid_class is None
+        self._written = 0  # Number of cells written, while the grid is chosen automatically.
+        self.grid = (grid_class or DenseGrid)()
+
+    def _reserve(self, nrows: int, ncols: int, count: int):
+        """
+        Account for a write of ``count`` cells which extends the sheet to
+        at least ``nrows`` rows and ``ncols`` columns. If the grid is chosen
+        automatically and the sheet would be mostly empty, the cells are moved
+        to a SparseGrid before the write happens.
+        """
+        if not self._auto:
+            return
+        self._written += count
+        area = max(self.grid.nrows, nrows) * max(self.grid.ncols, ncols)
+        if area >= SPARSE_MIN_CELLS and self._written < area * SPARSE_DENSITY:
+            grid = SparseGrid()
+            for i, row in self.grid.iter_populated_rows():
+                grid.row(i, row)
+            self.grid = grid
+            self._auto = False
 
-    def _update(self):
-        """Updates the internal data representation from the grid."""
-        self.data = self.grid.get().copy()
+    @property
+    def data(self) -> list[list]:
+        """
+        The content of the sheet as a list of rows.
+        Rows are padded with ``""`` to the width of the sheet.
 
-    def _clean(self):
-        """Cleans the cache of internal grid."""
-        self.grid._grid = None
+        :return: The content of the sheet.
+        :rtype: list[list]
+        """
+        return self.grid.get()
+
+    @data.setter
+    def data(self, value: list[list]):
+        self.grid = (self._grid_class or DenseGrid)()
+        self._auto = self._grid_class is None
+        self._written = 0
+        for i, row in enumerate(value):
+            self.set_row(i, row)
 
     def set_cell(self, row: int, col: int, value):
         """
@@ -39,9 +89,8 @@ class Sheet(metaclass=FinalMeta):
         :param col: The column index of the cell.
         :param value: The value to set in the cell.
         """
+        self._reserve(row + 1, col + 1, 1)
         self.grid.cell(row, col, value)
-        self._update()
-        self._clean()
 
     def set_row(self, row: int, values: list):
         """
@@ -50,9 +99,11 @@ class Sheet(metaclass=FinalMeta):
         :param row: The row index.
         :param values: A list of values to set in the row.
         """
+        if self._auto:
+            if not isinstance(values, (list, tuple)):
+                values = list(values)
+            self._reserve(row + 1, len(values), len(values))
         self.grid.row(row, values)
-        self._update()
-        self._clean()
 
     def set_col(self, col: int, values: list):
         """
@@ -61,9 +112,11 @@ class Sheet(metaclass=FinalMeta):
         :param col: The column index.
         :param values: A list of values to set in the column.
         """
+        if self._auto:
+            if not isinstance(values, (list, tuple)):
+                values = list(values)
+            self._reserve(len(values), col + 1, len(values))
         self.grid.column(col, values)
-        self._update()
-        self._clean()
 
     def get_cell(self, row: int, col: int):
         """
@@ -73,7 +126,7 @@ class Sheet(metaclass=FinalMeta):
         :param col: The column index of the cell.
         :return: The value of the cell.
         """
-        return self.data[row][col]
+        return self.grid.get_cell(row, col)
 
     def get_row(self, row: int):
         """
@@ -82,7 +135,7 @@ class Sheet(metaclass=FinalMeta):
         :param row: The row index.
         :return: A list of values in the row.
         """
-        return self.data[row]
+        return self.grid.get_row(row)
 
     def get_col(self, col: int):
         """
@@ -91,7 +144,7 @@ class Sheet(metaclass=FinalMeta):
         :param col: The column index.
         :return: A list of values in the column.
         """
-        return [self.get_row(r)[col] for r in range(self.nrows())]
+        return self.grid.get_col(col)
 
     def get_range(self, rng: CellRange):
         """
@@ -102,10 +155,9 @@ class Sheet(metaclass=FinalMeta):
         :return: A list of lists, where each inner list contains the values in a specific row.
         :rtype: list[list[Any]]
         """
-        res = []
-        for r in range(rng.row_start, rng.row_end + 1):
-            res.append(self.data[r][rng.col_start : rng.col_end + 1])
-        return res
+        return self.grid.get_range(
+            rng.row_start, rng.col_start, rng.row_end, rng.col_end
+        )
 
     def set_range(self, rng: CellRange, content: list[list]):
         """
@@ -117,13 +169,41 @@ class Sheet(metaclass=FinalMeta):
                         where each inner list contains the values to set in a specific row.
         :type content: list[list[Any]]
         """
+        self._reserve(
+            rng.row_end + 1,
+            rng.col_end + 1,
+            (rng.row_end + 1 - rng.row_start) * (rng.col_end + 1 - rng.col_start),
+        )
         for row in range(rng.row_start, rng.row_end + 1):
             for col in range(rng.col_start, rng.col_end + 1):
                 self.grid.cell(
                     row, col, content[row - rng.row_start][col - rng.col_start]
                 )
-        self._update()
-        self._clean()
+
+    @property
+    def used_range(self) -> Optional[CellRange]:
+        """
+        The smallest range containing every cell which holds a value,
+        None and "" being empty. None if the sheet is empty.
+
+        :rtype: Optional[CellRange]
+        """
+        top = bottom = left = right = None
+        for i, row in self.grid.iter_populated_rows():
+            first = next((j for j, v in enumerate(row) if v is not None and v != ""), None)
+            if first is None:
+                continue
+            last = len(row) - 1
+            while row[last] is None or row[last] == "":
+                last -= 1
+            if top is None:
+                top, left, right = i, first, last
+            else:
+                left, right = min(left, first), max(right, last)
+            bottom = i
+        if top is None:
+            return None
+        return CellRange(top, left, bottom, right)
 
     def nrows(self):
         """
@@ -131,7 +211,7 @@ class Sheet(metaclass=FinalMeta):
 
         :return: The number of rows.
         """
-        return len(self.data)
+        return self.grid.nrows
 
     def ncols(self):
         """
@@ -139,8 +219,108 @@ class Sheet(metaclass=FinalMeta):
 
         :return: The number of columns.
         """
-        return len(self.data[0])
+        return self.grid.ncols
+
+    def iter_rows(self):
+        """
+        Iterates over the rows of the sheet, from top to bottom.
+
+        :return: A generator of rows.
+        """
+        return self.grid.iter_rows()
+
+    def iter_populated_rows(self):
+        """
+        Iterates over the rows which may hold values, as (index, row) tuples.
+        Empty rows of a sparse sheet are skipped, and rows are not padded.
+
+        :return: A generator of (index, row) tuples.
+        """
+        return self.grid.iter_populated_rows()
+
+    def copy(self) -> "Sheet":
+        """
+        Return an independent copy of the sheet, writing to one leaves the other unchanged.
+
+        :return: The copy.
+        :rtype: Sheet
+        """
+        sheet = Sheet(self.name, self._grid_class)
+        sheet._auto = self._auto
+        sheet._written = self._written
+        sheet.grid = self.grid.copy()
+        return sheet
+
+    def to_dataframe(self, header: bool = True, dtype=None, na_value: Any = NO_VALUE) -> "pd.DataFrame":
+        """
+        Convert the sheet to a pandas DataFrame.
+
+        The rows are written into one array per column, whose dtype is inferred
+        from the values as in `ExcelReader.to_arrays()`, and the DataFrame is built
+        from these arrays without copying them.
+
+        :param header: If True, the first row holds the names of the columns.
+                       Otherwise, the columns are named after their letters.
+        :type header: bool
+        :param dtype: The dtype of every column, or a dict of column name (or position) to dtype.
+        :param na_value: The value of the missing cells. Default to NaN, NaT or None depending on the dtype.
+        :return: The DataFrame.
+        :rtype: pd.DataFrame
+        :raise ValueError: If a value cannot be stored with the dtype of its column.
+        """
+        import pandas as pd
+
+        from PyAutoExcel.Arrays import sheet_arrays
+
+        return pd.DataFrame(sheet_arrays(self, header, dtype, na_value), copy=False)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        frame: "pd.DataFrame",
+        name: str = "Sheet1",
+        index: bool = False,
+        header: bool = True,
+        grid_class: Optional[Type[SheetGrid]] = None,
+    ) -> "Sheet":
+        """
+        Create a sheet holding the content of a pandas DataFrame.
+
+        The columns are converted to Python values a block of rows at a time,
+        according to their dtype. Missing values (NaN, NaT, None) are left empty.
+        A `ColumnarGrid` is filled column by column, numeric, boolean and datetime
+        columns being copied as arrays.
+
+        :param frame: The DataFrame.
+        :type frame: pd.DataFrame
+        :param name: The name of the sheet.
+        :type name: str
+        :param index: If True, the index is written before the columns.
+        :type index: bool
+        :param header: If True, the first row holds the names of the columns.
+        :type header: bool
+        :param grid_class: The grid class used to store the cells. Default to an automatic choice.
+        :type grid_class: Type[SheetGrid], optional
+        :return: The sheet.
+        :rtype: Sheet
+        """
+        from PyAutoExcel.Frames import (
+            column_array,
+            frame_columns,
+            frame_header,
+            iter_frame_rows,
+        )
 
+        sheet = cls(name, grid_class)
+        if isinstance(sheet.grid, ColumnarGrid):
+            if header:
+                sheet.set_row(0, frame_header(frame, index))
+            for j, column in enumerate(frame_columns(frame, index)):
+                sheet.grid.set_array(j, *column_array(column), start=int(header))
+            return sheet
+        for i, row in enumerate(iter_frame_rows(frame, index, header)):
+            sheet.set_row(i, row)
+        return sheet
 
     def __repr__(self):
         return f"PyAutoExcel.Documents.File.Excel.Sheet(name={self.name!r})"
@@ -1,16 +1,33 @@
+import contextlib
+import functools
 import io
-from typing import Type, Union
-
-import proglog
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Sequence, Type, Union
 
 from PyAutoExcel.Deprecated import process_deprecated as _process_deprecated
-from PyAutoExcel.Engines.WriterBase import BaseWriter
-from ..Reader.Excel import ExcelReader
+from PyAutoExcel.Engines.WriterBase import BaseWriter, RowStream
+from PyAutoExcel.Grid import SheetGrid
+from PyAutoExcel.Tracing import PhaseEvent, tracing
+from ..Reader.Excel import ExcelReader, _is_process_executor
 from ..Register import Register
 from ..Sheet import Sheet
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import pandas as pd
+
 writers = Register()
 
+# The built-in engines, imported when they are first used.
+BUILTIN_WRITERS = {
+    "xlsxlite": "PyAutoExcel.Engines.Writers:XlsxLiteWriter",
+    "xlsxcessive": "PyAutoExcel.Engines.Writers:XlsxCessiveWriter",
+    "xlwt": "PyAutoExcel.Engines.Writers:XlwtWriter",
+    "openpyxl": "PyAutoExcel.Engines.Writers:OpenpyxlWriter",
+    "xlsxwriter": "PyAutoExcel.Engines.Writers:XlsxWriterWriter",
+    "native": "PyAutoExcel.Engines.Writers:NativeWriter",
+}
+
 
 def add_writer(engine: Type[BaseWriter]):
     """
@@ -37,30 +54,56 @@ def remove_writer(name: str):
 
 def install_builtin_writers():
     """
-    Registers all built-in writer engines found in the Readers module.
-    This function searches for subclasses of WriteBook in the Readers module
-         and registers them using their ``__engine__`` attribute.
+    Registers all built-in writer engines of the Writers module.
+    The engines are registered lazily, the Writers module and the library
+         of an engine are only imported when the engine is first used.
     """
     global writers
-    from .....Engines import Writers
-
-    writers.add_from_module(
-        module=Writers,
-        sub_class_filters=[BaseWriter],
-        field_name="__engine__",
-    )
+    for name, path in BUILTIN_WRITERS.items():
+        writers.add(engine_name=name, engine=path)
 
 
-def auto_engine(fmt: str):
+def auto_engine(
+    fmt: str,
+    cells: Optional[int] = None,
+    streaming: bool = False,
+    features: Iterable[str] = (),
+):
     """
     Determines the appropriate engine to use based on the file format.
 
+    The installed engines writing the format are ranked by the calibration profile
+    of the machine (see `PyAutoExcel.EngineSelector`), or tried in a fixed order
+    ('xlwt' for 'xls' files, 'xlsxwriter' for 'xlsx' files) if there is no profile.
+
     :param fmt: The format of the file (e.g., 'xls', 'xlsx').
-    :return: The name of the engine to use ('xlwt' for 'xls' files, 'xlsxwriter' for 'xlsx' files).
+    :param cells: The number of cells to write, if known.
+    :param streaming: If True, the engine must write the rows as they arrive.
+    :param features: The other required features, e.g. ['dates'].
+    :return: The name of the engine to use.
     """
+    from PyAutoExcel.EngineSelector import select_writer
+
+    engine = select_writer(fmt, cells, streaming, features)
+    if engine is not None:
+        return engine
     return "xlwt" if fmt == "xls" else "xlsxwriter"
 
 
+def _save_sheets(
+    engine: Type[BaseWriter],
+    sheets: list[Sheet],
+    grid_class: Optional[Type[SheetGrid]] = None,
+    saver: Optional[str] = None,
+) -> Optional[bytes]:
+    """
+    Write sheets to a file or into memory, in a worker process of `ExcelWriter.save_async()`.
+    """
+    writer = engine(grid_class=grid_class)
+    writer.sheets.extend(sheets)
+    return writer.save(saver)
+
+
 class ExcelWriter:
     """
     A class for writing Excel files, supporting multiple engines and formats.
@@ -68,16 +111,34 @@ class ExcelWriter:
     :param engine: The name of the engine to use for writing.
            If not specified, it is auto-detected based on the file format.
     :param fmt: The format of the file (e.g., 'xls', 'xlsx'). Default to 'xlsx'.
+    :param grid_class: The grid class of the sheets which the engine buffers
+           before saving them. Default to DenseGrid.
+    :param tracer: A callable receiving a `PhaseEvent` for each phase of the engine
+           run by this writer: setup, write, output and streamed sheets.
     """
 
     _engine: BaseWriter
 
-    def __init__(self, engine: str = "", fmt: str = "xlsx"):
+    def __init__(
+        self,
+        engine: str = "",
+        fmt: str = "xlsx",
+        grid_class: Optional[Type[SheetGrid]] = None,
+        tracer: Optional[Callable[[PhaseEvent], None]] = None,
+    ):
         self._params = f"(engine={engine!r}, fmt={fmt!r})"
+        self._tracer = tracer
         engine = engine or auto_engine(fmt)
-        self._engine = writers.get(engine)()
+        with self._tracing():
+            self._engine = writers.get(engine)(grid_class=grid_class)
         _process_deprecated(self._engine.__deprecated__, engine)
 
+    def _tracing(self):
+        """
+        Return a context reporting the phases of the engine to the tracer of the writer, if any.
+        """
+        return contextlib.nullcontext() if self._tracer is None else tracing(self._tracer)
+
     def add_sheet(self, s: Sheet, index: int = -1):
         """
         Adds a sheet to the Excel file at the specified index.
@@ -110,6 +171,66 @@ class ExcelWriter:
                 return s
         raise LookupError(f"Cannot find sheet {name_or_idx!r}.")
 
+    def stream_sheet(self, name: str) -> RowStream:
+        """
+        Adds a sheet at the end of the file and returns it for appending rows,
+        the rows are flushed to the engine as they arrive.
+
+        Example::
+
+            with writer.stream_sheet("Result") as s:
+                for row in cursor:
+                    s.append(row)
+
+        :param name: The name of the sheet.
+        :type name: str
+        :return: The sheet to append rows to.
+        :rtype: RowStream
+        """
+        with self._tracing():
+            return self._engine.stream_sheet(name)
+
+    def write_rows(self, name: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Adds a sheet at the end of the file and writes the rows of an iterable to it,
+        without keeping them in memory.
+
+        :param name: The name of the sheet.
+        :type name: str
+        :param rows: The rows to write, e.g. a generator.
+        :type rows: Iterable[Sequence[Any]]
+        :return: The number of rows written.
+        :rtype: int
+        """
+        with self._tracing():
+            return self._engine.write_rows(name, rows)
+
+    def write_frame(
+        self, frame: "pd.DataFrame", name: str = "Sheet1", index: bool = False, header: bool = True
+    ) -> int:
+        """
+        Adds a sheet at the end of the file and writes a pandas DataFrame to it.
+
+        The columns are converted according to their dtype a block of rows at a time
+        and streamed to the engine, so a large DataFrame is never held as Python rows.
+        Missing values (NaN, NaT, None) are left empty. Timezone-aware datetimes
+        are written in their local time.
+
+        :param frame: The DataFrame.
+        :type frame: pd.DataFrame
+        :param name: The name of the sheet.
+        :type name: str
+        :param index: If True, the index is written before the columns.
+        :type index: bool
+        :param header: If True, the names of the columns are written in the first row.
+        :type header: bool
+        :return: The number of rows written, the header included.
+        :rtype: int
+        """
+        from PyAutoExcel.Frames import iter_frame_rows
+
+        return self.write_rows(name, iter_frame_rows(frame, index, header))
+
     @property
     def sheets(self):
         """
@@ -140,12 +261,56 @@ class ExcelWriter:
         :return: If param 'saver' is None, return the content as bytes.
                  Otherwise, return None.
         """
+        import proglog
+
         logger = proglog.default_bar_logger("bar")
         logger(message=f"PyAutoExcel - Writing {saver if saver is not None else 'into memory'}.")
-        res = self._engine.save(saver)
+        with self._tracing():
+            res = self._engine.save(saver)
         logger(message="PyAutoExcel - Done.")
         return res
 
+    async def save_async(
+        self,
+        saver: Union[None, str, io.BytesIO] = None,
+        executor: Optional["Executor"] = None,
+    ):
+        """
+        Saves the Excel file without blocking the event loop, the engine runs in an executor.
+
+        With a ProcessPoolExecutor, the sheets are sent to a worker process which
+        writes the file, so sheets streamed with `stream_sheet()` are not supported
+        and the phases of the engine are not traced.
+
+        :param saver: The file path or stream to save to.
+                      If None, the file will be saved to memory.
+        :type saver: Union[None, str, io.BytesIO]
+        :param executor: The executor running the engine. Default to the executor of the event loop.
+        :type executor: Optional[Executor]
+        :return: If param 'saver' is None, return the content as bytes.
+                 Otherwise, return None.
+        :raise ValueError: If a sheet was streamed and the executor is a ProcessPoolExecutor.
+        """
+        import asyncio
+        import contextvars
+
+        loop = asyncio.get_running_loop()
+        if not _is_process_executor(executor):
+            return await loop.run_in_executor(executor, contextvars.copy_context().run, self.save, saver)
+        if self._engine._written:
+            raise ValueError("Streamed sheets cannot be saved in a process executor.")
+        path = saver if isinstance(saver, str) else None
+        content = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                _save_sheets, type(self._engine), self._engine.sheets, self._engine.grid_class, path
+            ),
+        )
+        if saver is None:
+            return content
+        if path is None:
+            saver.write(content)
+
 
     @classmethod
     def from_reader(cls, reader: ExcelReader, use_engine: str = "", fmt: str = "xlsx"):
@@ -24,15 +24,18 @@ class BaseWorkbook(ABC):
     def __init__(self):
         self._sheets = []
 
-    def load(self, file: ReaderStream):
+    def load(self, file: ReaderStream, sheet_names: Optional[list[str]] = None):
         """
         Load excel workbook from file.
 
         :param file: file stream to load.
         :type file: ReaderStream
+        :param sheet_names: The names of the sheets to load, in workbook order.
+                            If it's None, all sheets will be loaded.
+        :type sheet_names: Optional[list[str]]
         :return: None
         """
-        self._sheets = self.engine.read(file)
+        self._sheets = self.engine.read(file, sheet_names)
 
     def save(self, file: WriterStream):
         """
@@ -11,6 +11,7 @@ History (most recent first):
 # bulitins
 import io
 import os
+from typing import Optional
 
 # third party
 from xlrd import open_workbook
@@ -47,29 +48,43 @@ class EngineXLS(EngineBase):
             return stream.getvalue()
 
     @classmethod
-    def read(cls, file: ReaderStream) -> list[Sheet]:
+    def read(
+        cls, file: ReaderStream, sheet_names: Optional[list[str]] = None
+    ) -> list[Sheet]:
         # Disable log of xlrd.
         null_device = open(os.devnull, mode="w")
+        try:
+            # Open workbook, sheets are loaded on demand.
+            if isinstance(file, io.IOBase):
+                file.seek(0)
+                content = file.read()
+                workbook = open_workbook(
+                    None, logfile=null_device, file_contents=content, on_demand=True
+                )
+            elif isinstance(file, bytes):
+                workbook = open_workbook(
+                    None, logfile=null_device, file_contents=file, on_demand=True
+                )
+            else:
+                workbook = open_workbook(file, logfile=null_device, on_demand=True)
 
-        # Open workbook
-        if isinstance(file, io.IOBase):
-            file.seek(0)
-            content = file.read()
-            workbook = open_workbook(None, logfile=null_device, file_contents=content)
-        elif isinstance(file, bytes):
-            workbook = open_workbook(None, logfile=null_device, file_contents=file)
-        else:
-            workbook = open_workbook(file, logfile=null_device)
-
-        # Reading sheets.
-        sheets = []
-        for s in workbook.sheets():
-            s: RDSheet
-            target = Sheet(s.name)
-            rows = s.get_rows()
-            # Writing to target.
-            for num, row in enumerate(rows):
-                target.set_row(num, row)
-            sheets.append(target)
-
+            # Reading sheets, the file stays mapped until the resources are released.
+            sheets = []
+            try:
+                for idx, name in enumerate(workbook.sheet_names()):
+                    if sheet_names is not None and name not in sheet_names:
+                        continue
+                    s: RDSheet = workbook.sheet_by_index(idx)
+                    target = Sheet(s.name)
+                    rows = s.get_rows()
+                    # Writing to target.
+                    for num, row in enumerate(rows):
+                        target.set_row(num, row)
+                    sheets.append(target)
+                    # Free the parsed records before loading the next sheet.
+                    workbook.unload_sheet(idx)
+            finally:
+                workbook.release_resources()
+        finally:
+            null_device.close()
         return sheets.copy()
@@ -10,6 +10,7 @@ History (most recent first):
 
 # bulitins
 import io
+from typing import Optional
 
 # third party
 import openpyxl
@@ -22,26 +23,28 @@ from ..Engine import EngineBase, ReaderStream, WriterStream
 # Define EngineXLSX class
 class EngineXLSX(EngineBase):
     @classmethod
-    def read(cls, file: ReaderStream) -> list[Sheet]:
+    def read(
+        cls, file: ReaderStream, sheet_names: Optional[list[str]] = None
+    ) -> list[Sheet]:
         # Open workbook
         if isinstance(file, bytes):
-            content = file
-            file = io.BytesIO()
-            file.write(content)
-            file.seek(0)
+            file = io.BytesIO(file)
 
         workbook = openpyxl.load_workbook(
             file, read_only=True, keep_vba=False, data_only=True
         )
 
-        # Reading sheets.
+        # Reading sheets, read-only worksheets are parsed on demand.
         sheets = []
         for s in workbook.worksheets:
+            if sheet_names is not None and s.title not in sheet_names:
+                continue
             target = Sheet(s.title)
             for num, row in enumerate(s.values):
                 target.set_row(num, list(row))
             sheets.append(target)
 
+        workbook.close()
         return sheets.copy()
 
     @classmethod
@@ -11,7 +11,7 @@ History (most recent first):
 # bulitin
 import io
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Optional, Union
 
 # self
 from ..File.Excel.Sheet import Sheet
@@ -29,13 +29,19 @@ class EngineBase(ABC):
 
     @classmethod
     @abstractmethod
-    def read(cls, file: ReaderStream) -> list[Sheet]:
+    def read(
+        cls, file: ReaderStream, sheet_names: Optional[list[str]] = None
+    ) -> list[Sheet]:
         """
         Read excel file and return a list of sheets.
         Subclasses should implement this method.
 
         :param file: The file to read.
         :type file: Union[str, io.IOBase, bytes]
+        :param sheet_names: The names of the sheets to read.
+                            If it's None, all sheets will be read.
+                            The other sheets are never parsed.
+        :type sheet_names: Optional[list[str]]
         :return: A list of sheets.
         :rtype: list[Sheet]
         """
@@ -1,3 +1,24 @@
+import importlib
+
 from .File import ExcelReader, ExcelWriter, Document, Sheet
-from .Workbook import WorkbookXLS, WorkbookXLSX, BaseWorkbook
-from .Workbook.Engine import ReaderStream, WriterStream
\ No newline at end of file
+
+# The workbook API imports xlrd, xlwt and openpyxl, so it is loaded on first access.
+_LAZY_NAMES = {
+    "WorkbookXLS": ".Workbook",
+    "WorkbookXLSX": ".Workbook",
+    "BaseWorkbook": ".Workbook",
+    "ReaderStream": ".Workbook.Engine",
+    "WriterStream": ".Workbook.Engine",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
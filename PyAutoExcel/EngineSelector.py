@@ -0,0 +1,349 @@
+"""
+Choice of the engine reading or writing a file, when none is given.
+
+The candidates are the registered engines declaring the format of the file,
+whose libraries are installed and which have the requested features.
+Among them, the fastest one of the calibration profile for the size of the file
+is chosen, or the first one of `READER_PREFERENCES`/`WRITER_PREFERENCES`
+without a profile.
+
+The profile is produced by a benchmark run on the machine::
+
+    python -m PyAutoExcel.bench --operations read,write --cells 10000,300000 --calibrate
+"""
+import importlib.util
+import json
+import math
+import os
+import statistics
+import tempfile
+import warnings
+from typing import Any, Iterable, Optional, Union
+
+from .Documents.File.Excel.Register import Register
+
+PROFILE_VERSION = 1
+
+# The features which may be requested, see `__features__` of the engines.
+FEATURES = ("streaming", "dates", "formatting")
+
+# The engines tried in order when there is no profile.
+READER_PREFERENCES = {
+    "xls": ("xlrd",),
+    "xlsx": ("native", "python-xlsxio", "sxl", "openpyxl"),
+    "xlsm": ("native", "openpyxl"),
+}
+WRITER_PREFERENCES = {
+    "xls": ("xlwt",),
+    "xlsx": ("xlsxwriter", "native", "openpyxl", "xlsxcessive", "xlsxlite"),
+}
+
+_profiles: dict[
+    str, tuple[float, Optional["Profile"]]
+] = {}  # Path -> (mtime, profile).
+
+
+def default_profile_path() -> str:
+    """
+    Return the path of the calibration profile: $PYAUTOEXCEL_PROFILE,
+    or profile.json in the default cache directory.
+    """
+    path = os.environ.get("PYAUTOEXCEL_PROFILE")
+    if path:
+        return path
+    from .Cache import default_cache_dir
+
+    return os.path.join(default_cache_dir(), "profile.json")
+
+
+def installed(module: str) -> bool:
+    """
+    Return True if a module can be imported, without importing it.
+    """
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class Profile:
+    """
+    The throughput of the engines measured on this machine, by format and workload size.
+
+    :param entries: One dict per engine, operation, format and size, with the keys
+                    'operation' ('read' or 'write'), 'format', 'engine', 'size' (cells),
+                    'cells_per_s', 'bytes_per_cell' (read only, else None)
+                    and 'failures' (the workloads the engine failed).
+    :param environment: The description of the machine and of the libraries.
+    """
+
+    def __init__(
+        self,
+        entries: list[dict[str, Any]],
+        environment: Optional[dict[str, Any]] = None,
+    ):
+        self.entries = entries
+        self.environment = environment or {}
+
+    @classmethod
+    def from_results(cls, results: Iterable[dict[str, Any]]) -> "Profile":
+        """
+        Build a profile from the results of `PyAutoExcel.bench.run()`.
+        The throughput of an engine is its median over the workloads of a size,
+        round-trips and unavailable engines are ignored.
+        """
+        from .bench import environment
+
+        groups: dict[tuple, list[dict[str, Any]]] = {}
+        for r in results:
+            if r["operation"] in ("read", "write") and r["status"] != "unavailable":
+                groups.setdefault(
+                    (r["operation"], r["format"], r["engine"], r["size"]), []
+                ).append(r)
+        entries = []
+        for (operation, fmt, engine, size), group in groups.items():
+            ok = [r for r in group if r["status"] == "ok" and r["cells_per_s"]]
+            if not ok:
+                continue
+            entries.append(
+                {
+                    "operation": operation,
+                    "format": fmt,
+                    "engine": engine,
+                    "size": size,
+                    "cells_per_s": statistics.median(r["cells_per_s"] for r in ok),
+                    "bytes_per_cell": (
+                        statistics.median(
+                            r["input_bytes"] / r["cells"] for r in ok if r["cells"]
+                        )
+                        if operation == "read" and any(r["cells"] for r in ok)
+                        else None
+                    ),
+                    "failures": sorted(
+                        r["shape"] for r in group if r["status"] != "ok"
+                    ),
+                }
+            )
+        return cls(entries, environment())
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "Profile":
+        """
+        Load a profile saved by `save()`.
+
+        :raise OSError: If the file cannot be read.
+        :raise ValueError: If the file is not a profile of this version.
+        """
+        with open(path or default_profile_path(), encoding="utf-8") as f:
+            document = json.load(f)
+        if not isinstance(document, dict) or document.get("version") != PROFILE_VERSION:
+            raise ValueError(f"Not a version {PROFILE_VERSION} engine profile.")
+        return cls(document["entries"], document.get("environment"))
+
+    def save(self, path: Optional[str] = None) -> str:
+        """
+        Save the profile atomically.
+
+        :param path: The path of the file. Default to `default_profile_path()`.
+        :return: The path of the file.
+        """
+        path = path or default_profile_path()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        document = {
+            "version": PROFILE_VERSION,
+            "environment": self.environment,
+            "entries": self.entries,
+        }
+        fd, temp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+        return path
+
+    def bytes_per_cell(self, fmt: str) -> Optional[float]:
+        """
+        Return the median size of a cell in the files of a format read by the benchmark, or None.
+        """
+        sizes = [
+            e["bytes_per_cell"]
+            for e in self.entries
+            if e["operation"] == "read" and e["format"] == fmt and e["bytes_per_cell"]
+        ]
+        return statistics.median(sizes) if sizes else None
+
+    def rank(self, operation: str, fmt: str, cells: Optional[int] = None) -> list[str]:
+        """
+        Return the engines measured for an operation and a format, from the fastest.
+        Engines which failed a workload come last.
+
+        :param operation: 'read' or 'write'.
+        :param fmt: The format of the file.
+        :param cells: The number of cells of the file, the measures of the closest size are used.
+                      Default to the largest size measured.
+        """
+        entries = [
+            e
+            for e in self.entries
+            if e["operation"] == operation and e["format"] == fmt
+        ]
+        if not entries:
+            return []
+        sizes = {e["size"] for e in entries}
+        if cells is None or cells <= 0:
+            size = max(sizes)
+        else:
+            size = min(sizes, key=lambda s: abs(math.log(s) - math.log(cells)))
+        entries = [e for e in entries if e["size"] == size]
+        entries.sort(key=lambda e: (bool(e["failures"]), -e["cells_per_s"]))
+        return [e["engine"] for e in entries]
+
+    def __repr__(self):
+        return f"PyAutoExcel.Profile({len(self.entries)} entries)"
+
+
+def get_profile(path: Optional[str] = None) -> Optional[Profile]:
+    """
+    Return the calibration profile, or None if there is none.
+    The file is read again when it changes. An invalid profile is ignored with a warning.
+    """
+    path = path or default_profile_path()
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+    cached = _profiles.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        profile = Profile.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        warnings.warn(f"Ignoring the engine profile {path!r}: {e}", RuntimeWarning)
+        profile = None
+    _profiles[path] = (mtime, profile)
+    return profile
+
+
+def candidates(
+    register: Register, fmt: str, streaming: bool = False, features: Iterable[str] = ()
+) -> list[str]:
+    """
+    Return the registered engines which handle a format, are installed and have the features.
+
+    :param register: The register of the readers or of the writers.
+    :param fmt: The format of the file.
+    :param streaming: If True, only the engines streaming the rows.
+    :param features: The other features, among 'dates' and 'formatting'.
+    :raise ValueError: If a feature is unknown.
+    """
+    features = set(features)
+    unknown = features.difference(FEATURES)
+    if unknown:
+        raise ValueError(f"Unknown engine features: {', '.join(sorted(unknown))}")
+    if "streaming" in features:
+        features.discard("streaming")
+        streaming = True
+    names = []
+    for name in list(register.engines):
+        try:
+            engine = register.get(name)
+        except (ImportError, AttributeError):
+            continue
+        if fmt not in getattr(engine, "__formats__", ("xlsx",)):
+            continue
+        if not all(installed(module) for module in getattr(engine, "__requires__", ())):
+            continue
+        if not features <= getattr(engine, "__features__", frozenset()):
+            continue
+        if streaming and not engine.streaming():
+            continue
+        names.append(name)
+    return names
+
+
+def _choose(
+    names: list[str],
+    operation: str,
+    fmt: str,
+    cells: Optional[int],
+    profile: Union[Profile, bool, None],
+    preferences: dict[str, tuple],
+) -> Optional[str]:
+    if not names:
+        return None
+    if profile is None or profile is True:
+        profile = get_profile()
+    if profile:
+        for name in profile.rank(operation, fmt, cells):
+            if name in names:
+                return name
+    for name in preferences.get(fmt, ()):
+        if name in names:
+            return name
+    return names[0]
+
+
+def select_reader(
+    fmt: str,
+    size: Optional[int] = None,
+    streaming: bool = False,
+    features: Iterable[str] = (),
+    profile: Union[Profile, bool, None] = None,
+) -> Optional[str]:
+    """
+    Choose the reader of a file.
+
+    :param fmt: The format of the file.
+    :param size: The size of the file in bytes, if known.
+    :param streaming: If True, the engine must stream the rows (lazy reading).
+    :param features: The other required features, e.g. ['formatting'].
+    :param profile: The calibration profile. Default to the profile of `get_profile()`,
+                    False to only use `READER_PREFERENCES`.
+    :return: The name of the engine, or None if no engine can read the file.
+    """
+    if profile is None or profile is True:
+        profile = get_profile()
+    cells = None
+    if profile and size:
+        per_cell = profile.bytes_per_cell(fmt)
+        cells = int(size / per_cell) if per_cell else None
+    names = candidates(_readers(), fmt, streaming, features)
+    return _choose(names, "read", fmt, cells, profile, READER_PREFERENCES)
+
+
+def select_writer(
+    fmt: str,
+    cells: Optional[int] = None,
+    streaming: bool = False,
+    features: Iterable[str] = (),
+    profile: Union[Profile, bool, None] = None,
+) -> Optional[str]:
+    """
+    Choose the writer of a file.
+
+    :param fmt: The format of the file.
+    :param cells: The number of cells to write, if known. Default to the largest size of the profile.
+    :param streaming: If True, the engine must write the rows as they arrive.
+    :param features: The other required features, e.g. ['dates'].
+    :param profile: The calibration profile. Default to the profile of `get_profile()`,
+                    False to only use `WRITER_PREFERENCES`.
+    :return: The name of the engine, or None if no engine can write the file.
+    """
+    names = candidates(_writers(), fmt, streaming, features)
+    return _choose(names, "write", fmt, cells, profile, WRITER_PREFERENCES)
+
+
+def _readers() -> Register:
+    from .Documents.File.Excel.Reader.Excel import readers
+
+    return readers
+
+
+def _writers() -> Register:
+    from .Documents.File.Excel.Writer.Excel import writers
+
+    return writers
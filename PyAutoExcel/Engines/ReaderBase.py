@@ -1,9 +1,13 @@
 import abc
 import io
-from typing import Union
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Type, Union
 
 from PyAutoExcel.Deprecated import DeprecatedInfo
 from PyAutoExcel.Documents.File.Excel.Sheet import Sheet
+from PyAutoExcel.Grid import SheetGrid
+from PyAutoExcel.RowFilter import RowFilter
+from PyAutoExcel.Tracing import Phase, file_size
+from PyAutoExcel.Utils import parse_usecols, resolve_columns, unmatched_names
 
 
 class BaseReader(abc.ABC):
@@ -13,32 +17,119 @@ class BaseReader(abc.ABC):
     This class is abstract and should not be instantiated directly.
 
     :param file: The file to read.
+    :param lazy: If True, the sheets are not parsed when the file is opened.
+                 Each sheet is parsed on first access, and rows can be streamed
+                 with `iter_rows()` without materializing the sheet.
+    :param grid_class: The grid class used to store the cells of the sheets. Default to DenseGrid.
+    :param usecols: The columns to read, as column indexes, letters ('A', 'C:F') or header names.
+                    Header names are looked up in the header row of each sheet.
+                    The other columns are discarded while the rows are parsed. Default to all columns.
+    :param header_row: The index of the header row. The rows above it are skipped,
+                       and it is kept as the first row of the sheet. Default to no header row,
+                       header names are then looked up in the first row.
+    :param skiprows: The number of rows skipped at the top of the sheet, or below the header row.
+    :param nrows: The maximum number of rows read after the skipped rows, not counting the header row.
+                  Parsing stops as soon as they are read. Default to all rows.
+    :param where: A row filter, as a callable or an expression (see `RowFilter`).
+                  It is evaluated on the rows of the window as they are parsed,
+                  the header row is always kept and the rejected rows are never stored.
 
     Subclasses must implement the following methods:
 
     - `_setup()`: Set up the reader.
-    - `_parse()`: Read the sheets from the file.
+    - `_list_sheets()`: Return the sheet names from the workbook metadata.
+    - `_iter_rows()`: Yield the rows of a sheet straight from the engine.
+
+    Subclasses may also implement `_close()` to release the file,
+    `_iter_projected()` to skip the unwanted columns while parsing,
+    and `_row_count()` to reserve the arrays of `PyAutoExcel.Arrays` up front.
+
+    Subclasses which cannot stream rows may implement `_parse()` instead,
+    lazy mode then falls back to parsing the whole file when it is opened.
 
     Subclasses must also set the following class variables:
 
     - `__engine__`: The name of the engine used by the reader.
 
-    Subclasses may also set the following class variable:
+    Subclasses may also set the following class variables:
 
     - `__deprecated__`: A DeprecatedInfo object containing information about the reader's deprecation.
+    - `__formats__`: The formats of the files the engine can read. Default to xlsx and xlsm.
+    - `__requires__`: The modules the engine imports, to know if it is installed without importing them.
+    - `__features__`: The optional features of the engine, e.g. 'formatting' if its library reads cell formats.
+
+    The setup and the parsing of the sheets are reported to the tracer of the context
+    (see `PyAutoExcel.Tracing`). Rows streamed by `iter_rows()` in lazy mode are not reported.
     """
     __engine__ = ""
     __deprecated__ = DeprecatedInfo()
+    __formats__ = ("xlsx", "xlsm")
+    __requires__ = ()
+    __features__ = frozenset()
     _sheets: list[Sheet]
     _sheet_names: list[str]
 
-    def __init__(self, file: Union[bytes, str, io.IOBase]):
+    def __init__(
+        self,
+        file: Union[bytes, bytearray, memoryview, str, io.IOBase],
+        lazy: bool = False,
+        grid_class: Optional[Type[SheetGrid]] = None,
+        usecols: Union[str, int, Iterable[Union[str, int]], None] = None,
+        header_row: Optional[int] = None,
+        skiprows: int = 0,
+        nrows: Optional[int] = None,
+        where: Union[str, Callable[[list], bool], None] = None,
+    ):
         self._file = file
+        self._grid_class = grid_class
+        if usecols is not None:
+            usecols = list(usecols) if not isinstance(usecols, (str, int)) else usecols
+            parse_usecols(usecols)  # Fail before opening the file.
+        self._usecols = usecols
+        self._columns: dict[int, list[int]] = {}  # Columns selected in each sheet.
+        self._unmatched: dict[int, set[str]] = {}  # Header names missing from each sheet.
+        for name, value in (("header_row", header_row), ("skiprows", skiprows), ("nrows", nrows)):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative: {value}")
+        self._header_row = header_row
+        self._skiprows = skiprows
+        self._max_rows = nrows
+        self._where = None if where is None else RowFilter(where)
+        self._lazy = lazy and self.streaming()
         self._sheets = []
         self._sheet_names = []
         self._workbook = None
-        self._setup()
-        self._parse()
+        self._closed = False
+        with Phase(self.__engine__, "setup", file) as phase:
+            if phase.active:
+                phase.event.bytes_in = file_size(file)
+            self._setup()
+        if self._lazy:
+            self._sheet_names = list(self._list_sheets())
+            self._sheets = [None] * len(self._sheet_names)
+        else:
+            with Phase(self.__engine__, "parse", file) as phase:
+                self._parse()
+                if phase.active:
+                    self._count(phase, self._sheets)
+            self.close()
+            self._check_names()
+
+    @staticmethod
+    def _count(phase: Phase, sheets: Iterable[Sheet]):
+        """
+        Set the rows and cells of a phase to the size of the sheets.
+        """
+        sheets = [s for s in sheets if s is not None]
+        phase.event.rows = sum(s.nrows() for s in sheets)
+        phase.event.cells = sum(s.nrows() * s.ncols() for s in sheets)
+
+    @classmethod
+    def streaming(cls) -> bool:
+        """
+        Return True if the engine can stream the rows of a sheet.
+        """
+        return cls._iter_rows is not BaseReader._iter_rows
 
     @abc.abstractmethod
     def _setup(self):
@@ -47,18 +138,226 @@ class BaseReader(abc.ABC):
         """
         raise NotImplementedError
 
-    @abc.abstractmethod
+    def _list_sheets(self) -> list[str]:
+        """
+        Return the names of the sheets, without parsing them.
+        """
+        raise NotImplementedError
+
+    def _iter_rows(self, index: int) -> Iterator[Sequence]:
+        """
+        Yield the rows of the sheet at the given index, from top to bottom.
+        """
+        raise NotImplementedError
+
+    def _row_count(self, index: int) -> Optional[int]:
+        """
+        Return the number of rows the sheet declares, without parsing it, or None if it is unknown.
+        It is only used to reserve memory, some files declare more rows than they hold.
+        """
+        return None
+
+    def _iter_projected(self, index: int, columns: list[int]) -> Iterator[Sequence]:
+        """
+        Yield the rows of the sheet at the given index, keeping only the given columns.
+        Engines which can skip cells while parsing should override this method.
+
+        :param columns: The sorted 0-based indexes of the columns.
+        """
+        last = columns[-1]
+        for row in self._iter_rows(index):
+            if len(row) > last:
+                yield [row[c] for c in columns]
+            else:
+                yield [row[c] if c < len(row) else None for c in columns]
+
+    def _peek_row(self, index: int, row: int) -> list:
+        """
+        Read a single row of a sheet, and stop parsing the sheet right after it.
+        """
+        rows = iter(self._iter_rows(index))
+        try:
+            for i, values in enumerate(rows):
+                if i == row:
+                    return list(values)
+            return []
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+    def _selected_columns(self, index: int) -> Optional[list[int]]:
+        """
+        Return the indexes of the columns to read in a sheet, or None to read them all.
+        """
+        if self._usecols is None:
+            return None
+        columns = self._columns.get(index)
+        if columns is None:
+            names = parse_usecols(self._usecols)[1]
+            header = self._peek_row(index, self._header_row or 0) if names else None
+            columns = self._columns[index] = resolve_columns(self._usecols, header, strict=False)
+            if names:
+                self._unmatched[index] = unmatched_names(self._usecols, header)
+        return columns
+
+    def _check_names(self):
+        """
+        Raise an error if a header name of `usecols` or `where` is in none of the sheets,
+        once every sheet has been read. A name of `usecols` missing from some sheets
+        only selects no column in them, and a sheet missing a name of `where` has no
+        data rows.
+
+        :raise ValueError: If a header name is in no sheet.
+        """
+        if self._unmatched and len(self._unmatched) == len(self._sheet_names):
+            missing = set.intersection(*self._unmatched.values())
+            if missing:
+                raise ValueError(f"No column named {sorted(missing)[0]!r} in the header of any sheet")
+
+    def _rows(self, index: int) -> Iterator[Sequence]:
+        """
+        Yield the rows of a sheet, restricted to the selected columns and rows.
+        """
+        columns = self._selected_columns(index)
+        if columns is not None and not columns:
+            return iter(())
+        read = columns  # The columns parsed, including the ones only used by the filter.
+        keep = None  # The positions of the selected columns in the parsed rows.
+        predicate = None
+        if self._where is not None:
+            header = None
+            # Column letters are header names too when they are in the header row.
+            if self._where.header_names or (
+                self._header_row is not None and self._where.names
+            ):
+                header = self._peek_row(index, self._header_row or 0)
+                missing = set(self._where.header_names).difference(
+                    value for value in header if isinstance(value, str)
+                )
+                self._unmatched.setdefault(index, set()).update(missing)
+            used = self._where.columns(header, strict=False)
+            if len(used) < len(self._where.names):
+                predicate = _reject
+            else:
+                if columns is not None and not set(used.values()) <= set(columns):
+                    read = sorted(set(columns).union(used.values()))
+                    keep = [read.index(c) for c in columns]
+                if read is None:
+                    predicate = self._where.bind(used)
+                else:
+                    predicate = self._where.bind(
+                        {k: read.index(c) for k, c in used.items()}
+                    )
+        if read is None:
+            rows = iter(self._iter_rows(index))
+        else:
+            rows = iter(self._iter_projected(index, read))
+        if self._header_row is not None or self._skiprows or self._max_rows is not None:
+            rows = self._window(rows)
+        if predicate is not None:
+            rows = self._filter(rows, predicate, keep)
+        return rows
+
+    def _window(self, rows: Iterator[Sequence]) -> Iterator[Sequence]:
+        """
+        Yield the header row and the rows of the window, then stop the engine.
+        """
+        header = self._header_row
+        start = self._skiprows if header is None else header + 1 + self._skiprows
+        stop = None if self._max_rows is None else start + self._max_rows
+        try:
+            for i, row in enumerate(rows):
+                if i == stop:
+                    break
+                if i >= start or i == header:
+                    yield row
+        finally:
+            # The engine releases the sheet as soon as the window is read.
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+    def _filter(
+        self, rows: Iterator[Sequence], predicate: Callable[[Sequence], bool], keep: Optional[list[int]]
+    ) -> Iterator[Sequence]:
+        """
+        Yield the header row and the rows accepted by the predicate,
+        keeping the values at the positions of ``keep`` if it is given.
+        """
+        has_header = self._header_row is not None
+        for i, row in enumerate(rows):
+            if (has_header and i == 0) or predicate(row):
+                yield row if keep is None else [row[k] if k < len(row) else None for k in keep]
+
     def _parse(self):
         """
         Parse the file and create the sheets.
         """
-        raise NotImplementedError
+        for index, name in enumerate(self._list_sheets()):
+            self._sheets.append(self._read_sheet(index, name))
+            self._sheet_names.append(name)
+
+    def _used_rows(self, index: int) -> Iterator[tuple[int, Sequence]]:
+        """
+        Yield the rows of a sheet which hold values, as (index, row) tuples.
+        Trailing empty cells (None or "") are trimmed from each row and empty rows are skipped,
+        so the blank tails some files declare are never stored.
+        """
+        for i, row in enumerate(self._rows(index)):
+            n = len(row)
+            while n and (row[n - 1] is None or row[n - 1] == ""):
+                n -= 1
+            if n:
+                yield i, row if n == len(row) else row[:n]
+
+    def _read_sheet(self, index: int, name: str) -> Sheet:
+        """
+        Read a whole sheet from the engine, up to its last used row and column.
+        """
+        ws = Sheet(name, self._grid_class)
+        for i, row in self._used_rows(index):
+            ws.set_row(i, row)
+        return ws
+
+    def _close(self):
+        """
+        Release the resources held by the engine.
+        """
+
+    def close(self):
+        """
+        Close the file, it is safe to call this method more than once.
+        """
+        if not self._closed:
+            self._closed = True
+            self._close()
+
+    def iter_rows(self, index: int) -> Iterator[list]:
+        """
+        Yield the rows of the sheet at the given index, up to its last used row.
+        In lazy mode, rows come straight from the engine and are not stored,
+        they are not padded and their trailing empty cells are trimmed.
+        """
+        if self._lazy and self._sheets[index] is None:
+            last = -1
+            for i, row in self._used_rows(index):
+                for _ in range(last + 1, i):
+                    yield []
+                last = i
+                yield list(row)
+        else:
+            yield from self.sheet_by_index(index).iter_rows()
 
     @property
     def sheets(self) -> list[Sheet]:
         """
         Return the list of sheets.
         """
+        if self._lazy:
+            for index in range(len(self._sheets)):
+                self.sheet_by_index(index)
+            self._check_names()
         return self._sheets
 
     @property
@@ -66,7 +365,7 @@ class BaseReader(abc.ABC):
         """
         Return the number of sheets.
         """
-        return len(self._sheets)
+        return len(self._sheet_names)
 
     @property
     def sheet_names(self) -> list[str]:
@@ -79,11 +378,87 @@ class BaseReader(abc.ABC):
         """
         Return the sheet with the given name.
         """
-        return self._sheets[self._sheet_names.index(name)]
+        return self.sheet_by_index(self._sheet_names.index(name))
 
     def sheet_by_index(self, index: int):
         """
         Return the sheet at the given index.
         """
+        if self._lazy and self._sheets[index] is None:
+            name = self._sheet_names[index]
+            with Phase(self.__engine__, "parse", self._file, name) as phase:
+                self._sheets[index] = self._read_sheet(index, name)
+                if phase.active:
+                    self._count(phase, [self._sheets[index]])
         return self._sheets[index]
 
+    def load_parallel(self, workers: int):
+        """
+        Parse the sheets which are not loaded yet in a pool of processes,
+        each process opens the file and parses one sheet at a time.
+        The sheets are stored in workbook order.
+
+        Only lazy readers have unloaded sheets, this method does nothing otherwise.
+
+        :param workers: The maximum number of processes.
+        """
+        pending = [i for i, s in enumerate(self._sheets) if s is None]
+        if not pending:
+            return
+        from concurrent.futures import ProcessPoolExecutor
+
+        file = self._file
+        if not isinstance(file, (str, bytes, bytearray, memoryview)):
+            # Streams cannot be shared between processes, send their content instead.
+            file.seek(0)
+            file = file.read()
+        with Phase(self.__engine__, "parse", self._file) as phase, \
+                ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            futures = [
+                executor.submit(
+                    _read_sheet_in_process, type(self), file, index, self._options()
+                )
+                for index in pending
+            ]
+            for index, future in zip(pending, futures):
+                self._sheets[index] = future.result()
+            if phase.active:
+                self._count(phase, [self._sheets[i] for i in pending])
+
+    def _options(self) -> dict[str, Any]:
+        """
+        Return the keyword arguments which recreate the reader in another process.
+        """
+        return {
+            "grid_class": self._grid_class,
+            "usecols": self._usecols,
+            "header_row": self._header_row,
+            "skiprows": self._skiprows,
+            "nrows": self._max_rows,
+            "where": None if self._where is None else self._where.where,
+        }
+
+
+def _read_sheet_in_process(
+    engine: Type[BaseReader],
+    file: Union[bytes, str],
+    index: int,
+    options: Optional[dict[str, Any]] = None,
+) -> Sheet:
+    """
+    Parse one sheet of a file, in a worker process of `BaseReader.load_parallel()`.
+
+    :param options: The keyword arguments of the reader, see `BaseReader._options()`.
+    """
+    reader = engine(file, lazy=True, **(options or {}))
+    try:
+        return reader.sheet_by_index(index)
+    finally:
+        reader.close()
+
+
+def _reject(row: Sequence) -> bool:
+    """
+    The predicate of a sheet which lacks a column used by the row filter.
+    """
+    return False
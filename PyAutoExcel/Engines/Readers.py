@@ -1,78 +1,168 @@
 import io
+from typing import TYPE_CHECKING
 
-import sxl
-import xlrd
-import xlsxio
-from openpyxl import load_workbook, Workbook
-from xlrd.sheet import Sheet as XlrdSheet
-
-from PyAutoExcel.Documents.File.Excel.Sheet import Sheet
 from .ReaderBase import BaseReader
+from .XlsxParser import XlsxPackage
+
+# Types of in-memory workbooks, which are read without copying them to disk.
+BYTES_TYPES = (bytes, bytearray, memoryview)
+
+if TYPE_CHECKING:
+    # Each engine imports its library in _setup(), so only the libraries in use are loaded.
+    import sxl
+    import xlrd
+    import xlsxio
+    from openpyxl import Workbook
+    from xlrd.sheet import Sheet as XlrdSheet
 
 
 class OpenpyxlReader(BaseReader):
-    _workbook: Workbook
+    _workbook: "Workbook"
     __engine__ = "openpyxl"
+    __requires__ = ("openpyxl",)
+    __features__ = frozenset({"formatting"})
 
     def _setup(self):
-        if isinstance(self._file, (str, io.BytesIO)):
+        from openpyxl import load_workbook
+
+        if isinstance(self._file, BYTES_TYPES):
+            self._workbook = load_workbook(io.BytesIO(self._file), read_only=True)
+        else:
             self._workbook = load_workbook(self._file, read_only=True)
-        elif isinstance(self._file, bytes):
-            stream = io.BytesIO(self._file)
-            self._workbook = load_workbook(stream, read_only=True)
 
+    def _list_sheets(self):
+        return self._workbook.sheetnames
+
+    def _iter_rows(self, index: int):
+        # Read-only worksheets are parsed on demand, one at a time.
+        sheet = self._workbook[self._workbook.sheetnames[index]]
+        # The declared dimension is often far larger than the data,
+        # rows would be padded and blank rows generated up to it.
+        sheet.reset_dimensions()
+        return sheet.iter_rows(values_only=True)
+
+    def _row_count(self, index: int):
+        return self._workbook[self._workbook.sheetnames[index]].max_row
+
+    def _iter_projected(self, index: int, columns: list[int]):
+        sheet = self._workbook[self._workbook.sheetnames[index]]
+        sheet.reset_dimensions()
+        # Cells outside of the bounds of the selection are not created.
+        first = columns[0]
+        offsets = [c - first for c in columns]
+        for row in sheet.iter_rows(min_col=first + 1, max_col=columns[-1] + 1, values_only=True):
+            yield [row[c] for c in offsets]
+
+    def _close(self):
+        self._workbook.close()
+
+
+class NativeReader(BaseReader):
+    """
+    Values-only xlsx reader parsing the package with zipfile and expat.
+    It yields the same values as OpenpyxlReader without creating cell objects.
+    """
+
+    _workbook: XlsxPackage
+    __engine__ = "native"
+
+    def _setup(self):
+        self._workbook = XlsxPackage(self._file)
+
+    def _list_sheets(self):
+        return [part.name for part in self._workbook.sheets]
+
+    def _iter_rows(self, index: int):
+        return self._workbook.iter_rows(index, dimension=False)
 
-    def _parse(self):
-        for sheet in self._workbook.worksheets:
-            ws = Sheet(sheet.title)
-            for i, row in enumerate(sheet.iter_rows(values_only=True)):
-                ws.set_row(i, row)
-            self.sheets.append(ws)
-            self.sheet_names.append(ws.name)
+    def _iter_projected(self, index: int, columns: list[int]):
+        return self._workbook.iter_rows(index, dimension=False, columns=columns)
 
+    def _row_count(self, index: int):
+        dimension = self._workbook.dimension(index)
+        return None if dimension is None else dimension[3]
+
+    def _close(self):
+        self._workbook.close()
 
 
 class XlrdReader(BaseReader):
-    _workbook: xlrd.Book
+    _workbook: "xlrd.Book"
     __engine__ = "xlrd"
+    __requires__ = ("xlrd",)
+    __formats__ = ("xls",)
 
     def _setup(self):
+        import xlrd
+
+        # Sheets are only loaded when they are read, and unloaded right after.
         if isinstance(self._file, str):
-            self._workbook = xlrd.open_workbook(self._file)
-        elif isinstance(self._file, bytes):
-            self._workbook = xlrd.open_workbook(file_contents=self._file)
+            self._workbook = xlrd.open_workbook(self._file, on_demand=True)
+        elif isinstance(self._file, BYTES_TYPES):
+            self._workbook = xlrd.open_workbook(
+                file_contents=bytes(self._file), on_demand=True
+            )
         else:
-            self._workbook = xlrd.open_workbook(file_contents=self._file.read())
+            self._workbook = xlrd.open_workbook(
+                file_contents=self._file.read(), on_demand=True
+            )
 
+    def _list_sheets(self):
+        return self._workbook.sheet_names()
 
-    def _parse(self):
-        for sheet in self._workbook.sheets():
-            sheet: XlrdSheet
-            ws = Sheet(sheet.name)
+    def _iter_rows(self, index: int):
+        sheet: XlrdSheet = self._workbook.sheet_by_index(index)
+        try:
+            for i in range(sheet.nrows):
+                yield sheet.row_values(i)
+        finally:
+            self._workbook.unload_sheet(index)
+
+    def _iter_projected(self, index: int, columns: list[int]):
+        sheet: XlrdSheet = self._workbook.sheet_by_index(index)
+        first = columns[0]
+        offsets = [c - first for c in columns]
+        try:
             for i in range(sheet.nrows):
-                ws.set_row(i, sheet.row_values(i))
-            self.sheets.append(ws)
-            self.sheet_names.append(ws.name)
+                # Only the cells between the first and the last column are copied.
+                values = sheet.row_values(i, first, columns[-1] + 1)
+                if len(values) > offsets[-1]:
+                    yield [values[c] for c in offsets]
+                else:
+                    yield [values[c] if c < len(values) else "" for c in offsets]
+        finally:
+            self._workbook.unload_sheet(index)
+
+    def _close(self):
+        self._workbook.release_resources()
 
 
 class XlsxioReader(BaseReader):
-    _workbook: xlsxio.XlsxioReader
+    _workbook: "xlsxio.XlsxioReader"
     __engine__ = "python-xlsxio"
+    __requires__ = ("xlsxio",)
 
     def _setup(self):
+        import xlsxio
+
         if isinstance(self._file, (str, bytes)):
             self._workbook = xlsxio.XlsxioReader(self._file)
+        elif isinstance(self._file, BYTES_TYPES):
+            self._workbook = xlsxio.XlsxioReader(bytes(self._file))
         else:
             self._workbook = xlsxio.XlsxioReader(self._file.read())
 
-    def _parse(self):
-        for name in self._workbook.get_sheet_names():
-            sheet = self._workbook.get_sheet(name)
-            ws = Sheet(name)
-            for i, row in enumerate(sheet.iter_rows()):
-                ws.set_row(i, row)
-            self.sheets.append(ws)
-            self.sheet_names.append(name)
+    def _list_sheets(self):
+        return self._workbook.get_sheet_names()
+
+    def _iter_rows(self, index: int):
+        sheet = self._workbook.get_sheet(self._list_sheets()[index])
+        try:
+            yield from sheet.iter_rows()
+        finally:
+            sheet.close()
+
+    def _close(self):
         self._workbook.close()
 
 # class SxlReader(ReadBook):
@@ -86,21 +176,21 @@ class XlsxioReader(BaseReader):
 #             self._datas[ws.name] = list(ws.rows)
 
 class SxlReader(BaseReader):
-    _workbook: sxl.Workbook
+    _workbook: "sxl.Workbook"
     __engine__ = "sxl"
+    __requires__ = ("sxl",)
 
     def _setup(self):
-        if isinstance(self._file, (str, io.IOBase)):
-            self._workbook = sxl.Workbook(self._file)
-        else:
+        import sxl
+
+        if isinstance(self._file, BYTES_TYPES):
             self._workbook = sxl.Workbook(io.BytesIO(self._file))
+        else:
+            self._workbook = sxl.Workbook(self._file)
 
+    def _list_sheets(self):
+        sheets = self._workbook.sheets
+        return [sheets[i].name for i in range(1, len(sheets) // 2 + 1)]
 
-    def _parse(self):
-        for i in range(1, len(self._workbook.sheets) // 2 + 1):
-            sheet = self._workbook.sheets[i]
-            ws = Sheet(sheet.name)
-            for j, row in enumerate(sheet.rows):
-                ws.set_row(j, row)
-            self.sheets.append(ws)
-            self.sheet_names.append(ws.name)
+    def _iter_rows(self, index: int):
+        return iter(self._workbook.sheets[index + 1].rows)
@@ -1,37 +1,145 @@
 import abc
 import io
-from typing import Union, Optional
+import time
+from typing import Any, Iterable, Optional, Sequence, Type, Union
 
 from PyAutoExcel.Deprecated import DeprecatedInfo
 from PyAutoExcel.Documents.File.Excel.Sheet import Sheet
+from PyAutoExcel.Grid import SheetGrid
+from PyAutoExcel.Tracing import Phase, file_size, report
+
+
+class RowStream:
+    """
+    A sheet whose rows are handed to the writer as they are appended.
+    Created by `BaseWriter.stream_sheet()`.
+
+    If the engine can stream, the rows are not kept in memory.
+    Otherwise, they are buffered in the sheet until the file is saved.
+
+    If the engine streams and a tracer is set, the time spent writing the rows
+    is reported as a 'write' phase of the sheet when it is closed.
+
+    :param writer: The writer the sheet belongs to.
+    :param name: The name of the sheet.
+    """
+
+    def __init__(self, writer: "BaseWriter", name: str):
+        self.name = name
+        self.nrows = 0
+        self.sheet = Sheet(name, writer.grid_class)
+        self._writer = writer
+        self._closed = False
+        self._handle = writer._add_sheet(name) if writer.streaming() else None
+        self._phase = Phase(writer.__engine__, "write", sheet=name)
+        if self._phase.active and self._handle is not None:
+            self._phase.event.cells = 0
+        else:
+            self._phase = None
+
+    def append(self, row: Sequence[Any]):
+        """
+        Appends a row below the last one.
+
+        :param row: The values of the row.
+        :type row: Sequence[Any]
+        """
+        if self._closed:
+            raise ValueError(f"Sheet {self.name!r} is already closed.")
+        if self._handle is None:
+            self.sheet.set_row(self.nrows, row)
+        elif self._phase is None:
+            self._writer._append_row(self._handle, self.nrows, row)
+        else:
+            start = time.perf_counter()
+            self._writer._append_row(self._handle, self.nrows, row)
+            self._phase.event.seconds += time.perf_counter() - start
+            self._phase.event.cells += len(row)
+        self.nrows += 1
+
+    def extend(self, rows: Iterable[Sequence[Any]]):
+        """
+        Appends every row of an iterable.
+
+        :param rows: The rows to append.
+        :type rows: Iterable[Sequence[Any]]
+        """
+        for row in rows:
+            self.append(row)
+
+    def close(self):
+        """
+        Closes the sheet, no more rows can be appended.
+        """
+        if not self._closed and self._phase is not None:
+            self._phase.event.rows = self.nrows
+            report(self._phase.tracer, self._phase.event)
+        self._closed = True
+
+    def __repr__(self):
+        return f"<RowStream {self.name!r}, {self.nrows} rows>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 class BaseWriter(abc.ABC):
     """
     Base class for Excel writers.
 
+    :param grid_class: The grid class of the sheets buffered by `stream_sheet()`. Default to DenseGrid.
 
     Subclasses must implement the following methods:
 
     - `_setup()`: Set up the writer.
-    - `_write()`: Writing data.
+    - `_add_sheet()`: Add an empty worksheet to the workbook and return it.
+    - `_append_row()`: Write a row at the bottom of a worksheet.
     - `_output()`: Export the file.
 
+    Subclasses which cannot write a sheet row by row may implement `_write()` instead,
+    streamed sheets are then buffered in memory until the file is saved.
+
     Subclasses must also set the following class variables:
 
     - `__engine__`: The name of the engine used by the reader.
 
-    Subclasses may also set the following class variable:
+    Subclasses may also set the following class variables:
 
     - `__deprecated__`: A DeprecatedInfo object containing information about the reader's deprecation.
+    - `__formats__`: The formats of the files the engine can write. Default to xlsx.
+    - `__requires__`: The modules the engine imports, to know if it is installed without importing them.
+    - `__features__`: The optional features of the engine: 'dates' if it writes date cells,
+      'formatting' if its library writes cell formats.
+    - `__append_only__`: True if `_append_row()` ignores the row index,
+      empty rows are then written to fill the gaps between the rows of sparse sheets.
+
+    The setup, the writing of the sheets and the export of the file are reported
+    to the tracer of the context (see `PyAutoExcel.Tracing`).
     """
     __engine__ = ""
     __deprecated__ = DeprecatedInfo()
+    __formats__ = ("xlsx",)
+    __requires__ = ()
+    __features__ = frozenset()
+    __append_only__ = False
 
-    def __init__(self):
+    def __init__(self, grid_class: Optional[Type[SheetGrid]] = None):
+        self.grid_class = grid_class
         self._sheets: list[Sheet] = []
+        self._written: dict[int, Sheet] = {}
         self._workbook = None
-        self._setup()
+        with Phase(self.__engine__, "setup"):
+            self._setup()
+
+    @classmethod
+    def streaming(cls) -> bool:
+        """
+        Return True if the engine can write the rows of a sheet as they arrive.
+        """
+        return cls._append_row is not BaseWriter._append_row
 
     @abc.abstractmethod
     def _setup(self):
@@ -40,12 +148,45 @@ class BaseWriter(abc.ABC):
         """
         raise NotImplementedError
 
-    @abc.abstractmethod
+    def _add_sheet(self, name: str):
+        """
+        Add an empty worksheet to the workbook and return it.
+        """
+        raise NotImplementedError
+
+    def _append_row(self, ws, index: int, row: Sequence[Any]):
+        """
+        Write the row at the given index, below the rows already written to the worksheet.
+        """
+        raise NotImplementedError
+
+    def _flush(self):
+        """
+        Write the sheets which are not written yet, as a traced phase.
+        """
+        with Phase(self.__engine__, "write") as phase:
+            if phase.active:
+                pending = [s for s in self._sheets if id(s) not in self._written]
+                phase.event.rows = sum(s.nrows() for s in pending)
+                phase.event.cells = sum(s.nrows() * s.ncols() for s in pending)
+            self._write()
+
     def _write(self):
         """
         Writing data.
         """
-        raise NotImplementedError
+        for s in self._sheets:
+            if id(s) in self._written:
+                continue
+            ws = self._add_sheet(s.name)
+            last = -1
+            for i, row in s.iter_populated_rows():
+                if self.__append_only__:
+                    for gap in range(last + 1, i):
+                        self._append_row(ws, gap, [])
+                last = i
+                self._append_row(ws, i, row)
+            self._written[id(s)] = s
 
     @abc.abstractmethod
     def _output(self, file: Union[str, io.IOBase]):
@@ -64,13 +205,58 @@ class BaseWriter(abc.ABC):
         :return: If param 'saver' is None, return the content as bytes.
                  Otherwise, return None.
         """
-        self._write()
-        if saver is None:
-            stream = io.BytesIO()
-            self._output(stream)
-            return stream.getvalue()
-        else:
+        self._flush()
+        with Phase(self.__engine__, "output", saver) as phase:
+            if saver is None:
+                stream = io.BytesIO()
+                self._output(stream)
+                content = stream.getvalue()
+                if phase.active:
+                    phase.event.bytes_out = len(content)
+                return content
+            start = saver.tell() if phase.active and not isinstance(saver, str) and saver.seekable() else None
             self._output(saver)
+            if phase.active:
+                if isinstance(saver, str):
+                    phase.event.bytes_out = file_size(saver)
+                elif start is not None:
+                    phase.event.bytes_out = saver.tell() - start
+
+    def stream_sheet(self, name: str) -> RowStream:
+        """
+        Adds a sheet at the end of the workbook and returns it for appending rows.
+        The rows are written as they arrive, so the memory used does not grow with the sheet.
+
+        The sheets added so far are written first, to keep the order of the sheets.
+        The streamed sheet stays empty in `sheets`.
+
+        :param name: The name of the sheet.
+        :type name: str
+        :return: The sheet to append rows to.
+        :rtype: RowStream
+        """
+        if self.streaming():
+            self._flush()
+        stream = RowStream(self, name)
+        self._sheets.append(stream.sheet)
+        if self.streaming():
+            self._written[id(stream.sheet)] = stream.sheet
+        return stream
+
+    def write_rows(self, name: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Adds a sheet at the end of the workbook and writes the rows of an iterable to it.
+
+        :param name: The name of the sheet.
+        :type name: str
+        :param rows: The rows to write, e.g. a generator.
+        :type rows: Iterable[Sequence[Any]]
+        :return: The number of rows written.
+        :rtype: int
+        """
+        with self.stream_sheet(name) as stream:
+            stream.extend(rows)
+        return stream.nrows
 
     @property
     def sheets(self) -> list[Sheet]:
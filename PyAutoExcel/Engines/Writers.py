@@ -1,26 +1,50 @@
+import datetime
 import io
-from typing import Union
-
-import openpyxl
-import xlsxwriter
-import xlwt
-from xlsxcessive import workbook, xlsx
-from xlsxlite.writer import XLSXBook
+from typing import TYPE_CHECKING, Union
 
 from .WriterBase import BaseWriter
+from .XlsxBuilder import XlsxBuilder, to_excel
+
+# The number format of the datetime cells, for the libraries without a default one.
+DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+DATE_FORMAT = "yyyy-mm-dd"
+
+if TYPE_CHECKING:
+    # Each engine imports its library in _setup(), so only the libraries in use are loaded.
+    import openpyxl
+    import xlsxwriter
+    import xlwt
+    from xlsxcessive import workbook
+    from xlsxlite.writer import XLSXBook
+
+
+def _xlsxlite_value(value):
+    """
+    Convert the values xlsxlite does not support: it writes every value of a row in turn,
+    so an empty cell is an empty string, and it only writes datetimes, not dates.
+    """
+    if value is None:
+        return ""
+    if type(value) is datetime.date:
+        return datetime.datetime(value.year, value.month, value.day)
+    return value
 
 
 class XlsxLiteWriter(BaseWriter):
     __engine__ = "xlsxlite"
-    _workbook: XLSXBook
+    __requires__ = ("xlsxlite",)
+    __append_only__ = True
+    _workbook: "XLSXBook"
     def _setup(self):
+        from xlsxlite.writer import XLSXBook
+
         self._workbook = XLSXBook()
 
-    def _write(self):
-        for s in self.sheets:
-            ws = self._workbook.add_sheet(name=s.name)
-            for row in s.data:
-                ws.append_row(*row)
+    def _add_sheet(self, name: str):
+        return self._workbook.add_sheet(name=name)
+
+    def _append_row(self, ws, index: int, row):
+        ws.append_row(*map(_xlsxlite_value, row))
 
     def _output(self, file: Union[str, io.IOBase]):
         self._workbook.finalize(to_file=file, remove_dir=True)
@@ -29,22 +53,41 @@ class XlsxLiteWriter(BaseWriter):
 
 class XlsxCessiveWriter(BaseWriter):
     __engine__ = "xlsxcessive"
-    _workbook: workbook.Workbook
+    __requires__ = ("xlsxcessive",)
+    _workbook: "workbook.Workbook"
 
     def _setup(self):
+        from xlsxcessive import workbook
+
         self._workbook = workbook.Workbook()
 
-    def _write(self):
-        for s in self.sheets:
-            ws = self._workbook.new_sheet(name=s.name)
-            for i, row in enumerate(s.data):
-                for j, value in enumerate(row):
-                    ws.cell(coords=(i, j), value=value)
+    def _add_sheet(self, name: str):
+        return self._workbook.new_sheet(name=name)
+
+    def _append_row(self, ws, index: int, row):
+        for j, value in enumerate(row):
+            if value is None or value != value:  # None or NaN.
+                continue
+            if isinstance(value, bool):
+                # xlsxcessive has no boolean cells, and would write True as a number.
+                ws.cell(coords=(index, j), value=int(value))
+            elif isinstance(value, datetime.datetime):
+                # xlsxcessive cannot serialize datetimes, they are written as serial numbers.
+                ws.cell(
+                    coords=(index, j),
+                    value=to_excel(value),
+                    format=self._workbook.stylesheet.default_datetime_format,
+                )
+            else:
+                ws.cell(coords=(index, j), value=value)
 
     def _output(self, file: Union[str, io.IOBase]):
+        from xlsxcessive import xlsx
+
         if isinstance(file, io.IOBase):
             xlsx.save(workbook=self._workbook, filename="", stream=file)
-        xlsx.save(workbook=self._workbook, filename=file)
+        else:
+            xlsx.save(workbook=self._workbook, filename=file)
 
 
 # class XlwtWriter(WriteBook):
@@ -63,17 +106,29 @@ class XlsxCessiveWriter(BaseWriter):
 
 class XlwtWriter(BaseWriter):
     __engine__ = 'xlwt'
-    _workbook: xlwt.Workbook
+    __requires__ = ("xlwt",)
+    __features__ = frozenset({"dates", "formatting"})
+    __formats__ = ("xls",)
+    _workbook: "xlwt.Workbook"
 
     def _setup(self):
+        import xlwt
+
         self._workbook = xlwt.Workbook(encoding="utf-8")
+        self._datetime_style = xlwt.easyxf(num_format_str=DATETIME_FORMAT)
+        self._date_style = xlwt.easyxf(num_format_str=DATE_FORMAT)
+
+    def _add_sheet(self, name: str):
+        return self._workbook.add_sheet(sheetname=name, cell_overwrite_ok=True)
 
-    def _write(self):
-        for s in self.sheets:
-            ws: xlwt.Worksheet = self._workbook.add_sheet(sheetname=s.name, cell_overwrite_ok=True)
-            for i, row in enumerate(s.data):
-                for j, col in enumerate(row):
-                    ws.write(i, j, col)
+    def _append_row(self, ws: "xlwt.Worksheet", index: int, row):
+        for j, col in enumerate(row):
+            if isinstance(col, datetime.datetime):
+                ws.write(index, j, col, self._datetime_style)
+            elif isinstance(col, datetime.date):
+                ws.write(index, j, col, self._date_style)
+            else:
+                ws.write(index, j, col)
 
     def _output(self, file: Union[str, io.IOBase]):
         self._workbook.save(file)
@@ -81,16 +136,21 @@ class XlwtWriter(BaseWriter):
 
 class OpenpyxlWriter(BaseWriter):
     __engine__ = "openpyxl"
-    _workbook: openpyxl.Workbook
+    __requires__ = ("openpyxl",)
+    __features__ = frozenset({"dates", "formatting"})
+    __append_only__ = True
+    _workbook: "openpyxl.Workbook"
 
     def _setup(self):
+        import openpyxl
+
         self._workbook = openpyxl.Workbook(write_only=True)
 
-    def _write(self):
-        for s in self.sheets:
-            ws = self._workbook.create_sheet(s.name)
-            for row in s.data:
-                ws.append(row)
+    def _add_sheet(self, name: str):
+        return self._workbook.create_sheet(name)
+
+    def _append_row(self, ws, index: int, row):
+        ws.append(row)
 
     def _output(self, file: Union[str, io.IOBase]):
         self._workbook.save(file)
@@ -98,20 +158,55 @@ class OpenpyxlWriter(BaseWriter):
 
 class XlsxWriterWriter(BaseWriter):
     __engine__ = "xlsxwriter"
-    _workbook: xlsxwriter.Workbook
+    __requires__ = ("xlsxwriter",)
+    __features__ = frozenset({"dates", "formatting"})
+    _workbook: "xlsxwriter.Workbook"
 
     def _setup(self):
-        self._workbook = xlsxwriter.Workbook(filename="")
+        import xlsxwriter
+
+        # Rows are always written in order, so each one can be flushed to a temporary file.
+        self._workbook = xlsxwriter.Workbook(
+            filename="", options={"constant_memory": True, "default_date_format": DATETIME_FORMAT}
+        )
         self._workbook.allow_zip64 = True
 
-    def _write(self):
-        for s in self.sheets:
-            ws = self._workbook.add_worksheet(name=s.name)
-            for i, row in enumerate(s.data):
-                ws.write_row(i, 0, row)
+    def _add_sheet(self, name: str):
+        return self._workbook.add_worksheet(name=name)
 
+    def _append_row(self, ws, index: int, row):
+        ws.write_row(index, 0, row)
 
     def _output(self, file: Union[str, io.IOBase]):
         self._workbook.filename = file
         self._workbook.close()
 
+
+class NativeWriter(BaseWriter):
+    """
+    Values-only xlsx writer emitting the SpreadsheetML parts directly into a zip file.
+    Strings starting with '=' are written as formulas.
+
+    Set `shared_strings` to False in a subclass to write strings inline in the cells,
+    which keeps the memory constant when most strings are unique.
+    """
+
+    __engine__ = "native"
+    __features__ = frozenset({"dates"})
+    shared_strings = True
+    _workbook: XlsxBuilder
+
+    def _setup(self):
+        self._workbook = XlsxBuilder(shared_strings=self.shared_strings)
+
+    def _add_sheet(self, name: str):
+        return self._workbook.add_sheet(name)
+
+    def _append_row(self, ws, index: int, row):
+        ws.append_row(index, row)
+
+    def _output(self, file: Union[str, io.IOBase]):
+        try:
+            self._workbook.save(file)
+        finally:
+            self._workbook.close()
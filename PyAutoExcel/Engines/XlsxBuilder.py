@@ -0,0 +1,426 @@
+"""
+A values-only writer of xlsx packages, built on zipfile.
+
+It writes the SpreadsheetML parts directly from the values,
+without building a workbook object graph.
+"""
+import datetime
+import io
+import math
+import numbers
+import re
+import tempfile
+import zipfile
+from typing import Any, Sequence, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from .XlsxParser import MAIN_NS, PKG_REL_NS, DOC_REL_NS, WINDOWS_EPOCH, SECS_PER_DAY
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml."
+
+# Index of the cell format of each temporal type in STYLES.
+DATETIME_STYLE = 1
+DATE_STYLE = 2
+TIME_STYLE = 3
+TIMEDELTA_STYLE = 4
+
+STYLES = (
+    XML_HEADER + f'<styleSheet xmlns="{MAIN_NS}">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy\\-mm\\-dd\\ hh:mm:ss"/></numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/><family val="2"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="21" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="46" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+# Characters which are not allowed in XML 1.0, written with the escape used by Excel.
+ILLEGAL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]|_(?=x[0-9A-Fa-f]{4}_)")
+
+MAX_ROWS = 1048576
+MAX_COLS = 16384
+SPOOL_SIZE = 1 << 22
+
+
+def column_letter(index: int) -> str:
+    """
+    Convert a 1-based column index to column letters.
+
+    :param index: The column index, e.g. 1 for 'A'.
+    :type index: int
+    :rtype: str
+    """
+    letters = ""
+    while index > 0:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def to_excel(
+    value: Union[datetime.datetime, datetime.date, datetime.time, datetime.timedelta]
+) -> float:
+    """
+    Convert a datetime, a date, a time or a timedelta to an Excel serial number.
+
+    :param value: The value to convert.
+    :rtype: float
+    """
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds() / SECS_PER_DAY
+    if isinstance(value, datetime.time):
+        return (
+            value.hour * 3600
+            + value.minute * 60
+            + value.second
+            + value.microsecond / 1e6
+        ) / SECS_PER_DAY
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime(value.year, value.month, value.day)
+    delta = value.replace(tzinfo=None) - WINDOWS_EPOCH
+    serial = (
+        delta.days
+        + delta.seconds / SECS_PER_DAY
+        + delta.microseconds / (SECS_PER_DAY * 1e6)
+    )
+    # Excel counts the non-existent 1900-02-29.
+    if 0 < serial < 61:
+        serial -= 1
+    return serial
+
+
+def escape_text(text: str) -> str:
+    """
+    Escape a string for the text of an element.
+
+    :param text: The string to escape.
+    :type text: str
+    :rtype: str
+    """
+    text = escape(text)
+    if ILLEGAL_RE.search(text):
+        text = ILLEGAL_RE.sub(
+            lambda m: "_x005F_" if m.group() == "_" else f"_x{ord(m.group()):04X}_",
+            text,
+        )
+    return text
+
+
+def _number(value) -> str:
+    if value != value or value in (math.inf, -math.inf):
+        raise ValueError(f"Cannot write {value!r} to a cell.")
+    return repr(value) if type(value) is float else str(value)
+
+
+def _is_numpy_bool(value) -> bool:
+    t = type(value)
+    return t.__module__ == "numpy" and t.__name__ in ("bool_", "bool")
+
+
+class SheetBuilder:
+    """
+    The cells of a worksheet, serialized row by row into a temporary file.
+
+    :param builder: The package the sheet belongs to.
+    :param name: The name of the sheet.
+    """
+
+    def __init__(self, builder: "XlsxBuilder", name: str):
+        self.name = name
+        self.nrows = 0
+        self.ncols = 0
+        self._builder = builder
+        self._last_row = -1
+        self._pending: list[str] = []
+        self._body = tempfile.SpooledTemporaryFile(
+            SPOOL_SIZE, "w+", encoding="utf-8", newline=""
+        )
+
+    def append_row(self, index: int, row: Sequence[Any]):
+        """
+        Write a row below the rows already written.
+
+        :param index: The 0-based index of the row.
+        :type index: int
+        :param row: The values of the row, None and "" leave a cell empty.
+        :type row: Sequence[Any]
+        """
+        if index <= self._last_row:
+            raise ValueError(
+                f"Row {index} of sheet {self.name!r} must be written after row {self._last_row}."
+            )
+        if index >= MAX_ROWS or len(row) > MAX_COLS:
+            raise ValueError(
+                f"Row {index} of sheet {self.name!r} is out of the worksheet bounds."
+            )
+        letters = self._builder.letters
+        while len(letters) < len(row):
+            letters.append(column_letter(len(letters) + 1))
+        strings = self._builder.strings
+        r = str(index + 1)
+        parts = [f'<row r="{r}">']
+        for j, value in enumerate(row):
+            if value is None:
+                continue
+            t = type(value)
+            if t is str:
+                if not value:
+                    continue
+                if value[:1] == "=" and len(value) > 1:
+                    parts.append(
+                        f'<c r="{letters[j]}{r}"><f>{escape_text(value[1:])}</f></c>'
+                    )
+                elif strings is None:
+                    parts.append(
+                        f'<c r="{letters[j]}{r}" t="inlineStr"><is><t xml:space="preserve">'
+                        f"{escape_text(value)}</t></is></c>"
+                    )
+                else:
+                    idx = strings.get(value)
+                    if idx is None:
+                        idx = strings[value] = len(strings)
+                    parts.append(f'<c r="{letters[j]}{r}" t="s"><v>{idx}</v></c>')
+                    self._builder.nstrings += 1
+            elif t is int:
+                parts.append(f'<c r="{letters[j]}{r}"><v>{value}</v></c>')
+            elif t is float and value - value == 0:  # Finite.
+                parts.append(f'<c r="{letters[j]}{r}"><v>{repr(value)}</v></c>')
+            elif t is bool:
+                parts.append(f'<c r="{letters[j]}{r}" t="b"><v>{int(value)}</v></c>')
+            else:
+                cell = self._cell(f"{letters[j]}{r}", value)
+                if cell:
+                    parts.append(cell)
+        if len(parts) == 1:
+            return
+        parts.append("</row>")
+        self._pending.append("".join(parts))
+        if len(self._pending) >= 1024:
+            self._flush()
+        self._last_row = index
+        self.nrows = index + 1
+        self.ncols = max(self.ncols, len(row))
+
+    def _flush(self):
+        self._body.write("".join(self._pending))
+        self._pending.clear()
+
+    def _cell(self, ref: str, value) -> str:
+        """
+        Serialize a cell whose value is not a str, an int, a finite float or a bool.
+        NumPy scalars are written as the numbers and booleans they hold. NaN leaves the cell
+        empty, and an infinity is written as the error #NUM!, Excel has no such numbers.
+
+        :return: The cell, or "" to leave the cell empty.
+        """
+        if isinstance(value, bool) or _is_numpy_bool(value):
+            return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+        if isinstance(value, datetime.datetime):
+            style = DATETIME_STYLE
+        elif isinstance(value, datetime.date):
+            style = DATE_STYLE
+        elif isinstance(value, datetime.time):
+            style = TIME_STYLE
+        elif isinstance(value, datetime.timedelta):
+            style = TIMEDELTA_STYLE
+        elif isinstance(value, numbers.Integral):
+            return f'<c r="{ref}"><v>{int(value)}</v></c>'
+        elif isinstance(value, numbers.Real):
+            value = float(value)
+            if value != value:
+                return ""
+            if value in (math.inf, -math.inf):
+                return f'<c r="{ref}" t="e"><v>#NUM!</v></c>'
+            return f'<c r="{ref}"><v>{repr(value)}</v></c>'
+        else:
+            return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{escape_text(str(value))}</t></is></c>'
+        return f'<c r="{ref}" s="{style}"><v>{_number(to_excel(value))}</v></c>'
+
+    def write_to(self, zf: zipfile.ZipFile, path: str):
+        """
+        Write the worksheet part into the package.
+
+        :param zf: The package.
+        :param path: The path of the part.
+        """
+        if self.nrows:
+            dimension = f"A1:{column_letter(max(self.ncols, 1))}{self.nrows}"
+        else:
+            dimension = "A1"
+        with zf.open(path, "w", force_zip64=True) as part:
+            out = io.TextIOWrapper(part, encoding="utf-8", newline="")
+            out.write(
+                f'{XML_HEADER}<worksheet xmlns="{MAIN_NS}" xmlns:r="{DOC_REL_NS}">'
+                f'<dimension ref="{dimension}"/><sheetData>'
+            )
+            self._flush()
+            self._body.seek(0)
+            while True:
+                chunk = self._body.read(SPOOL_SIZE)
+                if not chunk:
+                    break
+                out.write(chunk)
+            self._body.seek(0, io.SEEK_END)
+            out.write("</sheetData></worksheet>")
+            out.flush()
+            out.detach()
+
+    def close(self):
+        """
+        Delete the temporary file of the rows.
+        """
+        self._body.close()
+
+
+class XlsxBuilder:
+    """
+    An xlsx package being written.
+
+    The rows of each sheet are kept in a temporary file until the package is saved,
+    so the memory used does not grow with the number of rows.
+    Call `close()` to delete the temporary files once the package is saved.
+
+    :param shared_strings: Whether strings are stored once in a shared string table,
+                           or written inline in the cells.
+    :type shared_strings: bool
+    """
+
+    def __init__(self, shared_strings: bool = True):
+        self.sheets: list[SheetBuilder] = []
+        self.strings: dict[str, int] = {} if shared_strings else None
+        self.nstrings = 0
+        self.letters: list[str] = []
+
+    def add_sheet(self, name: str) -> SheetBuilder:
+        """
+        Add an empty worksheet at the end of the workbook.
+
+        :param name: The name of the sheet.
+        :type name: str
+        :rtype: SheetBuilder
+        """
+        if not name or len(name) > 31 or any(ch in name for ch in "[]:*?/\\"):
+            raise ValueError(f"Invalid sheet name {name!r}.")
+        if any(s.name.lower() == name.lower() for s in self.sheets):
+            raise ValueError(f"Sheet {name!r} already exists.")
+        sheet = SheetBuilder(self, name)
+        self.sheets.append(sheet)
+        return sheet
+
+    def save(self, file: Union[str, io.IOBase]):
+        """
+        Write the package to a path or a binary stream.
+
+        :param file: The path or the stream to write to.
+        :type file: Union[str, io.IOBase]
+        """
+        if not self.sheets:
+            self.add_sheet("Sheet1")
+        sheets = self.sheets
+        has_strings = bool(self.strings)
+        with zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+            zf.writestr(
+                "[Content_Types].xml", self._content_types(len(sheets), has_strings)
+            )
+            zf.writestr(
+                "_rels/.rels",
+                f'{XML_HEADER}<Relationships xmlns="{PKG_REL_NS}">'
+                f'<Relationship Id="rId1" Type="{REL_TYPE}officeDocument" Target="xl/workbook.xml"/>'
+                "</Relationships>",
+            )
+            zf.writestr("xl/workbook.xml", self._workbook(sheets))
+            zf.writestr(
+                "xl/_rels/workbook.xml.rels",
+                self._workbook_rels(len(sheets), has_strings),
+            )
+            zf.writestr("xl/styles.xml", STYLES)
+            if has_strings:
+                self._write_strings(zf)
+            for i, sheet in enumerate(sheets, 1):
+                sheet.write_to(zf, f"xl/worksheets/sheet{i}.xml")
+
+    def close(self):
+        """
+        Delete the temporary files of the sheets.
+        """
+        for sheet in self.sheets:
+            sheet.close()
+
+    @staticmethod
+    def _content_types(nsheets: int, has_strings: bool) -> str:
+        parts = [
+            f'{XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{CONTENT_TYPE}sheet.main+xml"/>'
+            f'<Override PartName="/xl/styles.xml" ContentType="{CONTENT_TYPE}styles+xml"/>'
+        ]
+        if has_strings:
+            parts.append(
+                f'<Override PartName="/xl/sharedStrings.xml" ContentType="{CONTENT_TYPE}sharedStrings+xml"/>'
+            )
+        for i in range(1, nsheets + 1):
+            parts.append(
+                f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="{CONTENT_TYPE}worksheet+xml"/>'
+            )
+        parts.append("</Types>")
+        return "".join(parts)
+
+    @staticmethod
+    def _workbook(sheets: list[SheetBuilder]) -> str:
+        parts = [
+            f'{XML_HEADER}<workbook xmlns="{MAIN_NS}" xmlns:r="{DOC_REL_NS}"><sheets>'
+        ]
+        for i, sheet in enumerate(sheets, 1):
+            parts.append(
+                f'<sheet name={quoteattr(sheet.name)} sheetId="{i}" r:id="rId{i}"/>'
+            )
+        parts.append("</sheets></workbook>")
+        return "".join(parts)
+
+    @staticmethod
+    def _workbook_rels(nsheets: int, has_strings: bool) -> str:
+        parts = [f'{XML_HEADER}<Relationships xmlns="{PKG_REL_NS}">']
+        for i in range(1, nsheets + 1):
+            parts.append(
+                f'<Relationship Id="rId{i}" Type="{REL_TYPE}worksheet" Target="worksheets/sheet{i}.xml"/>'
+            )
+        parts.append(
+            f'<Relationship Id="rId{nsheets + 1}" Type="{REL_TYPE}styles" Target="styles.xml"/>'
+        )
+        if has_strings:
+            parts.append(
+                f'<Relationship Id="rId{nsheets + 2}" Type="{REL_TYPE}sharedStrings" Target="sharedStrings.xml"/>'
+            )
+        parts.append("</Relationships>")
+        return "".join(parts)
+
+    def _write_strings(self, zf: zipfile.ZipFile):
+        with zf.open("xl/sharedStrings.xml", "w", force_zip64=True) as part:
+            out = io.TextIOWrapper(part, encoding="utf-8", newline="")
+            out.write(
+                f'{XML_HEADER}<sst xmlns="{MAIN_NS}" count="{self.nstrings}" uniqueCount="{len(self.strings)}">'
+            )
+            buffer = []
+            for text in self.strings:
+                buffer.append(
+                    f'<si><t xml:space="preserve">{escape_text(text)}</t></si>'
+                )
+                if len(buffer) >= 4096:
+                    out.write("".join(buffer))
+                    buffer.clear()
+            buffer.append("</sst>")
+            out.write("".join(buffer))
+            out.flush()
+            out.detach()
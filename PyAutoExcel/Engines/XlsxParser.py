@@ -0,0 +1,611 @@
+"""
+A values-only parser of xlsx packages, built on zipfile and expat.
+
+It yields the same values as openpyxl in read-only mode,
+but never creates cell objects.
+"""
+import datetime
+import io
+import posixpath
+import re
+import zipfile
+from typing import Container, Iterator, Optional, Union
+from xml.etree import ElementTree
+from xml.parsers import expat
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+STRICT_NS = "http://purl.oclc.org/ooxml/spreadsheetml/main"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+STRICT_DOC_REL_NS = "http://purl.oclc.org/ooxml/officeDocument/relationships"
+
+WINDOWS_EPOCH = datetime.datetime(1899, 12, 30)
+MAC_EPOCH = datetime.datetime(1904, 1, 1)
+SECS_PER_DAY = 86400
+
+# Built-in number formats which are dates or durations.
+BUILTIN_DATE_FORMATS = {14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47}
+BUILTIN_TIMEDELTA_FORMATS = {46}
+STRIP_RE = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+DATE_RE = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+TIMEDELTA_RE = re.compile(
+    r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?", re.I
+)
+ISO_RE = re.compile(
+    r"(?P<date>(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2}))?T?"
+    r"(?P<time>(?P<hour>\d{2}):(?P<minute>\d{2})"
+    r"(:(?P<second>\d{2})(?P<microsecond>\.\d{1,3})?)?)?Z?"
+)
+
+DIGITS = "0123456789"
+CHUNK_SIZE = 1 << 16
+
+
+def is_date_format(fmt: Optional[str]) -> bool:
+    """
+    Return True if the number format displays a date or a time.
+
+    :param fmt: The number format code.
+    :type fmt: Optional[str]
+    :rtype: bool
+    """
+    if fmt is None:
+        return False
+    fmt = STRIP_RE.sub("", fmt.split(";")[0])
+    return DATE_RE.search(fmt) is not None
+
+
+def is_timedelta_format(fmt: Optional[str]) -> bool:
+    """
+    Return True if the number format displays a duration.
+
+    :param fmt: The number format code.
+    :type fmt: Optional[str]
+    :rtype: bool
+    """
+    if fmt is None:
+        return False
+    return TIMEDELTA_RE.search(fmt.split(";")[0]) is not None
+
+
+def from_excel(value: float, epoch: datetime.datetime, timedelta: bool = False):
+    """
+    Convert an Excel serial number to a datetime, a time or a timedelta.
+
+    :param value: The serial number.
+    :param epoch: The epoch of the workbook.
+    :param timedelta: Whether the value is a duration.
+    """
+    if timedelta:
+        td = datetime.timedelta(days=value)
+        if td.microseconds:
+            td = datetime.timedelta(
+                seconds=td.total_seconds() // 1,
+                microseconds=round(td.microseconds, -3),
+            )
+        return td
+    day, fraction = divmod(value, 1)
+    diff = datetime.timedelta(milliseconds=round(fraction * SECS_PER_DAY * 1000))
+    if 0 <= value < 1 and diff.days == 0:
+        minutes, seconds = divmod(diff.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return datetime.time(hours, minutes, seconds, diff.microseconds)
+    if 0 < value < 60 and epoch == WINDOWS_EPOCH:
+        day += 1
+    return epoch + datetime.timedelta(days=day) + diff
+
+
+def from_iso8601(text: str):
+    """
+    Convert an ISO 8601 string, used by cells of type 'd', to a datetime.
+
+    :param text: The ISO 8601 string.
+    :type text: str
+    """
+    if not text:
+        return None
+    match = ISO_RE.match(text)
+    if match and any(match.groups()):
+        parts = match.groupdict(0)
+        for key in ["year", "month", "day", "hour", "minute", "second"]:
+            if parts[key]:
+                parts[key] = int(parts[key])
+        if parts["microsecond"]:
+            parts["microsecond"] = int(float(parts["microsecond"]) * 1_000_000)
+        if not parts["date"]:
+            return datetime.time(
+                parts["hour"], parts["minute"], parts["second"], parts["microsecond"]
+            )
+        if not parts["time"]:
+            return datetime.date(parts["year"], parts["month"], parts["day"])
+        del parts["time"]
+        del parts["date"]
+        return datetime.datetime(**parts)
+    raise ValueError("Invalid datetime value {}".format(text))
+
+
+def column_index(letters: str) -> int:
+    """
+    Convert column letters to a 1-based column index.
+
+    :param letters: The column letters, e.g. 'A' or 'XFD'.
+    :type letters: str
+    :rtype: int
+    """
+    idx = 0
+    for ch in letters.upper():
+        idx = idx * 26 + ord(ch) - 64
+    return idx
+
+
+def split_ref(ref: str) -> Optional[tuple[int, int, int, int]]:
+    """
+    Split a range reference like 'A1:C3' into 1-based
+    (min_col, min_row, max_col, max_row).
+
+    :param ref: The range reference.
+    :type ref: str
+    :return: The boundaries, or None if the reference is not a complete range.
+    """
+    bounds = []
+    for coord in ref.replace("$", "").split(":"):
+        letters = coord.rstrip(DIGITS)
+        digits = coord[len(letters) :]
+        if not letters or not digits:
+            return None
+        bounds.append((column_index(letters), int(digits)))
+    if len(bounds) == 1:
+        bounds.append(bounds[0])
+    (min_col, min_row), (max_col, max_row) = bounds[:2]
+    return min_col, min_row, max_col, max_row
+
+
+class SheetPart:
+    """
+    A worksheet listed in the workbook.
+
+    :ivar name: The name of the worksheet.
+    :ivar path: The path of the worksheet part in the package.
+    :ivar state: The visibility of the worksheet,
+                 'visible', 'hidden' or 'veryHidden'.
+    """
+
+    def __init__(self, name: str, path: str, state: str):
+        self.name = name
+        self.path = path
+        self.state = state
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(name={self.name!r}, path={self.path!r}, state={self.state!r})"
+        )
+
+
+class XlsxPackage:
+    """
+    An opened xlsx package.
+
+    Shared strings and styles are loaded when the first sheet is parsed,
+    the sheets themselves are parsed incrementally while their rows are consumed.
+
+    :param file: The path, the content, or a binary stream of the file.
+    """
+
+    def __init__(self, file: Union[str, bytes, io.IOBase]):
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            file = io.BytesIO(file)
+        self._zip = zipfile.ZipFile(file)
+        self._ns = MAIN_NS
+        self._strings: Optional[list[str]] = None
+        self._date_styles: Optional[set[int]] = None
+        self._timedelta_styles: Optional[set[int]] = None
+        self._parts: dict[str, str] = {}
+        self.epoch = WINDOWS_EPOCH
+        self.sheets: list[SheetPart] = []
+        self._read_workbook()
+
+    def _read_rels(self, path: str) -> dict[str, tuple[str, str]]:
+        """
+        Read a relationship part.
+
+        :return: A dict of relationship id to (type, absolute target path).
+        """
+        folder = posixpath.dirname(posixpath.dirname(path))
+        try:
+            root = ElementTree.fromstring(self._zip.read(path))
+        except KeyError:
+            return {}
+        rels = {}
+        for rel in root.iter("{%s}Relationship" % PKG_REL_NS):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            rels[rel.get("Id")] = (rel.get("Type", ""), target)
+        return rels
+
+    def _read_workbook(self):
+        """
+        Read the sheet list, the epoch and the paths of the other parts.
+        """
+        workbook = "xl/workbook.xml"
+        for rel_type, target in self._read_rels("_rels/.rels").values():
+            if rel_type.endswith("/officeDocument"):
+                workbook = target
+        root = ElementTree.fromstring(self._zip.read(workbook))
+        self._ns = root.tag[1:].split("}")[0] if root.tag[0] == "{" else MAIN_NS
+        rel_ns = STRICT_DOC_REL_NS if self._ns == STRICT_NS else DOC_REL_NS
+
+        folder, name = posixpath.split(workbook)
+        rels = self._read_rels(posixpath.join(folder, "_rels", name + ".rels"))
+        for rel_type, target in rels.values():
+            self._parts[rel_type.rsplit("/", 1)[-1]] = target
+
+        pr = root.find("{%s}workbookPr" % self._ns)
+        if pr is not None and pr.get("date1904", "").lower() in ("1", "true"):
+            self.epoch = MAC_EPOCH
+
+        for sheet in root.iter("{%s}sheet" % self._ns):
+            rel_type, target = rels.get(sheet.get("{%s}id" % rel_ns), ("", ""))
+            if not rel_type.endswith("/worksheet"):
+                continue  # Chartsheets and dialogsheets have no cells.
+            self.sheets.append(
+                SheetPart(sheet.get("name"), target, sheet.get("state", "visible"))
+            )
+
+    def _read_strings(self) -> list[str]:
+        """
+        Read the shared string table, keeping the plain text only.
+        """
+        path = self._parts.get("sharedStrings")
+        if path is None or path not in self._zip.namelist():
+            return []
+        ns = self._ns + " "
+        si, t, rph = ns + "si", ns + "t", ns + "rPh"
+        strings = []
+        parts = []
+        state = [False, 0]  # In a <t> element, depth of <rPh> elements.
+
+        def start(tag, attrs):
+            if tag == t:
+                state[0] = state[1] == 0
+            elif tag == rph:
+                state[1] += 1
+
+        def end(tag):
+            if tag == t:
+                state[0] = False
+            elif tag == rph:
+                state[1] -= 1
+            elif tag == si:
+                strings.append("".join(parts).replace("x005F_", ""))
+                parts.clear()
+
+        def data(text):
+            if state[0]:
+                parts.append(text)
+
+        for _ in self._feed(path, start, end, data):
+            pass
+        return strings
+
+    def _read_styles(self):
+        """
+        Index the cell styles which display dates or durations.
+        """
+        self._date_styles = set()
+        self._timedelta_styles = set()
+        path = self._parts.get("styles")
+        if path is None or path not in self._zip.namelist():
+            return
+        root = ElementTree.fromstring(self._zip.read(path))
+        custom = {}
+        fmts = root.find("{%s}numFmts" % self._ns)
+        if fmts is not None:
+            for fmt in fmts:
+                custom[int(fmt.get("numFmtId"))] = fmt.get("formatCode")
+        xfs = root.find("{%s}cellXfs" % self._ns)
+        if xfs is None:
+            return
+        for idx, xf in enumerate(xfs.iter("{%s}xf" % self._ns)):
+            fmt_id = int(xf.get("numFmtId", 0))
+            if fmt_id in custom:
+                fmt = custom[fmt_id]
+                if is_date_format(fmt):
+                    self._date_styles.add(idx)
+                if is_timedelta_format(fmt):
+                    self._timedelta_styles.add(idx)
+            else:
+                if fmt_id in BUILTIN_DATE_FORMATS:
+                    self._date_styles.add(idx)
+                if fmt_id in BUILTIN_TIMEDELTA_FORMATS:
+                    self._timedelta_styles.add(idx)
+
+    def _feed(self, path: str, start, end, data, stop=None):
+        """
+        Parse a part with expat, chunk by chunk.
+
+        :param stop: A callable returning True when parsing should stop.
+        """
+        parser = expat.ParserCreate(namespace_separator=" ")
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        if end is not None:
+            parser.EndElementHandler = end
+        if data is not None:
+            parser.CharacterDataHandler = data
+        with self._zip.open(path) as src:
+            while True:
+                chunk = src.read(CHUNK_SIZE)
+                if not chunk:
+                    parser.Parse(b"", True)
+                    return
+                parser.Parse(chunk, False)
+                if stop is not None and stop():
+                    return
+                yield
+
+    def dimension(self, index: int) -> Optional[tuple[int, int, int, int]]:
+        """
+        Read the declared dimension of a sheet, without parsing its cells.
+
+        :param index: The index of the sheet.
+        :type index: int
+        :return: The 1-based (min_col, min_row, max_col, max_row), or None if not declared.
+        """
+        ns = self._ns + " "
+        dimension, sheet_data = ns + "dimension", ns + "sheetData"
+        found = [None, False]
+
+        def start(tag, attrs):
+            if tag == dimension:
+                found[0] = split_ref(attrs.get("ref", ""))
+                found[1] = True
+            elif tag == sheet_data:
+                found[1] = True
+
+        for _ in self._feed(
+            self.sheets[index].path, start, None, None, lambda: found[1]
+        ):
+            pass
+        return found[0]
+
+    def iter_cells(
+        self, index: int, selected: Optional[Container[int]] = None
+    ) -> Iterator[tuple[int, list]]:
+        """
+        Yield the rows of a sheet as they are stored in the file.
+
+        :param index: The index of the sheet.
+        :type index: int
+        :param selected: The 1-based indexes of the columns to read.
+                         The values of the other cells are not decoded,
+                         except for formulas which other cells may share.
+        :type selected: Optional[Container[int]]
+        :return: A generator of (row index, cells), row indexes are 1-based
+                 and each cell is a (column index, value) tuple.
+        """
+        if self._strings is None:
+            self._strings = self._read_strings()
+        if self._date_styles is None:
+            self._read_styles()
+        strings = self._strings
+        # Style ids are compared as strings, as they appear in the attributes.
+        date_styles = {str(i) for i in self._date_styles}
+        timedelta_styles = {str(i) for i in self._timedelta_styles}
+        epoch = self.epoch
+        columns = {}
+        shared_formulae = {}
+
+        ns = self._ns + " "
+        c_tag, v_tag, f_tag, is_tag = ns + "c", ns + "v", ns + "f", ns + "is"
+        t_tag, row_tag, rph_tag = ns + "t", ns + "row", ns + "rPh"
+
+        ready = []  # Rows completed in the current chunk.
+        cells = []
+        text = []  # Text of <v>, or of <t> in an inline string.
+        formula = []
+        row_idx = col_idx = 0
+        cell_attrs = formula_attrs = None
+        mode = 0  # Text being collected, 1: value, 2: inline string, 3: formula.
+        inline = False
+        phonetic = 0
+
+        def start(tag, attrs):
+            nonlocal row_idx, col_idx, cell_attrs, formula_attrs, mode, inline, phonetic
+            if tag == c_tag:
+                cell_attrs = attrs
+                formula_attrs = None
+                inline = False
+                text.clear()
+            elif tag == v_tag:
+                mode = 1
+            elif tag == row_tag:
+                r = attrs.get("r")
+                if r is None:
+                    row_idx += 1
+                else:
+                    try:
+                        row_idx = int(r)
+                    except ValueError:
+                        val = float(r)
+                        if not val.is_integer():
+                            raise ValueError(f"{r} is not a valid row number")
+                        row_idx = int(val)
+                col_idx = 0
+            elif tag == f_tag:
+                formula_attrs = attrs
+                mode = 3
+                formula.clear()
+            elif tag == is_tag:
+                inline = True
+                text.clear()
+            elif tag == t_tag:
+                if inline and not phonetic:
+                    mode = 2
+            elif tag == rph_tag:
+                phonetic += 1
+
+        def end(tag):
+            nonlocal col_idx, mode, phonetic
+            if tag == c_tag:
+                attrs = cell_attrs
+                ref = attrs.get("r")
+                if ref:
+                    letters = ref.rstrip(DIGITS)
+                    col_idx = columns.get(letters)
+                    if col_idx is None:
+                        col_idx = columns[letters] = column_index(letters)
+                else:
+                    col_idx += 1
+                if (
+                    selected is not None
+                    and col_idx not in selected
+                    and formula_attrs is None
+                ):
+                    return
+                kind = attrs.get("t", "n")
+                if kind == "inlineStr" or not text:
+                    value = None
+                else:
+                    value = text[0] if len(text) == 1 else "".join(text)
+                if formula_attrs is not None:
+                    value = _formula(
+                        formula_attrs, "".join(formula), ref, shared_formulae
+                    )
+                elif value:
+                    if kind == "n":
+                        if "." in value or "E" in value or "e" in value:
+                            value = float(value)
+                        else:
+                            value = int(value)
+                        style = attrs.get("s")
+                        if style in date_styles:
+                            try:
+                                value = from_excel(
+                                    value, epoch, style in timedelta_styles
+                                )
+                            except (OverflowError, ValueError):
+                                value = "#VALUE!"
+                    elif kind == "s":
+                        value = strings[int(value)]
+                    elif kind == "b":
+                        value = bool(int(value))
+                    elif kind == "d":
+                        value = from_iso8601(value)
+                elif kind == "inlineStr" and inline:
+                    value = "".join(text)
+                else:
+                    value = None
+                cells.append((col_idx, value))
+            elif tag == v_tag or tag == t_tag or tag == f_tag:
+                mode = 0
+            elif tag == row_tag:
+                ready.append((row_idx, cells.copy()))
+                cells.clear()
+            elif tag == rph_tag:
+                phonetic -= 1
+
+        def data(chunk):
+            if mode == 1 or mode == 2:
+                text.append(chunk)
+            elif mode == 3:
+                formula.append(chunk)
+
+        for _ in self._feed(self.sheets[index].path, start, end, data):
+            yield from ready
+            ready.clear()
+        yield from ready
+
+    def iter_rows(
+        self, index: int, dimension: bool = True, columns: Optional[list[int]] = None
+    ) -> Iterator[list]:
+        """
+        Yield the values of a sheet row by row,
+        padded the same way as openpyxl in read-only mode.
+
+        Rows start from A1, missing rows and cells are filled with None,
+        and rows are as wide as the declared dimension of the sheet.
+
+        :param index: The index of the sheet.
+        :type index: int
+        :param dimension: If False, the declared dimension is ignored:
+                          rows stop at their last cell, and no blank rows
+                          are generated after the last row of the sheet.
+        :type dimension: bool
+        :param columns: The sorted 0-based indexes of the columns to read,
+                        rows then hold one value for each of them. Default to all columns.
+        :type columns: Optional[list[int]]
+        :return: A generator of rows.
+        """
+        dims = self.dimension(index) if dimension else None
+        max_col = max_row = None
+        if dims is not None:
+            max_col, max_row = dims[2], dims[3]
+        positions = None  # Position in the row of each selected column.
+        if columns is not None:
+            positions = {c + 1: i for i, c in enumerate(columns)}
+            max_col = len(columns)
+        empty_row = [] if max_col is None else [None] * max_col
+
+        counter = 1
+        idx = 1
+        for idx, cells in self.iter_cells(index, positions):
+            if max_row is not None and idx > max_row:
+                break
+            while counter < idx:
+                counter += 1
+                yield empty_row.copy()
+            if counter <= idx:
+                counter += 1
+                if not cells and not max_col:
+                    yield []
+                    continue
+                width = max_col or cells[-1][0]
+                row = [None] * width
+                if positions is None:
+                    for col, value in cells:
+                        if col <= width:
+                            row[col - 1] = value
+                else:
+                    for col, value in cells:
+                        pos = positions.get(col)
+                        if pos is not None:
+                            row[pos] = value
+                yield row
+        if max_row is not None and max_row < idx:
+            for _ in range(counter, max_row + 1):
+                yield empty_row.copy()
+
+    def close(self):
+        """
+        Close the package.
+        """
+        self._zip.close()
+
+
+def _formula(attrs: dict, text: str, ref: Optional[str], shared: dict):
+    """
+    Build the value of a formula cell, like openpyxl does.
+    """
+    value = "=" + (text or "")
+    kind = attrs.get("t")
+    if kind == "array":
+        from openpyxl.worksheet.formula import ArrayFormula
+
+        return ArrayFormula(ref=attrs.get("ref"), text=value)
+    if kind == "shared":
+        idx = attrs.get("si")
+        if idx in shared:
+            return shared[idx].translate_formula(ref)
+        if value != "=":
+            from openpyxl.formula.translate import Translator
+
+            shared[idx] = Translator(value, ref)
+    elif kind == "dataTable":
+        from openpyxl.worksheet.formula import DataTableFormula
+
+        return DataTableFormula(**attrs)
+    return value
@@ -0,0 +1,157 @@
+"""
+Write pandas DataFrames to sheets.
+
+The writer engines take rows of Python values, so the columns of a DataFrame
+are converted a block of rows at a time and zipped into rows. Each column is converted
+at once by NumPy according to its dtype: numbers and booleans with ``tolist()``,
+datetimes and timedeltas through microsecond arrays, and missing values
+(NaN, NaT, None, pd.NA) become empty cells. Only one block of rows is held
+as Python objects, whatever the size of the DataFrame.
+
+A `ColumnarGrid` takes whole columns instead, see `column_array()`.
+"""
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# The number of rows converted at a time.
+CHUNK_ROWS = 1 << 14
+
+
+def frame_header(frame: "pd.DataFrame", index: bool = False) -> list:
+    """
+    Return the header row of a DataFrame: the names of the index levels if ``index`` is True,
+    then the column labels. The levels of a MultiIndex label are joined with '.'.
+
+    :param frame: The DataFrame.
+    :param index: If True, the index is written before the columns.
+    """
+    names = []
+    if index:
+        names.extend("" if name is None else name for name in frame.index.names)
+    for label in frame.columns:
+        if isinstance(label, tuple):
+            label = ".".join(str(level) for level in label if level != "")
+        names.append(label)
+    return names
+
+
+def _column_array(values) -> Any:
+    """
+    Return the values of a Series or an Index as a NumPy array,
+    or as a pandas extension array for the extension dtypes.
+    Timezone-aware datetimes are converted to their local time, Excel has no time zones.
+    """
+    import numpy as np
+    import pandas as pd
+
+    dtype = values.dtype
+    if isinstance(dtype, np.dtype):
+        return values.to_numpy()
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return values.array.tz_localize(None).to_numpy()
+    return values.array
+
+
+def column_values(values) -> list:
+    """
+    Convert an array of a DataFrame column to a list of Python values,
+    missing values being None.
+
+    :param values: A NumPy array or a pandas extension array.
+    :return: The values, as int, float, bool, str, datetime or timedelta objects.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(values, np.ndarray):
+        kind = values.dtype.kind
+        if kind in "iub":
+            return values.tolist()
+        if kind == "f":
+            result = values.tolist()
+            for i in np.flatnonzero(np.isnan(values)).tolist():
+                result[i] = None
+            return result
+        # NaT becomes None.
+        if kind == "M":
+            return values.astype("datetime64[us]").tolist()
+        if kind == "m":
+            return values.astype("timedelta64[us]").tolist()
+    else:
+        values = values.to_numpy(dtype=object, na_value=None)
+    result = values.tolist()
+    for i in np.flatnonzero(pd.isna(values)).tolist():
+        result[i] = None
+    return result
+
+
+def column_array(values) -> tuple:
+    """
+    Convert an array of a DataFrame column to a NumPy array which a `ColumnarGrid`
+    stores as it is: numbers, booleans and datetimes keep their dtype,
+    the other columns become object arrays of the values of `column_values()`.
+
+    :param values: A NumPy array or a pandas extension array.
+    :return: A tuple (values, missing), ``missing`` being a boolean array
+             of the missing values, or None if there are none.
+    """
+    import numpy as np
+
+    if isinstance(values, np.ndarray):
+        kind = values.dtype.kind
+        if kind in "iub":
+            return values, None
+        if kind == "f":
+            return values, np.isnan(values)
+        if kind == "M":
+            values = values.astype("datetime64[us]")
+            return values, np.isnat(values)
+    objects = np.empty(len(values), dtype=object)
+    objects[:] = column_values(values)
+    return objects, np.equal(objects, None)
+
+
+def frame_columns(frame: "pd.DataFrame", index: bool = False) -> list:
+    """
+    Return the values of the columns of a DataFrame, as NumPy arrays or as
+    pandas extension arrays for the extension dtypes.
+
+    :param frame: The DataFrame.
+    :param index: If True, the index levels are the first columns.
+    """
+    columns = []
+    if index:
+        columns.extend(
+            _column_array(frame.index.get_level_values(i))
+            for i in range(frame.index.nlevels)
+        )
+    columns.extend(_column_array(frame.iloc[:, j]) for j in range(frame.shape[1]))
+    return columns
+
+
+def iter_frame_rows(
+    frame: "pd.DataFrame",
+    index: bool = False,
+    header: bool = True,
+    chunk_size: int = CHUNK_ROWS,
+) -> Iterator[Sequence[Any]]:
+    """
+    Iterate over the rows of a DataFrame as Python values, converted column by column.
+
+    :param frame: The DataFrame.
+    :param index: If True, the index levels are the first columns.
+    :param header: If True, the first row is the header, see `frame_header()`.
+    :param chunk_size: The number of rows converted at a time.
+    :return: A generator of rows, the header is a list and the other rows are tuples.
+    """
+    if header:
+        yield frame_header(frame, index)
+    columns = frame_columns(frame, index)
+    if not columns:
+        return
+    for start in range(0, len(frame), chunk_size):
+        yield from zip(
+            *(column_values(column[start : start + chunk_size]) for column in columns)
+        )
@@ -1,5 +1,7 @@
+import copy
+import datetime
 from abc import ABCMeta, abstractmethod
-from typing import Any
+from typing import Any, Optional
 
 
 class Grid(metaclass=ABCMeta):
@@ -159,3 +161,803 @@ def list_to_records(li: list[list]):
     for i, row in enumerate(li):
         grid.row(row=i, values=row)
     return grid.get().copy()
+
+
+class SheetGrid(metaclass=ABCMeta):
+    """
+    Base class of the grids used as storage of ``Sheet``.
+
+    Unlike ``Grid``, a sheet grid applies every write in place,
+    so reading it back never needs a full recompute.
+    Cells which have never been written are read as ``""``.
+    """
+
+    @abstractmethod
+    def cell(self, row: int, col: int, value):
+        """
+        Modify the value of a cell.
+
+        :param row: The row of the cell.
+        :type row: int
+        :param col: The column of the cell.
+        :type col: int
+        :param value: The new value of the cell.
+        :type value: Any
+        """
+        pass
+
+    def row(self, row: int, values: list):
+        """
+        Modify the values of a row.
+
+        :param row: The row to modify.
+        :type row: int
+        :param values: The new values of the row.
+        :type values: list
+        """
+        for i, v in enumerate(values):
+            self.cell(row, i, v)
+
+    def column(self, col: int, values: list):
+        """
+        Modify the values of a column.
+
+        :param col: The column to modify.
+        :type col: int
+        :param values: The new values of the column.
+        :type values: list
+        """
+        for i, v in enumerate(values):
+            self.cell(i, col, v)
+
+    @abstractmethod
+    def get_cell(self, row: int, col: int):
+        """
+        Get the value of a cell.
+
+        :param row: The row of the cell.
+        :type row: int
+        :param col: The column of the cell.
+        :type col: int
+        :return: The value of the cell.
+        """
+        pass
+
+    @abstractmethod
+    def get_row(self, row: int) -> list:
+        """
+        Get the values of a row, padded to the width of the grid.
+
+        :param row: The row to get.
+        :type row: int
+        :return: The values of the row.
+        :rtype: list
+        """
+        pass
+
+    def get_col(self, col: int) -> list:
+        """
+        Get the values of a column.
+
+        :param col: The column to get.
+        :type col: int
+        :return: The values of the column.
+        :rtype: list
+        """
+        return [self.get_row(r)[col] for r in range(self.nrows)]
+
+    def get_range(self, row_start: int, col_start: int, row_end: int, col_end: int):
+        """
+        Get the values in a range. Both ends are included.
+
+        :return: A list of lists, one for each row of the range.
+        :rtype: list[list]
+        """
+        return [
+            self.get_row(r)[col_start : col_end + 1]
+            for r in range(row_start, row_end + 1)
+        ]
+
+    def iter_rows(self):
+        """
+        Iterate over all rows of the grid, from top to bottom.
+
+        :return: A generator of rows.
+        """
+        for r in range(self.nrows):
+            yield self.get_row(r)
+
+    def iter_populated_rows(self):
+        """
+        Iterate over the rows which may hold values, from top to bottom.
+        Rows are not padded, so they may be shorter than the grid.
+
+        Grids storing every row yield all of them, sparse grids skip the empty ones.
+
+        :return: A generator of (index, row) tuples.
+        """
+        return enumerate(self.iter_rows())
+
+    def get(self) -> list[list]:
+        """
+        Returns the grid as a list of rows.
+
+        :return: The grid as a list of lists.
+        :rtype: list[list]
+        """
+        return list(self.iter_rows()) or [[]]
+
+    def copy(self) -> "SheetGrid":
+        """
+        Return an independent copy of the grid, writing to one leaves the other unchanged.
+        This implementation deep-copies the grid, values included. The built-in grids
+        override it to copy their rows or columns only, the values are then shared.
+
+        :rtype: SheetGrid
+        """
+        return copy.deepcopy(self)
+
+    @property
+    @abstractmethod
+    def nrows(self) -> int:
+        """
+        The number of rows in the grid.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def ncols(self) -> int:
+        """
+        The number of columns in the grid.
+        """
+        pass
+
+    def __repr__(self):
+        return "%s.%s()" % (self.__class__.__module__, self.__class__.__qualname__)
+
+
+class DenseGrid(SheetGrid):
+    """
+    A row-major grid stored as a list of lists.
+
+    Rows are only padded with ``""`` when they are read,
+    so filling a sheet row by row costs amortized O(1) per row.
+    """
+
+    def __init__(self):
+        self._rows: list[list] = []
+        self._ncols = 0
+        self._ragged = False  # Some rows may be shorter than the grid.
+
+    def _grow(self, nrows: int):
+        """
+        Make sure the grid has at least ``nrows`` rows.
+
+        :param nrows: The number of rows required.
+        :type nrows: int
+        """
+        missing = nrows - len(self._rows)
+        if missing > 0:
+            self._rows.extend([] for _ in range(missing))
+            self._ragged = self._ragged or self._ncols > 0
+
+    def _widen(self, width: int):
+        """
+        Record the width of a row that has just been written.
+
+        :param width: The width of the row.
+        :type width: int
+        """
+        if width > self._ncols:
+            self._ragged = self._ragged or len(self._rows) > 1
+            self._ncols = width
+        elif width < self._ncols:
+            self._ragged = True
+
+    def _padded(self, row: int) -> list:
+        """
+        Return a row, after padding it in place to the width of the grid.
+
+        :param row: The row to get.
+        :type row: int
+        :return: The row itself.
+        :rtype: list
+        """
+        r = self._rows[row]
+        if len(r) < self._ncols:
+            r.extend([""] * (self._ncols - len(r)))
+        return r
+
+    def _normalize(self):
+        """
+        Pad all rows to the width of the grid, if any of them is shorter.
+        """
+        if self._ragged:
+            for i in range(len(self._rows)):
+                self._padded(i)
+            self._ragged = False
+
+    def cell(self, row: int, col: int, value):
+        self._grow(row + 1)
+        r = self._rows[row]
+        if col >= len(r):
+            r.extend([""] * (col + 1 - len(r)))
+        r[col] = value
+        self._widen(len(r))
+
+    def row(self, row: int, values: list):
+        values = list(values)
+        if row == len(self._rows):
+            self._rows.append(values)
+        else:
+            self._grow(row + 1)
+            r = self._rows[row]
+            if len(values) >= len(r):
+                self._rows[row] = values
+            else:
+                r[: len(values)] = values
+        self._widen(len(self._rows[row]))
+
+    def get_cell(self, row: int, col: int):
+        return self._padded(row)[col]
+
+    def get_row(self, row: int) -> list:
+        return self._padded(row)
+
+    def get_col(self, col: int) -> list:
+        self._normalize()
+        return [r[col] for r in self._rows]
+
+    def iter_rows(self):
+        self._normalize()
+        return iter(self._rows)
+
+    def get(self) -> list[list]:
+        self._normalize()
+        return self._rows if self._rows else [[]]
+
+    def copy(self) -> "DenseGrid":
+        grid = DenseGrid()
+        grid._rows = [list(r) for r in self._rows]
+        grid._ncols = self._ncols
+        grid._ragged = self._ragged
+        return grid
+
+    @property
+    def nrows(self) -> int:
+        return len(self._rows)
+
+    @property
+    def ncols(self) -> int:
+        return self._ncols
+
+
+def _normalize_index(index: int, size: int) -> int:
+    """
+    Resolve a negative index and check it is inside ``[0, size)``, like a list does.
+    """
+    if index < 0:
+        index += size
+    if not 0 <= index < size:
+        raise IndexError(f"Index out of range: {index}")
+    return index
+
+
+class SparseGrid(SheetGrid):
+    """
+    A grid storing only the cells which hold a value, as a dict of rows,
+    each row being a dict of columns.
+
+    Memory grows with the number of cells instead of the area of the sheet,
+    so a few cells scattered far apart stay cheap.
+    Writing ``""`` removes a cell, but ``cell()``, ``row()`` and ``column()`` still extend
+    the grid to the cells written, like ``DenseGrid``.
+    """
+
+    def __init__(self):
+        self._rows: dict[int, dict[int, Any]] = {}
+        self._nrows = 0
+        self._ncols = 0
+
+    def _extend(self, nrows: int, ncols: int):
+        """
+        Make sure the grid has at least ``nrows`` rows and ``ncols`` columns.
+        """
+        if nrows > self._nrows:
+            self._nrows = nrows
+        if ncols > self._ncols:
+            self._ncols = ncols
+
+    def cell(self, row: int, col: int, value):
+        if type(value) is str and value == "":
+            r = self._rows.get(row)
+            if r is not None:
+                r.pop(col, None)
+                if not r:
+                    del self._rows[row]
+        else:
+            r = self._rows.get(row)
+            if r is None:
+                r = self._rows[row] = {}
+            r[col] = value
+        self._extend(row + 1, col + 1)
+
+    def row(self, row: int, values: list):
+        r = self._rows.get(row, {})
+        width = 0
+        for i, v in enumerate(values):
+            if type(v) is str and v == "":
+                r.pop(i, None)
+            else:
+                r[i] = v
+            width = i + 1
+        if r:
+            self._rows[row] = r
+        else:
+            self._rows.pop(row, None)
+        self._extend(row + 1, width)
+
+    def column(self, col: int, values: list):
+        for i, v in enumerate(values):
+            self.cell(i, col, v)
+
+    def get_cell(self, row: int, col: int):
+        r = self._rows.get(_normalize_index(row, self._nrows))
+        col = _normalize_index(col, self._ncols)
+        return "" if r is None else r.get(col, "")
+
+    def get_row(self, row: int) -> list:
+        values = [""] * self._ncols
+        r = self._rows.get(_normalize_index(row, self._nrows))
+        if r:
+            for c, v in r.items():
+                values[c] = v
+        return values
+
+    def get_col(self, col: int) -> list:
+        col = _normalize_index(col, self._ncols)
+        values = [""] * self._nrows
+        for i, r in self._rows.items():
+            if col in r:
+                values[i] = r[col]
+        return values
+
+    def get_range(self, row_start: int, col_start: int, row_end: int, col_end: int):
+        if row_end >= self._nrows:
+            raise IndexError(f"Row index out of range: {row_end}")
+        col_end = min(col_end, self._ncols - 1)
+        width = max(col_end + 1 - col_start, 0)
+        rng = [[""] * width for _ in range(row_start, row_end + 1)]
+        if (row_end - row_start + 1) < len(self._rows):
+            populated = ((i, self._rows.get(i)) for i in range(row_start, row_end + 1))
+        else:
+            populated = self._rows.items()
+        for i, r in populated:
+            if r and row_start <= i <= row_end:
+                out = rng[i - row_start]
+                for c, v in r.items():
+                    if col_start <= c <= col_end:
+                        out[c - col_start] = v
+        return rng
+
+    def iter_rows(self):
+        for r in range(self._nrows):
+            yield self.get_row(r)
+
+    def iter_populated_rows(self):
+        for i in sorted(self._rows):
+            r = self._rows[i]
+            values = [""] * (max(r) + 1)
+            for c, v in r.items():
+                values[c] = v
+            yield i, values
+
+    def copy(self) -> "SparseGrid":
+        grid = SparseGrid()
+        grid._rows = {i: dict(r) for i, r in self._rows.items()}
+        grid._nrows = self._nrows
+        grid._ncols = self._ncols
+        return grid
+
+    @property
+    def ncells(self) -> int:
+        """
+        The number of cells which hold a value.
+        """
+        return sum(len(r) for r in self._rows.values())
+
+    @property
+    def nrows(self) -> int:
+        return self._nrows
+
+    @property
+    def ncols(self) -> int:
+        return self._ncols
+
+
+class ColumnBuffer:
+    """
+    A column of ``ColumnarGrid``, stored as a typed NumPy array and a state array.
+
+    The array has the type of the values written so far: float64, int64,
+    datetime64[us] or bool. It falls back to object when the values are mixed.
+    The state of each cell is one of ``EMPTY`` (never written, read as ``""``),
+    ``NONE`` (written as None) or ``VALID``, so ``state == VALID`` is the validity mask.
+    """
+
+    EMPTY = 0
+    NONE = 1
+    VALID = 2
+
+    # Kind of the array for each type of value. Other types are stored as objects.
+    KINDS = {float: "f", int: "i", bool: "b", datetime.datetime: "M"}
+    DTYPES = {
+        "f": "float64",
+        "i": "int64",
+        "b": "bool",
+        "M": "datetime64[us]",
+        "O": "object",
+    }
+
+    def __init__(self):
+        self.kind = None  # No array until a value is written.
+        self.values = None
+        self.state = None
+        self.length = 0
+
+    @classmethod
+    def _kind(cls, value) -> str:
+        kind = cls.KINDS.get(type(value))
+        if kind is None:
+            import numpy as np
+
+            if isinstance(value, np.bool_):
+                kind = "b"
+            elif isinstance(value, np.integer):
+                kind = "i"
+            elif isinstance(value, np.floating):
+                kind = "f"
+            elif isinstance(value, np.datetime64):
+                kind = "M"
+            else:
+                return "O"
+        if kind == "i" and not -(1 << 63) <= value < (1 << 63):
+            return "O"
+        if kind == "M" and getattr(value, "tzinfo", None) is not None:
+            return "O"
+        return kind
+
+    def _reserve(self, size: int):
+        """
+        Make sure the arrays can hold ``size`` cells, growing them geometrically.
+        """
+        import numpy as np
+
+        if self.state is None:
+            self.state = np.zeros(max(size, 16), dtype=np.uint8)
+        elif size > len(self.state):
+            capacity = max(size, len(self.state) * 2)
+            state = np.zeros(capacity, dtype=np.uint8)
+            state[: self.length] = self.state[: self.length]
+            self.state = state
+            if self.values is not None:
+                values = np.empty(capacity, dtype=self.values.dtype)
+                values[: self.length] = self.values[: self.length]
+                self.values = values
+
+    def _convert(self, kind: str):
+        """
+        Change the type of the array, keeping the values written so far.
+        """
+        import numpy as np
+
+        capacity = len(self.state)
+        if self.values is None:
+            self.values = np.empty(capacity, dtype=self.DTYPES[kind])
+        elif kind == "O":
+            values = np.empty(capacity, dtype=object)
+            values[: self.length] = self.to_list()
+            self.values = values
+        else:
+            self.values = self.values.astype(self.DTYPES[kind])
+        self.kind = kind
+
+    def _exact_float(self, value) -> bool:
+        """
+        Return True if a column mixing integers and floats can be stored as float64 after
+        writing ``value``, i.e. every integer is exactly representable (at most 2**53).
+        """
+        import numpy as np
+
+        if self.kind == "f":
+            return abs(value) <= (1 << 53)
+        valid = self.state[: self.length] == self.VALID
+        return int(np.abs(self.values[: self.length][valid]).max(initial=0)) <= (
+            1 << 53
+        )
+
+    def set(self, index: int, value):
+        """
+        Write a value at the given index.
+        An integer written to a float column, or a float written to an integer column,
+        makes it a float column, so its integers read back as floats. If an integer is
+        larger than 2**53, which float64 cannot represent exactly, it becomes an object column.
+
+        :param index: The index of the cell.
+        :type index: int
+        :param value: The value of the cell.
+        """
+        if index >= self.length:
+            self._reserve(index + 1)
+            self.length = index + 1
+        if value is None:
+            self.state[index] = self.NONE
+            return
+        if type(value) is str and value == "":
+            self.state[index] = self.EMPTY
+            return
+        kind = self._kind(value)
+        if kind != self.kind and self.kind != "O":
+            if (
+                self.kind is None
+                or self.state[: self.length].max(initial=0) < self.VALID
+            ):
+                self._convert(kind)
+            elif {kind, self.kind} == {"i", "f"} and self._exact_float(value):
+                if self.kind == "i":
+                    self._convert("f")
+            else:
+                self._convert("O")
+        self.values[index] = value
+        self.state[index] = self.VALID
+
+    def set_array(self, start: int, values, missing=None):
+        """
+        Write a NumPy array of values from the given index, without converting them
+        to Python objects one by one. The values are stored as by `set()`.
+
+        :param start: The index of the first cell.
+        :type start: int
+        :param values: A NumPy array of numbers, booleans, datetimes or objects.
+        :param missing: A boolean NumPy array, True for the cells to leave empty (None).
+        """
+        import numpy as np
+
+        if not len(values):
+            return
+        kind = values.dtype.kind
+        if kind == "u" and (
+            values.dtype.itemsize < 8 or values.max(initial=0) < (1 << 63)
+        ):
+            kind = "i"
+        if kind not in self.DTYPES:
+            kind = "O"
+            values = values.astype(object)
+        stop = start + len(values)
+        if stop > self.length:
+            self._reserve(stop)
+        valid = self.state[: self.length] == self.VALID
+        valid[start:stop] = False
+        if kind != self.kind and self.kind != "O":
+            if self.kind is None or not valid.any():
+                self._convert(kind)
+            elif {kind, self.kind} == {"i", "f"} and self._exact_float(
+                max(-int(values.min()), int(values.max())) if kind == "i" else 0
+            ):
+                if self.kind == "i":
+                    self._convert("f")
+            else:
+                self._convert("O")
+        self.length = max(self.length, stop)
+        self.values[start:stop] = values
+        state = np.full(len(values), self.VALID, dtype=np.uint8)
+        if kind == "O":
+            # Only an object array can hold empty strings.
+            state[values == ""] = self.EMPTY
+        if missing is not None:
+            state[missing] = self.NONE
+        self.state[start:stop] = state
+
+    def get(self, index: int):
+        """
+        Read the value at the given index, as a Python object.
+
+        :param index: The index of the cell.
+        :type index: int
+        """
+        if index >= self.length:
+            return ""
+        state = self.state[index]
+        if state == self.VALID:
+            value = self.values[index]
+            return value if self.kind == "O" else value.item()
+        return None if state == self.NONE else ""
+
+    def to_list(self, start: int = 0, stop: Optional[int] = None) -> list:
+        """
+        Read a slice of the column as a list of Python objects.
+
+        :param start: The first index of the slice.
+        :type start: int
+        :param stop: The index after the slice, default to the length of the column.
+        :type stop: Optional[int]
+        :rtype: list
+        """
+        import numpy as np
+
+        stop = self.length if stop is None else stop
+        end = min(stop, self.length)
+        if end <= start:
+            return [""] * max(stop - start, 0)
+        state = self.state[start:end]
+        if self.values is None:
+            values = [""] * (end - start)
+        else:
+            values = self.values[start:end].tolist()
+        for i in np.flatnonzero(state != self.VALID).tolist():
+            values[i] = None if state[i] == self.NONE else ""
+        if stop > end:
+            values.extend([""] * (stop - end))
+        return values
+
+    def array(self):
+        """
+        Return the values and the validity mask of the column, as NumPy arrays.
+        Invalid values of the array are undefined.
+
+        :return: A tuple (values, mask).
+        """
+        import numpy as np
+
+        if self.values is None:
+            return np.empty(self.length, dtype=object), np.zeros(
+                self.length, dtype=bool
+            )
+        return self.values[: self.length], self.state[: self.length] == self.VALID
+
+    def copy(self) -> "ColumnBuffer":
+        """
+        Return an independent copy of the column.
+        """
+        column = ColumnBuffer()
+        column.kind = self.kind
+        column.length = self.length
+        if self.state is not None:
+            column.state = self.state[: self.length].copy()
+        if self.values is not None:
+            column.values = self.values[: self.length].copy()
+        return column
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory used by the arrays, excluding the objects of an object array.
+        """
+        size = 0 if self.state is None else self.state.nbytes
+        return size + (0 if self.values is None else self.values.nbytes)
+
+
+class ColumnarGrid(SheetGrid):
+    """
+    A column-major grid, each column being a typed NumPy array with a validity mask.
+
+    Numeric, boolean and datetime columns take 8 or 9 bytes per cell instead of
+    a boxed Python object per cell, and can be read as arrays with ``get_array()``.
+    Mixed columns fall back to the object dtype.
+    NumPy is only imported when the grid is used.
+    """
+
+    def __init__(self):
+        self._columns: list[ColumnBuffer] = []
+        self._nrows = 0
+
+    def _column(self, col: int) -> ColumnBuffer:
+        while col >= len(self._columns):
+            self._columns.append(ColumnBuffer())
+        return self._columns[col]
+
+    def cell(self, row: int, col: int, value):
+        self._column(col).set(row, value)
+        if row >= self._nrows:
+            self._nrows = row + 1
+
+    def row(self, row: int, values: list):
+        values = list(values)
+        if len(values) > len(self._columns):
+            self._column(len(values) - 1)
+        for column, value in zip(self._columns, values):
+            column.set(row, value)
+        if row >= self._nrows:
+            self._nrows = row + 1
+
+    def column(self, col: int, values: list):
+        column = self._column(col)
+        for i, v in enumerate(values):
+            column.set(i, v)
+        if column.length > self._nrows:
+            self._nrows = column.length
+
+    def set_array(self, col: int, values, missing=None, start: int = 0):
+        """
+        Write a NumPy array to a column, see `ColumnBuffer.set_array()`.
+
+        :param col: The index of the column.
+        :type col: int
+        :param values: A NumPy array of numbers, booleans, datetimes or objects.
+        :param missing: A boolean NumPy array, True for the cells to leave empty (None).
+        :param start: The row of the first value.
+        :type start: int
+        """
+        column = self._column(col)
+        column.set_array(start, values, missing)
+        if column.length > self._nrows:
+            self._nrows = column.length
+
+    def get_cell(self, row: int, col: int):
+        row = _normalize_index(row, self._nrows)
+        return self._columns[_normalize_index(col, len(self._columns))].get(row)
+
+    def get_row(self, row: int) -> list:
+        row = _normalize_index(row, self._nrows)
+        return [column.get(row) for column in self._columns]
+
+    def get_col(self, col: int) -> list:
+        return self._columns[_normalize_index(col, len(self._columns))].to_list(
+            0, self._nrows
+        )
+
+    def get_range(self, row_start: int, col_start: int, row_end: int, col_end: int):
+        columns = [
+            column.to_list(row_start, row_end + 1)
+            for column in self._columns[col_start : col_end + 1]
+        ]
+        return (
+            [list(r) for r in zip(*columns)]
+            if columns
+            else [[] for _ in range(row_start, row_end + 1)]
+        )
+
+    def iter_rows(self):
+        columns = [column.to_list(0, self._nrows) for column in self._columns]
+        if not columns:
+            return iter([[] for _ in range(self._nrows)])
+        return map(list, zip(*columns))
+
+    def get_array(self, col: int):
+        """
+        Get the values and the validity mask of a column, as NumPy arrays.
+
+        :param col: The column to get.
+        :type col: int
+        :return: A tuple (values, mask) of arrays as long as the grid.
+        """
+        import numpy as np
+
+        values, mask = self._columns[col].array()
+        if len(values) < self._nrows:
+            missing = self._nrows - len(values)
+            values = np.concatenate([values, np.empty(missing, dtype=values.dtype)])
+            mask = np.concatenate([mask, np.zeros(missing, dtype=bool)])
+        return values, mask
+
+    def copy(self) -> "ColumnarGrid":
+        grid = ColumnarGrid()
+        grid._columns = [column.copy() for column in self._columns]
+        grid._nrows = self._nrows
+        return grid
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory used by the arrays of the columns.
+        """
+        return sum(column.nbytes for column in self._columns)
+
+    @property
+    def nrows(self) -> int:
+        return self._nrows
+
+    @property
+    def ncols(self) -> int:
+        return len(self._columns)
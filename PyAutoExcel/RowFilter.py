@@ -0,0 +1,250 @@
+"""
+Row filters evaluated by the readers while the rows are parsed.
+"""
+import ast
+import copy
+import re
+from typing import Callable, Optional, Sequence, Union
+
+from .Utils import COLUMNS_RE, column_index_from_string
+
+QUOTED_RE = re.compile(r"`([^`]*)`")
+
+# Nodes allowed in a filter expression, anything else is rejected before compiling.
+ALLOWED_NODES = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.Is,
+    ast.IsNot,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.Tuple,
+    ast.List,
+    ast.Set,
+)
+
+# Values a filter cannot multiply, a large repetition would exhaust the memory.
+SEQUENCES = (str, bytes, list, tuple)
+
+
+def _multiply(left, right):
+    """
+    Multiply two values of a filter expression, sequences are not repeated.
+    """
+    if isinstance(left, SEQUENCES) or isinstance(right, SEQUENCES):
+        raise TypeError("A row filter cannot repeat a sequence")
+    return left * right
+
+
+class PaddedRow(list):
+    """
+    The values of a row given to a callable filter.
+
+    The engines trim the empty cells at the end of the rows, and give blank rows
+    as empty sequences, so a positive index past the end of the row reads as None,
+    like an empty cell. Negative indexes and slices are those of the values read.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if type(index) is int and index >= len(self):
+            return None
+        return list.__getitem__(self, index)
+
+
+class RowFilter:
+    """
+    A predicate deciding which rows of a sheet are kept.
+
+    The filter is either a callable, which receives the values of a row
+    (restricted to the selected columns) as a `PaddedRow` and returns True to keep it,
+    or an expression such as ``"Account == 'ACME' and Amount > 100"``.
+
+    In an expression, names are header names, and header names which are not
+    identifiers are quoted with backticks, e.g. ``"`Account ID` in (1, 2)"``.
+    A name of 1 to 3 uppercase letters which is not in the header is a column letter,
+    so ``"ID == 1"`` reads the column named ID if there is one, and column ID otherwise.
+    Only constants, column names, comparisons, arithmetic and
+    ``and``/``or``/``not`` are allowed, and strings, lists and tuples cannot be multiplied.
+    A comparison which fails, e.g. between an empty cell and a number, rejects the row.
+
+    :param where: The callable or the expression.
+    :type where: Union[str, Callable[[list], bool]]
+    :raise ValueError: If the expression is invalid.
+    :raise TypeError: If ``where`` is neither a string nor a callable.
+    """
+
+    def __init__(self, where: Union[str, Callable[[list], bool]]):
+        self.where = where
+        self._names: dict[str, str] = {}  # Identifier in the expression -> column name.
+        self._tree = None
+        if isinstance(where, str):
+            self._tree = self._parse(where)
+        elif not callable(where):
+            raise TypeError(
+                f"A row filter must be a string or a callable, not {type(where).__name__}"
+            )
+
+    def _parse(self, expression: str) -> ast.Expression:
+        """
+        Parse and validate an expression, quoted names are replaced by identifiers.
+        """
+
+        def quote(match):
+            identifier = f"__quoted{len(self._names)}"
+            self._names[identifier] = match.group(1)
+            return identifier
+
+        source = QUOTED_RE.sub(quote, expression)
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid row filter {expression!r}: {e.msg}") from None
+        for node in ast.walk(tree):
+            if not isinstance(node, ALLOWED_NODES):
+                raise ValueError(
+                    f"Invalid row filter {expression!r}: {type(node).__name__} is not allowed"
+                )
+            if isinstance(node, ast.Name):
+                self._names.setdefault(node.id, node.id)
+            elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+                for operand in (node.left, node.right):
+                    if isinstance(operand, (ast.List, ast.Tuple, ast.Set)) or (
+                        isinstance(operand, ast.Constant)
+                        and isinstance(operand.value, SEQUENCES)
+                    ):
+                        raise ValueError(
+                            f"Invalid row filter {expression!r}: a sequence cannot be repeated"
+                        )
+        return tree
+
+    @property
+    def names(self) -> list[str]:
+        """
+        The column names and letters used by the expression, empty for a callable.
+        """
+        return list(self._names.values())
+
+    @property
+    def header_names(self) -> list[str]:
+        """
+        The names used by the expression which can only be header names,
+        empty for a callable.
+        """
+        return [
+            name
+            for identifier, name in self._names.items()
+            if identifier != name or COLUMNS_RE.match(name) is None
+        ]
+
+    def columns(
+        self, header: Optional[Sequence] = None, strict: bool = True
+    ) -> dict[str, int]:
+        """
+        Resolve the names used by the expression to 0-based column indexes.
+        A name found in the header is a header name, even if it looks like column letters.
+
+        :param header: The values of the header row, used to find the header names.
+        :param strict: If False, the names which are not in the header are left out.
+        :return: The column index of each identifier of the expression.
+        :raise ValueError: If ``strict`` is True and a header name is not in the header.
+        """
+        positions = {}
+        for i, value in enumerate(header or ()):
+            if isinstance(value, str):
+                positions.setdefault(value, i)
+        columns = {}
+        for identifier, name in self._names.items():
+            if name in positions:
+                columns[identifier] = positions[name]
+            elif identifier == name and COLUMNS_RE.match(name):
+                columns[identifier] = column_index_from_string(name) - 1
+            elif strict:
+                raise ValueError(f"No column named {name!r} in the header")
+        return columns
+
+    def bind(self, positions: dict[str, int]) -> Callable[[Sequence], bool]:
+        """
+        Build the predicate of the rows.
+
+        :param positions: The position in the rows of the column of each identifier,
+                          ignored for a callable. Rows shorter than the columns used
+                          are padded with None, for a callable and for an expression.
+        :return: A function returning True for the rows to keep.
+        """
+        if self._tree is None:
+            where = self.where
+
+            def call(row: Sequence) -> bool:
+                return bool(where(PaddedRow(row)))
+
+            return call
+
+        class Columns(ast.NodeTransformer):
+            def visit_Name(self, node):
+                index = ast.Constant(positions[node.id])
+                return ast.copy_location(
+                    ast.Subscript(ast.Name("row", ast.Load()), index, ast.Load()), node
+                )
+
+            def visit_BinOp(self, node):
+                self.generic_visit(node)
+                if not isinstance(node.op, ast.Mult):
+                    return node
+                # The cells may hold strings, which must not be repeated either.
+                call = ast.Call(
+                    ast.Name("multiply", ast.Load()), [node.left, node.right], []
+                )
+                return ast.copy_location(call, node)
+
+        body = Columns().visit(copy.deepcopy(self._tree)).body
+        args = ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg("row")],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        )
+        tree = ast.fix_missing_locations(ast.Expression(ast.Lambda(args, body)))
+        # The tree only holds the nodes checked in _parse(), subscripts of the row
+        # and calls of multiply().
+        namespace = {"__builtins__": {}, "multiply": _multiply}
+        test = eval(compile(tree, "<row filter>", "eval"), namespace)
+        width = max(positions.values(), default=-1) + 1
+
+        def predicate(row: Sequence) -> bool:
+            if len(row) < width:
+                row = list(row) + [None] * (width - len(row))
+            try:
+                return bool(test(row))
+            except (TypeError, ArithmeticError):
+                return False
+
+        return predicate
+
+    def __repr__(self):
+        return f"PyAutoExcel.RowFilter({self.where!r})"
@@ -0,0 +1,230 @@
+"""
+Instrumentation of the reader and writer engines.
+
+Each phase of an engine (setup, parse, write and output) is reported to the tracer
+of the current context as a `PhaseEvent`. A tracer is any callable taking an event::
+
+    recorder = PhaseRecorder()
+    with tracing(recorder):
+        ExcelReader("data.xlsx")
+    print(recorder.summary())
+
+Nothing is measured when no tracer is set.
+"""
+import io
+import os
+import time
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+current_tracer: ContextVar[Optional[Callable[["PhaseEvent"], None]]] = ContextVar(
+    "PyAutoExcel.current_tracer", default=None
+)
+
+
+class PhaseEvent:
+    """
+    The measures of a phase of an engine.
+
+    :ivar engine: The name of the engine.
+    :ivar phase: 'setup', 'parse', 'write' or 'output'.
+    :ivar file: A description of the file, never its content.
+    :ivar sheet: The name of the sheet, for the phases about a single sheet.
+    :ivar seconds: The duration of the phase.
+    :ivar rows: The number of rows processed, or None.
+    :ivar cells: The number of cells processed (rows times columns of the sheets), or None.
+    :ivar bytes_in: The size of the file read, or None.
+    :ivar bytes_out: The size of the file written, or None.
+    :ivar error: The exception raised by the phase, or None.
+    """
+
+    __slots__ = (
+        "engine",
+        "phase",
+        "file",
+        "sheet",
+        "seconds",
+        "rows",
+        "cells",
+        "bytes_in",
+        "bytes_out",
+        "error",
+    )
+
+    def __init__(
+        self,
+        engine: str,
+        phase: str,
+        file: Optional[str] = None,
+        sheet: Optional[str] = None,
+        seconds: float = 0.0,
+        rows: Optional[int] = None,
+        cells: Optional[int] = None,
+        bytes_in: Optional[int] = None,
+        bytes_out: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ):
+        self.engine = engine
+        self.phase = phase
+        self.file = file
+        self.sheet = sheet
+        self.seconds = seconds
+        self.rows = rows
+        self.cells = cells
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+        self.error = error
+
+    def as_dict(self) -> dict:
+        """
+        Return the measures as a dict, e.g. to log them.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{k}={v!r}" for k, v in self.as_dict().items() if v is not None
+        )
+        return f"PyAutoExcel.PhaseEvent({fields})"
+
+
+@contextmanager
+def tracing(tracer: Optional[Callable[[PhaseEvent], None]]) -> Iterator:
+    """
+    Report the phases of the engines used in the block to a tracer.
+    The tracer is kept in a context variable, so threads and tasks started
+    outside of the block are not traced.
+
+    :param tracer: A callable receiving each PhaseEvent, or None to stop tracing.
+    """
+    token = current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        current_tracer.reset(token)
+
+
+def describe_file(file) -> Optional[str]:
+    """
+    Describe a file for an event: the path, or the type of an in-memory file.
+    """
+    if file is None:
+        return None
+    return file if isinstance(file, str) else f"<{type(file).__name__}>"
+
+
+def file_size(file) -> Optional[int]:
+    """
+    Return the size of a path, of an in-memory file or of a seekable stream, or None.
+    """
+    try:
+        if isinstance(file, str):
+            return os.path.getsize(file)
+        if isinstance(file, memoryview):
+            return file.nbytes
+        if isinstance(file, (bytes, bytearray)):
+            return len(file)
+        if isinstance(file, io.BytesIO):
+            return file.getbuffer().nbytes
+        if isinstance(file, io.IOBase) and file.seekable():
+            pos = file.tell()
+            size = file.seek(0, io.SEEK_END)
+            file.seek(pos)
+            return size
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class Phase:
+    """
+    Measure a phase, and report it to the tracer of the context when it ends.
+    The counters may be set inside the block, if `active` is True.
+
+    :param engine: The name of the engine.
+    :param phase: The name of the phase.
+    :param file: The file read or written.
+    :param sheet: The name of the sheet, if the phase is about a single sheet.
+    """
+
+    def __init__(self, engine: str, phase: str, file=None, sheet: Optional[str] = None):
+        self.tracer = current_tracer.get()
+        self.active = self.tracer is not None
+        if self.active:
+            self.event = PhaseEvent(engine, phase, describe_file(file), sheet)
+        self._start = 0.0
+
+    def __enter__(self) -> "Phase":
+        if self.active:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.active:
+            self.event.seconds = time.perf_counter() - self._start
+            self.event.error = exc_val
+            report(self.tracer, self.event)
+
+
+def report(tracer: Callable[[PhaseEvent], None], event: PhaseEvent):
+    """
+    Send an event to a tracer. A failing tracer only emits a warning,
+    it never interrupts reading or writing.
+    """
+    try:
+        tracer(event)
+    except Exception as e:
+        warnings.warn(f"PyAutoExcel tracer {tracer!r} failed: {e!r}", RuntimeWarning)
+
+
+class PhaseRecorder:
+    """
+    A tracer keeping the events it receives.
+
+    :ivar events: The events, in the order they were received.
+    """
+
+    def __init__(self):
+        self.events: list[PhaseEvent] = []
+
+    def __call__(self, event: PhaseEvent):
+        self.events.append(event)
+
+    def summary(self) -> dict[tuple[str, str], dict]:
+        """
+        Sum the measures of the events for each engine and phase.
+
+        :return: A dict of (engine, phase) to a dict of the totals:
+                 count, seconds, rows, cells, bytes_in and bytes_out.
+        """
+        totals = {}
+        for e in self.events:
+            total = totals.setdefault(
+                (e.engine, e.phase),
+                {
+                    "count": 0,
+                    "seconds": 0.0,
+                    "rows": 0,
+                    "cells": 0,
+                    "bytes_in": 0,
+                    "bytes_out": 0,
+                },
+            )
+            total["count"] += 1
+            total["seconds"] += e.seconds
+            for name in ("rows", "cells", "bytes_in", "bytes_out"):
+                value = getattr(e, name)
+                if value is not None:
+                    total[name] += value
+        return totals
+
+    def clear(self):
+        """
+        Forget the events received so far.
+        """
+        self.events.clear()
+
+    def __repr__(self):
+        return f"PyAutoExcel.PhaseRecorder({len(self.events)} events)"
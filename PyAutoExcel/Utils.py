@@ -1,15 +1,161 @@
 """
 Helper functions for PyAutoExcel.
 """
+import re
 from collections import defaultdict
-from typing import Union
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Union
 
-import pandas as pd
-import xlwt
-from openpyxl.utils.cell import get_column_letter
+if TYPE_CHECKING:
+    # pandas and xlwt are imported by the functions using them, they are slow to import.
+    import pandas as pd
+    import xlwt
 
 inited = False  # Flag to check if the colorama has been initialized.
 
+COORD_RE = re.compile(r"^[$]?([A-Za-z]{1,3})[$]?(\d+)$")
+COLUMNS_RE = re.compile(r"^([A-Z]{1,3})(?::([A-Z]{1,3}))?$")
+
+
+def get_column_letter(idx: int) -> str:
+    """
+    Convert a column index into a column letter.
+
+    :param idx: The column index. (1-based)
+    :return: The column letter. (e.g. 'A')
+    :raises ValueError: If the index is out of the range 1-18278.
+    """
+    if not 1 <= idx <= 18278:
+        raise ValueError(f"Invalid column index {idx}")
+    letters = ""
+    while idx > 0:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def column_index_from_string(letters: str) -> int:
+    """
+    Convert a column letter into a column index.
+
+    :param letters: The column letter. (e.g. 'A')
+    :return: The column index. (1-based)
+    """
+    idx = 0
+    for ch in letters.upper():
+        idx = idx * 26 + ord(ch) - 64
+    return idx
+
+
+def coordinate_to_tuple(coordinate: str) -> tuple[int, int]:
+    """
+    Convert an Excel-style cell reference string to a row and column position.
+
+    :param coordinate: The cell reference string. (e.g. 'A1')
+    :return: The row and column numbers. (1-based)
+    :raises ValueError: If the cell reference is invalid.
+    """
+    match = COORD_RE.match(coordinate)
+    if match is None:
+        raise ValueError(f"Invalid cell coordinates ({coordinate})")
+    letters, row = match.groups()
+    if int(row) == 0:
+        raise ValueError(f"There is no row 0 ({coordinate})")
+    return int(row), column_index_from_string(letters)
+
+
+def parse_usecols(
+    usecols: Union[str, int, Iterable[Union[str, int]]]
+) -> tuple[set[int], list[str]]:
+    """
+    Split a selection of columns into column indexes and header names.
+
+    :param usecols: A string of comma-separated items, an item, or an iterable of items.
+                    An item is a 0-based column index, column letters (e.g. 'A'),
+                    a range of column letters (e.g. 'C:F') or a header name.
+                    In a string, 1 to 3 uppercase letters are column letters. In an iterable,
+                    they are a header name (e.g. 'ID'), and column letters if the header
+                    has no such name, see `resolve_columns()`.
+    :return: The 0-based indexes of the columns, and the header names.
+    :raises ValueError: If an item is neither an index nor a string.
+    """
+    in_string = isinstance(usecols, str)
+    if in_string:
+        usecols = [item.strip() for item in usecols.split(",")]
+    elif isinstance(usecols, int):
+        usecols = [usecols]
+    indexes = set()
+    names = []
+    for item in usecols:
+        if isinstance(item, int) and not isinstance(item, bool):
+            if item < 0:
+                raise ValueError(f"Invalid column index {item}")
+            indexes.add(item)
+        elif isinstance(item, str):
+            match = COLUMNS_RE.match(item)
+            if match is None or (not in_string and match.group(2) is None):
+                names.append(item)
+            else:
+                first, last = match.groups()
+                start = column_index_from_string(first) - 1
+                stop = column_index_from_string(last or first)
+                if stop <= start:
+                    raise ValueError(f"Invalid column range {item}")
+                indexes.update(range(start, stop))
+        else:
+            raise ValueError(f"Invalid column {item!r}")
+    return indexes, names
+
+
+def resolve_columns(
+    usecols: Union[str, int, Iterable[Union[str, int]]],
+    header: Optional[Sequence] = None,
+    strict: bool = True,
+) -> list[int]:
+    """
+    Resolve a selection of columns to 0-based column indexes, in the order of the sheet.
+
+    A name made of 1 to 3 uppercase letters which is not in the header selects
+    the column with these letters.
+
+    :param usecols: The selection of columns, as accepted by `parse_usecols()`.
+    :param header: The values of the header row, used to find the header names.
+    :param strict: If False, the names which are not in the header select no column.
+    :return: The sorted indexes of the selected columns.
+    :raises ValueError: If ``strict`` is True and a header name is not in the header.
+    """
+    indexes, names = parse_usecols(usecols)
+    if names:
+        positions = {}
+        for i, value in enumerate(header or ()):
+            if isinstance(value, str):
+                positions.setdefault(value, i)
+        for name in names:
+            if name in positions:
+                indexes.add(positions[name])
+            elif COLUMNS_RE.match(name):
+                indexes.add(column_index_from_string(name) - 1)
+            elif strict:
+                raise ValueError(f"No column named {name!r} in the header")
+    return sorted(indexes)
+
+
+def unmatched_names(
+    usecols: Union[str, int, Iterable[Union[str, int]]],
+    header: Optional[Sequence] = None,
+) -> set[str]:
+    """
+    Return the header names of a selection of columns which select no column of a header.
+
+    :param usecols: The selection of columns, as accepted by `parse_usecols()`.
+    :param header: The values of the header row.
+    """
+    present = {value for value in header or () if isinstance(value, str)}
+    return {
+        name
+        for name in parse_usecols(usecols)[1]
+        if name not in present and not COLUMNS_RE.match(name)
+    }
+
 
 def column_dict_to_list(cdict: dict) -> list[list]:
     """
@@ -153,8 +299,8 @@ def init_colorama():
 
 
 def to_excel_autowidth_and_border(
-    writer: pd.ExcelWriter,
-    df: pd.DataFrame,
+    writer: "pd.ExcelWriter",
+    df: "pd.DataFrame",
     sheetname: str,
     startrow: int,
     startcol: int,
@@ -219,7 +365,7 @@ def to_excel_autowidth_and_border(
     )
 
 
-def make_df_from_list(data: list[list]) -> pd.DataFrame:
+def make_df_from_list(data: list[list]) -> "pd.DataFrame":
     """
     Create a pandas DataFrame from a list of lists.
 
@@ -231,10 +377,12 @@ def make_df_from_list(data: list[list]) -> pd.DataFrame:
     :return: A pandas DataFrame created from the input data.
     :rtype: pd.DataFrame
     """
+    import pandas as pd
+
     return pd.DataFrame(data[1:], columns=data[0])
 
 
-def set_out_cell(outSheet: xlwt.Worksheet, row: int, col: int, value):
+def set_out_cell(outSheet: "xlwt.Worksheet", row: int, col: int, value):
     """
     Change cell value without changing formatting.
 
@@ -248,7 +396,7 @@ def set_out_cell(outSheet: xlwt.Worksheet, row: int, col: int, value):
     :type value: Any
     """
 
-    def _getOutCell(outSheet: xlwt.Worksheet, rowIndex: int, colIndex: int):
+    def _getOutCell(outSheet: "xlwt.Worksheet", rowIndex: int, colIndex: int):
         """HACK: Extract the internal xlwt cell representation."""
         row = outSheet._Worksheet__rows.get(rowIndex)
         if not row:
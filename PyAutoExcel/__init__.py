@@ -9,11 +9,7 @@ import sys
 if sys.version_info < (3, 9, 0):
     raise RuntimeError("Sorry, Python 3.9.0 or later required.")
 
-from xlrd import inspect_format
-
-
-# Migrate Bridge
-from .Bridge import migrate_style
+import importlib
 
 # Newer I/O Port
 from .Documents.File.Excel.ExcelDocument import Document as ExcelDocument
@@ -31,35 +27,56 @@ from .Documents.File.Excel.Writer.Excel import (
     remove_writer,
 )
 
-# Workbook API
-from .Documents.Workbook.BookType import WorkbookXLS, WorkbookXLSX
-from .ExtractVBA import extract_vba_project
+from PyAutoExcel.Cell import Cell
+from PyAutoExcel.CellRange import CellRange
 
-# HTML Exporter
-from .HTMLFile import HTMLSheet, save_html
+# The other APIs depend on xlrd, xlwt or openpyxl,
+# they are imported on first access to keep `import PyAutoExcel` cheap.
+_LAZY_NAMES = {
+    "inspect_format": ("xlrd", "inspect_format"),
+    # Migrate Bridge
+    "migrate_style": (".Bridge", "migrate_style"),
+    # Workbook API
+    "WorkbookXLS": (".Documents.Workbook.BookType", "WorkbookXLS"),
+    "WorkbookXLSX": (".Documents.Workbook.BookType", "WorkbookXLSX"),
+    "extract_vba_project": (".ExtractVBA", "extract_vba_project"),
+    # Metadata Scan
+    "scan": (".Documents.File.Excel.Reader.Scan", "scan"),
+    # Instrumentation
+    "tracing": (".Tracing", "tracing"),
+    "PhaseRecorder": (".Tracing", "PhaseRecorder"),
+    # HTML Exporter
+    "HTMLSheet": (".HTMLFile", "HTMLSheet"),
+    "save_html": (".HTMLFile", "save_html"),
+    # HTML Table Generator
+    "BasicHTMLTable": (".TableGenerator", "BasicTableGenerator"),
+    "HTMLTable": (".TableGenerator", "CustomTableGenerator"),
+    # XF Style API
+    "XFAlignment": (".XFStyles", "XFAlignment"),
+    "XFAlignmentConst": (".XFStyles", "XFAlignmentConst"),
+    "XFBorders": (".XFStyles", "XFBorders"),
+    "XFBordersConst": (".XFStyles", "XFBordersConst"),
+    "XFFont": (".XFStyles", "XFFont"),
+    "XFFontConst": (".XFStyles", "XFFontConst"),
+    "XFPattern": (".XFStyles", "XFPattern"),
+    "XFPatternConst": (".XFStyles", "XFPatternConst"),
+    "XFProtection": (".XFStyles", "XFProtection"),
+    "XFStyle": (".XFStyles", "XFStyle"),
+}
 
-# HTML Table Generator
-from .TableGenerator import (
-    BasicTableGenerator as BasicHTMLTable,
-    CustomTableGenerator as HTMLTable,
-)
 
-# XF Style API
-from .XFStyles import (
-    XFAlignment,
-    XFAlignmentConst,
-    XFBorders,
-    XFBordersConst,
-    XFFont,
-    XFFontConst,
-    XFPattern,
-    XFPatternConst,
-    XFProtection,
-    XFStyle,
-)
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        module_name, attr = _LAZY_NAMES[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
 
-from PyAutoExcel.Cell import Cell
-from PyAutoExcel.CellRange import CellRange
 
 __version__ = "3.0.2"
 
@@ -76,6 +93,9 @@ __all__ = [
     "Sheet",
     "ExcelReader",
     "ExcelWriter",
+    "scan",
+    "tracing",
+    "PhaseRecorder",
     "WorkbookXLS",
     "WorkbookXLSX",
     "extract_vba_project",
@@ -0,0 +1,525 @@
+"""
+Benchmarks of the reader and writer engines.
+
+Each workload is a deterministic sheet of a given shape, read, written and
+round-tripped by every registered engine able to handle its format::
+
+    python -m PyAutoExcel.bench --shapes tall,numeric --cells 200000 --format csv -o bench.csv
+
+Every measure runs in a fresh process, so the peak RSS of an engine is not
+hidden by the memory used by the previous ones. Engines whose library is not
+installed are reported as 'unavailable'.
+
+With ``--calibrate``, the results are also saved as the calibration profile
+used to choose the engines (see `PyAutoExcel.EngineSelector`).
+"""
+import argparse
+import csv
+import datetime
+import io
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Sequence, TextIO, Type
+
+from PyAutoExcel.Documents.File.Excel.Reader.Excel import readers
+from PyAutoExcel.Documents.File.Excel.Sheet import Sheet
+from PyAutoExcel.Documents.File.Excel.Writer.Excel import writers
+from PyAutoExcel.Engines.ReaderBase import BaseReader
+from PyAutoExcel.Engines.WriterBase import BaseWriter
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class Shape(NamedTuple):
+    """
+    The shape of a generated sheet.
+
+    :ivar ncols: The number of columns.
+    :ivar density: The fraction of the cells holding a value.
+    :ivar kind: The values: 'mixed' (numbers and strings), 'number', 'string' or 'date'.
+    """
+
+    ncols: int
+    density: float
+    kind: str
+
+
+# The columns stay below the 256 columns of an xls sheet.
+SHAPES = {
+    "tall": Shape(10, 1.0, "mixed"),
+    "wide": Shape(250, 1.0, "mixed"),
+    "sparse": Shape(100, 0.02, "mixed"),
+    "string": Shape(20, 1.0, "string"),
+    "numeric": Shape(20, 1.0, "number"),
+    "date": Shape(10, 1.0, "date"),
+}
+
+OPERATIONS = ("read", "write", "roundtrip")
+
+# The engines writing the input files of the readers, and reading back the round-trips.
+REFERENCE_READERS = {"xlsx": "native", "xls": "xlrd"}
+REFERENCE_WRITERS = {"xlsx": "native", "xls": "xlwt"}
+
+# The distributions of the engine libraries, to record their versions.
+DISTRIBUTIONS = {
+    "openpyxl": "openpyxl",
+    "xlrd": "xlrd",
+    "python-xlsxio": "python-xlsxio",
+    "sxl": "sxl",
+    "xlsxlite": "xlsxlite",
+    "xlsxcessive": "xlsxcessive",
+    "xlwt": "xlwt",
+    "xlsxwriter": "XlsxWriter",
+}
+
+FIELDS = (
+    "shape",
+    "operation",
+    "engine",
+    "format",
+    "size",
+    "rows",
+    "cols",
+    "cells",
+    "seconds",
+    "cells_per_s",
+    "peak_rss",
+    "input_bytes",
+    "output_bytes",
+    "status",
+    "error",
+)
+
+WORDS = [
+    "".join(
+        random.Random(i).choice("abcdefghijklmnopqrstuvwxyz") for _ in range(3 + i % 8)
+    )
+    for i in range(1000)
+]
+EPOCH = datetime.datetime(2000, 1, 1)
+
+
+def _value(rng: random.Random, kind: str, col: int) -> Any:
+    if kind == "mixed":
+        # Dates are left to the date shape, some engines cannot write them.
+        kind = ("number", "number", "string")[col % 3]
+    if kind == "number":
+        return rng.randrange(1_000_000) if col % 2 else rng.uniform(-1e6, 1e6)
+    if kind == "string":
+        # Half of the strings repeat, the other half are unique.
+        if rng.random() < 0.5:
+            return rng.choice(WORDS)
+        return " ".join(rng.choice(WORDS) for _ in range(1 + rng.randrange(4)))
+    if col % 2:
+        return EPOCH.date() + datetime.timedelta(days=rng.randrange(10_000))
+    return EPOCH + datetime.timedelta(seconds=rng.randrange(10_000 * 86_400))
+
+
+def make_sheet(shape: str, cells: int, seed: int = 0) -> Sheet:
+    """
+    Generates a sheet of the given shape, the same seed always gives the same sheet.
+
+    :param shape: The name of the shape, see `SHAPES`.
+    :type shape: str
+    :param cells: The approximate number of cells holding a value.
+    :type cells: int
+    :param seed: The seed of the values.
+    :type seed: int
+    :return: The sheet, named after the shape.
+    :rtype: Sheet
+    """
+    ncols, density, kind = SHAPES[shape]
+    rng = random.Random(f"{seed}:{shape}")
+    nrows = max(1, round(cells / (ncols * density)))
+    sheet = Sheet(shape)
+    if density >= 1:
+        for i in range(nrows):
+            sheet.set_row(i, [_value(rng, kind, j) for j in range(ncols)])
+    else:
+        for i in range(nrows):
+            for j in range(ncols):
+                if rng.random() < density:
+                    sheet.set_cell(i, j, _value(rng, kind, j))
+    return sheet
+
+
+def count_cells(sheets: Iterable[Sheet]) -> int:
+    """
+    Counts the cells holding a value.
+    """
+    return sum(
+        1
+        for s in sheets
+        for _, row in s.iter_populated_rows()
+        for v in row
+        if v is not None and v != ""
+    )
+
+
+def engine_formats(engine: type) -> tuple:
+    """
+    Returns the formats handled by an engine class.
+    """
+    return tuple(getattr(engine, "__formats__", ("xlsx",)))
+
+
+def _peak_rss() -> Optional[int]:
+    """
+    Returns the peak resident set size of the process in bytes, or None if it is unknown.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _write(engine: Type[BaseWriter], sheet: Sheet) -> bytes:
+    writer = engine()
+    writer.sheets.append(sheet)
+    return writer.save(None)
+
+
+def _read(engine: Type[BaseReader], content: bytes) -> list[Sheet]:
+    reader = engine(io.BytesIO(content))
+    try:
+        return reader.sheets
+    finally:
+        reader.close()
+
+
+def measure(
+    operation: str,
+    engine: type,
+    shape: str,
+    cells: int,
+    seed: int = 0,
+    fmt: str = "xlsx",
+    repeat: int = 1,
+    content: Optional[bytes] = None,
+) -> dict[str, Any]:
+    """
+    Measures one operation of one engine on one workload, in the current process.
+
+    :param operation: 'read', 'write' or 'roundtrip' (write, then read back with the reference reader).
+    :param engine: The reader class for 'read', the writer class otherwise.
+    :param shape: The name of the shape of the sheet.
+    :param cells: The approximate number of cells of the sheet.
+    :param seed: The seed of the values.
+    :param fmt: The format of the file.
+    :param repeat: The number of runs, the fastest one is kept.
+    :param content: The file read by 'read'.
+    :return: A result, with the keys of `FIELDS`. ``size`` is the requested number of cells.
+    """
+    result = dict.fromkeys(FIELDS)
+    result.update(
+        shape=shape,
+        operation=operation,
+        engine=engine.__engine__,
+        format=fmt,
+        size=cells,
+        status="ok",
+    )
+    sheet = None if operation == "read" else make_sheet(shape, cells, seed)
+    best = None
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            if operation == "read":
+                sheets = _read(engine, content)
+            else:
+                content = _write(engine, sheet)
+                if operation == "roundtrip":
+                    sheets = _read(readers.get(REFERENCE_READERS[fmt]), content)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    except ImportError as e:
+        result.update(status="unavailable", error=str(e))
+        return result
+    except Exception as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}")
+        return result
+    result["peak_rss"] = _peak_rss()
+    if operation == "read":
+        result["input_bytes"] = len(content)
+    else:
+        result["output_bytes"] = len(content)
+        sheets = sheets if operation == "roundtrip" else [sheet]
+    result["rows"] = max((s.nrows() for s in sheets), default=0)
+    result["cols"] = max((s.ncols() for s in sheets), default=0)
+    result["cells"] = count_cells(sheets)
+    result["seconds"] = best
+    result["cells_per_s"] = result["cells"] / best if best else None
+    if operation == "roundtrip" and result["cells"] != count_cells([sheet]):
+        result["status"] = "mismatch"
+        result[
+            "error"
+        ] = f"{count_cells([sheet])} cells written, {result['cells']} read back"
+    return result
+
+
+def _measure_in_process(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Runs `measure()` in a new process, to isolate its peak RSS.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, **kwargs).result()
+
+
+def run(
+    shapes: Sequence[str] = tuple(SHAPES),
+    operations: Sequence[str] = OPERATIONS,
+    reader_engines: Optional[Sequence[str]] = None,
+    writer_engines: Optional[Sequence[str]] = None,
+    cells: int = 100_000,
+    seed: int = 0,
+    repeat: int = 1,
+    isolate: bool = True,
+    progress: Optional[Callable[[dict[str, Any]], None]] = None,
+) -> list[dict[str, Any]]:
+    """
+    Benchmarks the engines on the workloads.
+
+    :param shapes: The names of the shapes, see `SHAPES`.
+    :param operations: The operations, among 'read', 'write' and 'roundtrip'.
+    :param reader_engines: The names of the reader engines. Default to all registered readers.
+    :param writer_engines: The names of the writer engines. Default to all registered writers.
+    :param cells: The approximate number of cells of each sheet.
+    :param seed: The seed of the values.
+    :param repeat: The number of runs of each measure, the fastest one is kept.
+    :param isolate: If True, each measure runs in a new process.
+                    Engines registered at runtime must then be importable by the new process.
+    :param progress: A callable receiving each result as soon as it is measured.
+    :return: The results, with the keys of `FIELDS`.
+    :raise ValueError: If a shape or an operation is unknown.
+    """
+    for name in shapes:
+        if name not in SHAPES:
+            raise ValueError(
+                f"Unknown shape {name!r}, expected one of {', '.join(SHAPES)}."
+            )
+    for name in operations:
+        if name not in OPERATIONS:
+            raise ValueError(
+                f"Unknown operation {name!r}, expected one of {', '.join(OPERATIONS)}."
+            )
+    reader_engines = (
+        list(readers.engines) if reader_engines is None else list(reader_engines)
+    )
+    writer_engines = (
+        list(writers.engines) if writer_engines is None else list(writer_engines)
+    )
+    results = []
+    for shape in shapes:
+        cases = []
+        inputs = {}
+        if "read" in operations:
+            for name in reader_engines:
+                engine = readers.get(name)
+                fmt = engine_formats(engine)[0]
+                if fmt not in inputs:
+                    writer = writers.get(REFERENCE_WRITERS[fmt])
+                    inputs[fmt] = _write(writer, make_sheet(shape, cells, seed))
+                cases.append(
+                    dict(operation="read", engine=engine, fmt=fmt, content=inputs[fmt])
+                )
+        for operation in ("write", "roundtrip"):
+            if operation in operations:
+                for name in writer_engines:
+                    engine = writers.get(name)
+                    cases.append(
+                        dict(
+                            operation=operation,
+                            engine=engine,
+                            fmt=engine_formats(engine)[0],
+                        )
+                    )
+        for case in cases:
+            case.update(shape=shape, cells=cells, seed=seed, repeat=repeat)
+            result = _measure_in_process(case) if isolate else measure(**case)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def environment() -> dict[str, Any]:
+    """
+    Describes the machine and the versions of the engine libraries, to compare runs.
+    """
+    from importlib import metadata
+
+    import PyAutoExcel
+
+    versions = {}
+    for engine, dist in DISTRIBUTIONS.items():
+        try:
+            versions[engine] = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            versions[engine] = None
+    return {
+        "PyAutoExcel": PyAutoExcel.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "libraries": versions,
+    }
+
+
+def write_json(
+    results: list[dict[str, Any]], file: TextIO, options: Optional[dict] = None
+):
+    """
+    Writes the results and the environment as a JSON document.
+    """
+    document = {
+        "environment": environment(),
+        "options": options or {},
+        "results": results,
+    }
+    json.dump(document, file, indent=2)
+    file.write("\n")
+
+
+def write_csv(results: list[dict[str, Any]], file: TextIO):
+    """
+    Writes the results as CSV, one row per measure.
+    """
+    writer = csv.DictWriter(file, fieldnames=FIELDS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(results)
+
+
+def _names(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _sizes(value: str) -> list[int]:
+    return [int(v) for v in _names(value)]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m PyAutoExcel.bench",
+        description="Benchmark the PyAutoExcel engines.",
+    )
+    parser.add_argument(
+        "--shapes",
+        type=_names,
+        default=list(SHAPES),
+        help=f"Comma-separated shapes, among {', '.join(SHAPES)}. Default to all.",
+    )
+    parser.add_argument(
+        "--operations",
+        type=_names,
+        default=list(OPERATIONS),
+        help="Comma-separated operations, among read, write and roundtrip. Default to all.",
+    )
+    parser.add_argument(
+        "--readers",
+        type=_names,
+        default=None,
+        help="Comma-separated reader engines. Default to all registered readers.",
+    )
+    parser.add_argument(
+        "--writers",
+        type=_names,
+        default=None,
+        help="Comma-separated writer engines. Default to all registered writers.",
+    )
+    parser.add_argument(
+        "--cells",
+        type=_sizes,
+        default=[100_000],
+        help="Approximate number of cells per sheet, or a comma-separated list of sizes.",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed of the generated values."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Runs of each measure, the fastest is kept.",
+    )
+    parser.add_argument(
+        "--no-isolate",
+        dest="isolate",
+        action="store_false",
+        help="Measure in this process. Faster, but the peak RSS is shared by all measures.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "csv"),
+        default="json",
+        help="Format of the report.",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="Path of the report. Default to stdout."
+    )
+    parser.add_argument(
+        "--calibrate",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="Also save the results as the calibration profile of the engine selection, "
+        "to PATH or to the default profile.",
+    )
+    args = parser.parse_args(argv)
+
+    def progress(result):
+        seconds = "-" if result["seconds"] is None else f"{result['seconds']:.3f}s"
+        print(
+            f"{result['shape']:>8} {result['operation']:>9} {result['engine']:>14} {seconds:>9} {result['status']}",
+            file=sys.stderr,
+        )
+
+    results = []
+    try:
+        for cells in args.cells:
+            results += run(
+                args.shapes,
+                args.operations,
+                args.readers,
+                args.writers,
+                cells=cells,
+                seed=args.seed,
+                repeat=args.repeat,
+                isolate=args.isolate,
+                progress=progress,
+            )
+    except (KeyError, ValueError) as e:
+        parser.error(str(e))
+    if args.calibrate is not None:
+        from PyAutoExcel.EngineSelector import Profile
+
+        path = Profile.from_results(results).save(args.calibrate or None)
+        print(f"Calibration profile saved to {path}", file=sys.stderr)
+    options = {k: v for k, v in vars(args).items() if k not in ("format", "output")}
+    output = (
+        sys.stdout
+        if args.output == "-"
+        else open(args.output, "w", newline="", encoding="utf-8")
+    )
+    try:
+        if args.format == "json":
+            write_json(results, output, options)
+        else:
+            write_csv(results, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
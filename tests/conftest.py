@@ -0,0 +1,57 @@
+import importlib.util
+
+import pytest
+
+from PyAutoExcel import ExcelWriter, Sheet
+
+# The reader engines tested, with the writer producing their files.
+READERS = {"native": "native", "openpyxl": "openpyxl", "sxl": "native", "xlrd": "xlwt"}
+MODULES = {
+    "native": None,
+    "openpyxl": "openpyxl",
+    "sxl": "sxl",
+    "xlrd": "xlrd",
+    "xlwt": "xlwt",
+}
+
+
+def installed(engine: str) -> bool:
+    module = MODULES.get(engine)
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+@pytest.fixture
+def make_xlsx(tmp_path):
+    """
+    Return a function writing sheets given as {name: rows} to an xlsx file, and returning its path.
+    """
+
+    def make(sheets: dict, name: str = "book.xlsx", engine: str = "native") -> str:
+        writer = ExcelWriter(engine)
+        for title, rows in sheets.items():
+            sheet = Sheet(title)
+            sheet.data = rows
+            writer.add_sheet(sheet)
+        path = str(tmp_path / name)
+        writer.save(path)
+        return path
+
+    return make
+
+
+@pytest.fixture(params=sorted(READERS))
+def reader_file(request, make_xlsx):
+    """
+    Return a function writing sheets to a file readable by the reader engine of the parameter,
+    and returning (path, engine).
+    """
+    engine = request.param
+    writer = READERS[engine]
+    if not installed(engine) or not installed(writer):
+        pytest.skip(f"{engine} is not installed")
+
+    def make(sheets: dict) -> tuple[str, str]:
+        name = "book.xls" if writer == "xlwt" else "book.xlsx"
+        return make_xlsx(sheets, name, writer), engine
+
+    return make
@@ -0,0 +1,79 @@
+import datetime
+
+import pytest
+
+from PyAutoExcel import ExcelReader
+
+np = pytest.importorskip("numpy")
+
+ROWS = [
+    ["ID", "Amount", "Name", "When", "Flag"],
+    [1, 1.5, "a", datetime.datetime(2024, 1, 2), True],
+    [2, None, "b", None, False],
+    [3, 2.5, None, datetime.datetime(2024, 1, 3), True],
+    [None, 4, "d", None, False],
+]
+BOOK = {"S": ROWS}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_inferred_dtypes(reader_file, lazy):
+    path, engine = reader_file(BOOK)
+    if engine == "xlrd":
+        pytest.skip("xlrd returns dates and booleans as numbers")
+    with ExcelReader(path, engine, lazy=lazy, header_row=0) as reader:
+        arrays = reader.to_arrays()
+    assert list(arrays) == ROWS[0]
+    assert [arrays[name].dtype.kind for name in arrays] == ["f", "f", "O", "M", "b"]
+    assert np.isnan(arrays["ID"][3]) and np.isnan(arrays["Amount"][1])
+    assert arrays["Name"].tolist() == ["a", "b", None, "d"]
+    assert np.isnat(arrays["When"][1])
+    assert arrays["When"][0] == np.datetime64("2024-01-02")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_explicit_dtypes_and_missing_values(make_xlsx, lazy):
+    path = make_xlsx(BOOK)
+    with ExcelReader(path, "native", lazy=lazy, header_row=0) as reader:
+        with pytest.raises(ValueError, match="na_value"):
+            reader.to_arrays(dtype={"ID": "int64"})
+        arrays = reader.to_arrays(dtype={"ID": "int32", 1: "float32"}, na_value=-1)
+    assert arrays["ID"].dtype == np.int32 and arrays["ID"].tolist() == [1, 2, 3, -1]
+    assert arrays["Amount"].dtype == np.float32
+    assert arrays["Amount"].tolist() == [1.5, -1, 2.5, 4]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_window_and_columns(make_xlsx, lazy):
+    path = make_xlsx(BOOK)
+    with ExcelReader(
+        path,
+        "native",
+        lazy=lazy,
+        header_row=0,
+        usecols=["ID", "Flag"],
+        skiprows=1,
+        nrows=2,
+    ) as reader:
+        arrays = reader.to_arrays(dtype="int64")
+    assert {k: v.tolist() for k, v in arrays.items()} == {"ID": [2, 3], "Flag": [0, 1]}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_to_numpy(make_xlsx, lazy):
+    path = make_xlsx(BOOK)
+    with ExcelReader(
+        path, "native", lazy=lazy, header_row=0, usecols="A:B", nrows=3
+    ) as reader:
+        matrix = reader.to_numpy(dtype="float64")
+        records = reader.to_numpy(structured=True)
+    assert matrix.shape == (3, 2)
+    assert np.array_equal(matrix, [[1, 1.5], [2, np.nan], [3, 2.5]], equal_nan=True)
+    assert records.dtype.names == ("ID", "Amount")
+    assert records["ID"].tolist() == [1, 2, 3]
+
+
+def test_columns_are_named_after_their_letters(make_xlsx):
+    path = make_xlsx(BOOK)
+    with ExcelReader(path, "native", lazy=True) as reader:
+        assert list(reader.to_arrays()) == ["A", "B", "C", "D", "E"]
@@ -0,0 +1,32 @@
+import asyncio
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from PyAutoExcel import ExcelReader, ExcelWriter
+
+ROWS = [["a", "b"], [1, 2], [3, 4]]
+
+
+def test_open_and_save_async(make_xlsx, tmp_path):
+    path = make_xlsx({"S": ROWS})
+
+    async def copy():
+        reader = await ExcelReader.open_async(path, lazy=True)
+        rows = [row async for row in reader.aiter_rows(0, chunk_size=1)]
+        reader.close()
+        writer = ExcelWriter.from_reader(await ExcelReader.open_async(path))
+        with ThreadPoolExecutor(1) as executor:
+            await writer.save_async(str(tmp_path / "copy.xlsx"), executor=executor)
+        return rows
+
+    assert asyncio.run(copy()) == ROWS
+    assert ExcelReader(str(tmp_path / "copy.xlsx")).sheet_by_index(0).data == ROWS
+
+
+def test_import_does_not_load_asyncio():
+    code = "import sys, PyAutoExcel; print('asyncio' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,135 @@
+import datetime
+import os
+
+import pytest
+
+from PyAutoExcel import ExcelDocument, ExcelReader, Sheet
+from PyAutoExcel.Cache import SUFFIX, CachedReader, DiskCache, MemoryCache
+from PyAutoExcel.Grid import ColumnarGrid, DenseGrid, SparseGrid
+
+ROWS = [["a", "b", "c"], [1, 2, 3]]
+
+
+def entries(directory) -> list[str]:
+    return sorted(name for name in os.listdir(directory))
+
+
+def sheet(grid_class=None, rows=ROWS) -> Sheet:
+    s = Sheet("S", grid_class)
+    s.data = rows
+    return s
+
+
+def test_memory_cache_hit(make_xlsx):
+    path = make_xlsx({"S": ROWS})
+    cache = MemoryCache()
+    ExcelReader(path, cache=cache)
+    reader = ExcelReader(path, cache=cache)
+    assert reader.sheet_by_index(0).data == ROWS
+    assert cache.info().hits == 1
+
+
+def test_loaded_document_edits_do_not_reach_the_cache(make_xlsx):
+    path = make_xlsx({"S": ROWS})
+    cache = MemoryCache()
+    first = ExcelDocument()
+    first.load(path, cache=cache)  # Miss, the parsed sheets are stored.
+    first.sheets[0].set_cell(0, 0, "MUTATED")
+    second = ExcelDocument()
+    second.load(path, cache=cache)  # Hit.
+    assert second.sheets[0].get_row(0) == ["a", "b", "c"]
+    second.sheets[0].set_row(1, ["x", "y", "z"])
+    third = ExcelDocument()
+    third.load(path, cache=cache)
+    assert third.sheets[0].data == ROWS
+    assert cache.info().hits == 2
+
+
+@pytest.mark.parametrize("grid_class", [DenseGrid, SparseGrid, ColumnarGrid])
+def test_cache_copies_every_grid(make_xlsx, grid_class):
+    path = make_xlsx({"S": ROWS})
+    cache = MemoryCache()
+    ExcelReader(path, cache=cache, grid_class=grid_class).sheet_by_index(0).set_cell(
+        1, 0, 99
+    )
+    sheet = ExcelReader(path, cache=cache, grid_class=grid_class).sheet_by_index(0)
+    assert isinstance(sheet.grid, grid_class)
+    assert sheet.data == ROWS
+
+
+def test_disk_cache_hit(make_xlsx, tmp_path):
+    path = make_xlsx({"S": ROWS})
+    cache = DiskCache(str(tmp_path / "cache"))
+    assert not isinstance(ExcelReader(path, cache=cache)._engine, CachedReader)
+    assert len(entries(cache.directory)) == 1
+    reader = ExcelReader(path, cache=cache)
+    assert isinstance(reader._engine, CachedReader)
+    assert reader.sheet_by_index(0).data == ROWS
+
+
+def test_disk_cache_miss_after_the_file_changes(make_xlsx, tmp_path):
+    path = make_xlsx({"S": ROWS})
+    cache = DiskCache(str(tmp_path / "cache"))
+    ExcelReader(path, cache=cache)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reader = ExcelReader(path, cache=cache)
+    assert not isinstance(reader._engine, CachedReader)
+    assert len(entries(cache.directory)) == 2
+    make_xlsx({"S": [["changed"]]})  # Same path, other content.
+    assert ExcelReader(path, cache=cache).sheet_by_index(0).data == [["changed"]]
+
+
+def test_disk_cache_writes_atomically(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path))
+    cache.put("k", [sheet()])
+    assert entries(tmp_path) == ["k" + SUFFIX]
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        cache.put("other", [sheet()])
+    # The temporary file is removed, and the previous entry is intact.
+    assert entries(tmp_path) == ["k" + SUFFIX]
+    assert cache.get("k")[0].data == ROWS
+
+
+def test_disk_cache_damaged_entry_is_a_miss(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.put("k", [sheet()])
+    with open(tmp_path / ("k" + SUFFIX), "r+b") as f:
+        f.truncate(20)
+    assert cache.get("k") is None
+    assert entries(tmp_path) == []
+
+
+def test_disk_cache_evicts_the_least_recently_used(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    for i, key in enumerate("abc"):
+        cache.put(key, [sheet()])
+        os.utime(cache._path(key), ns=(i * 10**9, i * 10**9))
+    cache.get("a")  # Now the most recently used.
+    cache.max_size = cache.size * 2 // 3
+    cache.evict()
+    assert entries(tmp_path) == ["a" + SUFFIX, "c" + SUFFIX]
+    # An entry larger than the cache is not stored.
+    cache.max_size = 10
+    cache.put("d", [sheet()])
+    assert not os.path.exists(cache._path("d"))
+
+
+def test_disk_cache_columnar_grid_round_trip(tmp_path):
+    pytest.importorskip("numpy")
+    rows = [[1, 1.5, datetime.datetime(2024, 1, 2), True], [2, None, None, False]]
+    cache = DiskCache(str(tmp_path))
+    cache.put("k", [sheet(ColumnarGrid, rows)])
+    loaded = cache.get("k")[0]
+    assert isinstance(loaded.grid, ColumnarGrid)
+    assert loaded.data == rows
+    values, mask = loaded.grid.get_array(1)
+    assert values.dtype.kind == "f" and mask.tolist() == [True, False]
+    # The arrays are backed by the data read from the file, and still writable.
+    loaded.set_cell(1, 1, 2.5)
+    assert loaded.get_row(1)[1] == 2.5
@@ -0,0 +1,38 @@
+import pytest
+
+from PyAutoExcel import ExcelDocument
+
+BOOK = {"First": [["a", 1]], "Second": [["b", 2]]}
+
+
+def test_lazy_document_is_closed(make_xlsx):
+    path = make_xlsx(BOOK)
+    with ExcelDocument() as document:
+        document.load(path, "native", lazy=True)
+        assert document.sheet_by_name("Second").data == [["b", 2]]
+        engine = document._reader._engine
+        assert not engine._closed
+    assert engine._closed
+    # The sheets already read stay available.
+    assert document.sheet_by_name("Second").data == [["b", 2]]
+    document.close()
+
+
+def test_xls_resources_are_released_on_error(make_xlsx, monkeypatch):
+    xlrd = pytest.importorskip("xlrd")
+    pytest.importorskip("xlwt")
+    from PyAutoExcel.Documents.Workbook.BookImpl import Binary
+
+    path = make_xlsx(BOOK, "book.xls", "xlwt")
+    released = []
+    monkeypatch.setattr(
+        xlrd.book.Book, "release_resources", lambda book: released.append(book)
+    )
+
+    def fail(*args):
+        raise RuntimeError("broken sheet")
+
+    monkeypatch.setattr(Binary.Sheet, "set_row", fail)
+    with pytest.raises(RuntimeError):
+        Binary.EngineXLS.read(path)
+    assert len(released) == 1
@@ -0,0 +1,131 @@
+import json
+import os
+
+import pytest
+
+from PyAutoExcel.Documents.File.Excel.Register import Register
+from PyAutoExcel.EngineSelector import (
+    PROFILE_VERSION,
+    Profile,
+    candidates,
+    get_profile,
+    installed,
+    select_reader,
+    select_writer,
+)
+
+
+def entry(engine, size, cells_per_s, operation="read", failures=()):
+    return {
+        "operation": operation,
+        "format": "xlsx",
+        "engine": engine,
+        "size": size,
+        "cells_per_s": cells_per_s,
+        "bytes_per_cell": 10.0 if operation == "read" else None,
+        "failures": list(failures),
+    }
+
+
+PROFILE = Profile(
+    [
+        entry("native", 1000, 100.0),
+        entry("openpyxl", 1000, 50.0),
+        entry("native", 10**6, 100.0),
+        entry("openpyxl", 10**6, 500.0),
+        entry("sxl", 10**6, 900.0, failures=["wide"]),
+        entry("python-xlsxio", 10**6, 10**4),  # Not installed.
+        entry("native", 10**6, 10.0, "write"),
+        entry("openpyxl", 10**6, 20.0, "write"),
+    ]
+)
+
+
+def engine(formats=("xlsx",), requires=(), features=(), streaming=True):
+    return type(
+        "Engine",
+        (),
+        {
+            "__formats__": formats,
+            "__requires__": requires,
+            "__features__": frozenset(features),
+            "streaming": classmethod(lambda cls: streaming),
+        },
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_profile(monkeypatch, tmp_path):
+    monkeypatch.setenv("PYAUTOEXCEL_PROFILE", str(tmp_path / "missing.json"))
+
+
+def test_rank():
+    # The closest size is used, and engines which failed a workload come last.
+    assert PROFILE.rank("read", "xlsx", 2000) == ["native", "openpyxl"]
+    assert PROFILE.rank("read", "xlsx") == [
+        "python-xlsxio",
+        "openpyxl",
+        "native",
+        "sxl",
+    ]
+    assert PROFILE.rank("write", "xlsx", 10) == ["openpyxl", "native"]
+    assert PROFILE.rank("read", "xls") == []
+
+
+def test_select_with_a_profile():
+    pytest.importorskip("openpyxl")
+    # 10 bytes per cell, so a file of 10 MB has about 10**6 cells.
+    # python-xlsxio is the fastest, but it is not installed.
+    assert select_reader("xlsx", size=10**7, profile=PROFILE) == "openpyxl"
+    assert select_reader("xlsx", size=10**4, profile=PROFILE) == "native"
+    assert select_writer("xlsx", cells=10**6, profile=PROFILE) == "openpyxl"
+
+
+def test_select_without_a_profile():
+    # The first installed engine of READER_PREFERENCES or WRITER_PREFERENCES.
+    assert get_profile() is None
+    assert select_reader("xlsx") == "native"
+    expected = "xlsxwriter" if installed("xlsxwriter") else "native"
+    assert select_writer("xlsx") == expected
+    assert select_writer("xlsx", profile=False) == expected
+    assert select_reader("csv") is None
+
+
+def test_candidates_filter_by_feature_and_streaming():
+    register = Register()
+    register.add("plain", engine())
+    register.add("styled", engine(features=("formatting", "dates")))
+    register.add("batch", engine(streaming=False))
+    register.add("old", engine(formats=("xls",)))
+    register.add("missing", engine(requires=("no_such_module_anywhere",)))
+    assert candidates(register, "xlsx") == ["plain", "styled", "batch"]
+    assert candidates(register, "xlsx", features=["formatting"]) == ["styled"]
+    assert candidates(register, "xlsx", streaming=True) == ["plain", "styled"]
+    assert candidates(register, "xlsx", features=["streaming"]) == ["plain", "styled"]
+    assert candidates(register, "xls") == ["old"]
+    with pytest.raises(ValueError, match="charts"):
+        candidates(register, "xlsx", features=["charts"])
+
+
+def test_profile_round_trip_and_reload(tmp_path):
+    path = str(tmp_path / "profile.json")
+    PROFILE.save(path)
+    profile = get_profile(path)
+    assert profile.entries == PROFILE.entries
+    assert get_profile(path) is profile  # Unchanged file, cached.
+    Profile([entry("sxl", 10, 1.0)]).save(path)
+    os.utime(path, (1, 1))
+    assert get_profile(path).rank("read", "xlsx") == ["sxl"]
+
+
+@pytest.mark.parametrize(
+    "content", ["not json", json.dumps({"version": PROFILE_VERSION + 1})]
+)
+def test_invalid_profile_is_ignored(tmp_path, monkeypatch, content):
+    path = tmp_path / "profile.json"
+    path.write_text(content)
+    monkeypatch.setenv("PYAUTOEXCEL_PROFILE", str(path))
+    with pytest.warns(RuntimeWarning, match="Ignoring the engine profile"):
+        assert get_profile() is None
+    # The fallback order is used.
+    assert select_reader("xlsx") == "native"
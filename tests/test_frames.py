@@ -0,0 +1,108 @@
+import datetime
+import io
+import zipfile
+
+import pytest
+
+from PyAutoExcel import ExcelReader, ExcelWriter, Sheet
+from PyAutoExcel.Frames import column_values, frame_header, iter_frame_rows
+from PyAutoExcel.Grid import ColumnarGrid, DenseGrid
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+WRITERS = {
+    "native": "xlsx",
+    "openpyxl": "xlsx",
+    "xlsxwriter": "xlsx",
+    "xlsxlite": "xlsx",
+    "xlsxcessive": "xlsx",
+    "xlwt": "xls",
+}
+
+
+def frame():
+    return pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, np.nan, 3.0],
+            "text": ["a", None, "c"],
+            "when": pd.to_datetime(
+                ["2024-01-02 03:04:05", None, "2024-01-03 00:00:00"]
+            ),
+            "flag": [True, False, True],
+        }
+    )
+
+
+def test_column_values():
+    assert column_values(np.array([1.5, np.nan])) == [1.5, None]
+    assert column_values(np.array(["2024-01-02", "NaT"], dtype="datetime64[ns]")) == [
+        datetime.datetime(2024, 1, 2),
+        None,
+    ]
+    assert column_values(pd.array([1, None], dtype="Int64")) == [1, None]
+
+
+def test_header_and_rows():
+    df = frame().set_index("int")
+    assert frame_header(df, index=True) == ["int", "float", "text", "when", "flag"]
+    rows = list(iter_frame_rows(df, index=True, chunk_size=2))
+    assert rows[2] == (2, None, None, None, False)
+    assert len(rows) == 4
+
+
+@pytest.mark.parametrize("engine", sorted(WRITERS))
+def test_write_frame(engine):
+    pytest.importorskip(engine if engine != "native" else "zipfile")
+    writer = ExcelWriter(engine, WRITERS[engine])
+    assert writer.write_frame(frame(), "Data") == 4
+    content = writer.save()
+    reader = "xlrd" if WRITERS[engine] == "xls" else "openpyxl"
+    data = ExcelReader(io.BytesIO(content), reader).sheet_by_index(0).data
+    assert data[0] == ["int", "float", "text", "when", "flag"]
+    assert data[1][:3] == [1, 1.5, "a"] and data[1][4] in (True, 1)
+    assert data[2][1] in ("", None) and data[2][3] in ("", None)
+    if engine == "xlsxcessive":
+        # openpyxl only reads the styles at xl/styles.xml, xlsxcessive writes them at the root.
+        sheet = zipfile.ZipFile(io.BytesIO(content)).read("worksheet1.xml").decode()
+        assert '<c r="D2" t="n" s="2"><v>45293.127' in sheet
+    elif reader == "openpyxl":
+        # Datetime columns are written as dates, not as bare serial numbers.
+        assert data[1][3] == datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+
+def test_xls_dates_have_a_date_format():
+    xlrd = pytest.importorskip("xlrd")
+    pytest.importorskip("xlwt")
+    writer = ExcelWriter("xlwt", "xls")
+    writer.write_frame(frame())
+    book = xlrd.open_workbook(file_contents=writer.save(), formatting_info=True)
+    assert book.sheet_by_index(0).cell(1, 3).ctype == xlrd.XL_CELL_DATE
+
+
+def test_read_frame_and_sheet_round_trip():
+    df = frame()
+    writer = ExcelWriter("native")
+    writer.write_frame(df)
+    with ExcelReader(
+        io.BytesIO(writer.save()), "native", lazy=True, header_row=0
+    ) as reader:
+        out = reader.read_frame()
+    assert list(out.dtypes.map(lambda d: d.kind)) == ["i", "f", "O", "M", "b"]
+    pd.testing.assert_frame_equal(out.astype({"when": df["when"].dtype}), df)
+    out = Sheet.from_dataframe(df, "S").to_dataframe()
+    pd.testing.assert_frame_equal(out.astype({"when": df["when"].dtype}), df)
+
+
+@pytest.mark.parametrize("header", [True, False])
+@pytest.mark.parametrize("index", [True, False])
+def test_columnar_sheet_from_dataframe(header, index):
+    df = frame().set_index("int", drop=False)
+    df["Int"] = pd.array([1, None, 3], dtype="Int64")
+    sheet = Sheet.from_dataframe(df, "S", index, header, ColumnarGrid)
+    assert sheet.data == Sheet.from_dataframe(df, "S", index, header, DenseGrid).data
+    if not header:
+        # The columns are stored as typed arrays.
+        kinds = [column.kind for column in sheet.grid._columns]
+        assert kinds == ["i"] * index + ["i", "f", "O", "M", "b", "O"]
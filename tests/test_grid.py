@@ -0,0 +1,131 @@
+import datetime
+
+import pytest
+
+from PyAutoExcel import Sheet
+from PyAutoExcel.Grid import ColumnarGrid, ColumnBuffer, DenseGrid, SparseGrid
+
+GRIDS = [DenseGrid, SparseGrid, ColumnarGrid]
+
+
+@pytest.fixture(params=GRIDS, ids=lambda g: g.__name__)
+def grid(request):
+    return request.param()
+
+
+def test_cells_rows_and_columns(grid):
+    grid.row(0, ["a", "b"])
+    grid.cell(2, 3, 1.5)
+    grid.column(1, ["x", "y"])
+    assert (grid.nrows, grid.ncols) == (3, 4)
+    assert grid.get() == [["a", "x", "", ""], ["", "y", "", ""], ["", "", "", 1.5]]
+    assert grid.get_cell(2, 3) == 1.5
+    assert grid.get_col(1) == ["x", "y", ""]
+    assert grid.get_range(0, 1, 1, 2) == [["x", ""], ["y", ""]]
+    assert [i for i, _ in grid.iter_populated_rows()] == [0, 1, 2]
+
+
+def test_negative_indexes(grid):
+    grid.row(0, [1, 2, 3])
+    grid.row(1, [4, 5, 6])
+    assert grid.get_row(-1) == [4, 5, 6]
+    assert grid.get_cell(-1, -1) == 6
+    assert grid.get_col(-1) == [3, 6]
+    with pytest.raises(IndexError):
+        grid.get_row(2)
+    with pytest.raises(IndexError):
+        grid.get_row(-3)
+
+
+def test_overwrite_and_none(grid):
+    grid.row(0, [1, 2, 3])
+    grid.row(0, [None, 7])
+    assert grid.get_row(0) == [None, 7, 3]
+
+
+def test_empty_strings_extend_the_grid(grid):
+    grid.row(0, ["a", "", ""])
+    grid.column(4, ["", ""])
+    assert (grid.nrows, grid.ncols) == (2, 5)
+    assert grid.get_row(0) == ["a", "", "", "", ""]
+
+
+def test_copy_is_independent(grid):
+    grid.row(0, [1, "a"])
+    other = grid.copy()
+    other.cell(0, 0, 2)
+    other.row(1, [3])
+    assert grid.get() == [[1, "a"]]
+    assert other.get() == [[2, "a"], [3, ""]]
+
+
+def test_columnar_types():
+    grid = ColumnarGrid()
+    grid.column(0, [1, 2, 3])
+    grid.column(1, [1.5, None, 2.5])
+    grid.column(2, [datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2), None])
+    grid.column(3, ["a", 1, True])
+    kinds = [grid._columns[j].kind for j in range(4)]
+    assert kinds == ["i", "f", "M", "O"]
+    assert grid.get_row(0) == [1, 1.5, datetime.datetime(2024, 1, 1), "a"]
+    values, mask = grid.get_array(1)
+    assert mask.tolist() == [True, False, True]
+
+
+@pytest.mark.parametrize(
+    "values", [[2**60 + 1, 2.5], [2.5, 2**60 + 1], [2**53 + 1, 0.5]]
+)
+def test_columnar_large_integers_stay_exact(values):
+    column = ColumnBuffer()
+    for i, v in enumerate(values):
+        column.set(i, v)
+    assert column.kind == "O"
+    assert column.to_list() == values
+
+
+def test_columnar_small_integers_become_floats():
+    column = ColumnBuffer()
+    column.set(0, 1)
+    column.set(1, 2.5)
+    assert column.kind == "f"
+    assert column.to_list() == [1.0, 2.5]
+
+
+@pytest.mark.parametrize(
+    "first, values, dtype",
+    [
+        (None, [1, 2, 3], "int64"),
+        ("a", [1.5, None, 2.5], "float64"),
+        (7, [1.5, 2.5], "float64"),
+        (0.5, [2**60 + 1, 2], "int64"),
+        (None, [datetime.datetime(2024, 1, 1), None], "datetime64[us]"),
+        ("", ["a", "", None, 1], "object"),
+    ],
+)
+def test_columnar_set_array_matches_set(first, values, dtype):
+    np = pytest.importorskip("numpy")
+    expected, column = ColumnBuffer(), ColumnBuffer()
+    for buffer in (expected, column):
+        if first is not None:
+            buffer.set(0, first)
+    for i, v in enumerate(values, 1):
+        expected.set(i, v)
+    array = np.array(
+        [np.nan if v is None and dtype == "float64" else v for v in values],
+        dtype=dtype,
+    )
+    missing = np.array([v is None for v in values])
+    column.set_array(1, array, missing)
+    assert column.kind == expected.kind
+    assert column.to_list() == expected.to_list()
+    assert column.state.tolist()[:4] == expected.state.tolist()[:4]
+
+
+def test_sheet_switches_to_sparse():
+    sheet = Sheet("S")
+    sheet.set_cell(0, 0, 1)
+    sheet.set_cell(5000, 200, 2)
+    assert isinstance(sheet.grid, SparseGrid)
+    assert sheet.get_cell(5000, 200) == 2 and sheet.ncols() == 201
+    sheet.set_row(6000, ["a"] + [""] * 299)
+    assert sheet.ncols() == 300
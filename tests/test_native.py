@@ -0,0 +1,85 @@
+import datetime
+import gc
+import io
+import math
+import warnings
+
+import pytest
+
+from PyAutoExcel import ExcelReader, ExcelWriter, Sheet
+
+ROWS = [
+    ["text", "<&> é", "=1+1", ""],
+    [1, -2.5, 10**15, True],
+    [datetime.datetime(2024, 5, 6, 7, 8, 9), datetime.date(2024, 5, 6), None, False],
+    [],
+    ["last"],
+]
+
+
+def write(rows) -> bytes:
+    writer = ExcelWriter("native")
+    sheet = Sheet("S")
+    sheet.data = rows
+    writer.add_sheet(sheet)
+    return writer.save()
+
+
+def read(content: bytes, engine: str = "native") -> list[list]:
+    return ExcelReader(io.BytesIO(content), engine).sheet_by_index(0).data
+
+
+@pytest.mark.parametrize("engine", ["native", "openpyxl"])
+def test_round_trip(engine):
+    data = read(write(ROWS), engine)
+    assert data[0][:2] == ["text", "<&> é"]
+    assert data[1] == [1, -2.5, 10**15, True]
+    assert data[2][:2] == [
+        datetime.datetime(2024, 5, 6, 7, 8, 9),
+        datetime.datetime(2024, 5, 6),
+    ]
+    assert data[2][3] is False
+    assert data[3] == ["", "", "", ""]
+    assert data[4][0] == "last"
+
+
+def test_temporary_files_are_closed():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        write(ROWS)
+        gc.collect()
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_formula_is_written_as_a_formula():
+    import openpyxl
+
+    book = openpyxl.load_workbook(io.BytesIO(write(ROWS)))
+    assert book.active["C1"].value == "=1+1"
+
+
+def test_numpy_scalars_are_numbers():
+    np = pytest.importorskip("numpy")
+    rows = [
+        [np.int64(3), np.float32(0.5), np.bool_(True), np.uint8(7), np.float64(1.25)]
+    ]
+    assert read(write(rows)) == [[3, 0.5, True, 7, 1.25]]
+
+
+def test_nan_is_empty_and_infinity_is_an_error():
+    data = read(write([[1.0, math.nan, math.inf, -math.inf, "x"]]))
+    assert data[0][0] == 1.0 and data[0][1] in ("", None) and data[0][4] == "x"
+    import openpyxl
+
+    sheet = openpyxl.load_workbook(io.BytesIO(write([[math.nan, math.inf]]))).active
+    assert sheet["A1"].value is None
+    assert sheet["B1"].value == "#NUM!"
+
+
+def test_streamed_rows_in_memory():
+    writer = ExcelWriter("native")
+    with writer.stream_sheet("S") as stream:
+        for i in range(1000):
+            stream.append([i, f"row {i}"])
+    data = read(writer.save())
+    assert len(data) == 1000 and data[-1] == [999, "row 999"]
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+from PyAutoExcel import ExcelReader
+
+BOOK = {"A": [["x", "y"], [1, 2]], "B": [["z"], [3]], "C": [["w"], [4]]}
+
+
+def test_workers_read_every_sheet(make_xlsx):
+    path = make_xlsx(BOOK)
+    reader = ExcelReader(path, "native", workers=2)
+    assert reader.sheet_names() == ["A", "B", "C"]
+    assert [s.data for s in reader.sheets()] == list(BOOK.values())
+
+
+def test_import_does_not_load_the_process_pool():
+    code = "import sys, PyAutoExcel; print('concurrent.futures' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("ordered", [True, False])
+def test_read_many_reports_errors_per_file(make_xlsx, tmp_path, workers, ordered):
+    first = make_xlsx({"S": [["first"]]}, "first.xlsx")
+    with open(make_xlsx({"S": [["second"]]}, "second.xlsx"), "rb") as f:
+        second = f.read()  # The content of a file.
+    files = [first, str(tmp_path / "missing.xlsx"), b"not a workbook", second]
+    results = list(ExcelReader.read_many(files, workers=workers, ordered=ordered))
+    if ordered:
+        assert [r.index for r in results] == [0, 1, 2, 3]
+    results.sort(key=lambda r: r.index)
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert results[0].document.sheet_by_index(0).data == [["first"]]
+    assert results[3].document.sheet_by_index(0).data == [["second"]]
+    assert isinstance(results[1].error, Exception) and results[1].document is None
+    assert results[2].file == b"not a workbook"
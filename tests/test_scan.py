@@ -0,0 +1,71 @@
+import io
+
+import pytest
+
+from PyAutoExcel import scan
+from PyAutoExcel.CellRange import CellRange
+
+
+@pytest.fixture
+def xls_file(tmp_path) -> str:
+    xlwt = pytest.importorskip("xlwt")
+    pytest.importorskip("xlrd")
+    book = xlwt.Workbook()
+    data = book.add_sheet("Data")
+    for r, row in enumerate([["ID", "Name"], [1, "a"], [2, "b"]]):
+        for c, value in enumerate(row):
+            data.write(r, c, value)
+    data.write(4, 3, "far")
+    hidden = book.add_sheet("Hidden")
+    hidden.write(0, 0, "x")
+    hidden.visibility = 1
+    book.add_sheet("Empty")
+    path = str(tmp_path / "book.xls")
+    book.save(path)
+    return path
+
+
+def test_scan_xls(xls_file):
+    info = scan(xls_file)
+    assert info.format == "xls"
+    assert info.sheet_names == ["Data", "Hidden", "Empty"]
+    data, hidden, empty = info.sheets
+    assert data.dimension == CellRange(0, 0, 4, 3)
+    assert data.header == ["ID", "Name"]
+    assert not hidden.visible and hidden.state == "hidden"
+    assert hidden.dimension == CellRange(0, 0, 0, 0)
+    assert empty.dimension is None and empty.header == []
+
+
+def test_scan_xls_without_header(xls_file):
+    with open(xls_file, "rb") as f:
+        content = f.read()
+    for file in (content, io.BytesIO(content)):
+        info = scan(file, header=False)
+        assert info.format == "xls"
+        assert [s.header for s in info.sheets] == [None, None, None]
+        assert info.sheets[0].dimension == CellRange(0, 0, 4, 3)
+
+
+def test_scan_xls_without_xlrd_internals(xls_file, monkeypatch):
+    import xlrd
+
+    opened = xlrd.open_workbook
+
+    def open_workbook(*args, **kwargs):
+        book = opened(*args, **kwargs)
+        del book._sh_abs_posn, book._sheet_visibility
+        return book
+
+    monkeypatch.setattr(xlrd, "open_workbook", open_workbook)
+    info = scan(xls_file, header=False)
+    assert [s.dimension for s in info.sheets] == [None, None, None]
+    assert [s.state for s in info.sheets] == ["visible"] * 3
+
+
+def test_scan_xlsx(make_xlsx):
+    path = make_xlsx({"First": [["a", "b", ""]], "Second": [[], [1, 2, 3]]})
+    info = scan(path)
+    assert info.format == "xlsx"
+    assert [s.header for s in info.sheets] == [["a", "b"], []]
+    assert info.sheets[1].dimension == CellRange(0, 0, 1, 2)
@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from PyAutoExcel import ExcelReader, ExcelWriter, Sheet
+from PyAutoExcel.Tracing import PhaseRecorder, current_tracer, tracing
+
+
+def test_tracing_reader_and_writer(tmp_path):
+    path = str(tmp_path / "book.xlsx")
+    recorder = PhaseRecorder()
+    with tracing(recorder):
+        writer = ExcelWriter("native")
+        sheet = Sheet("S")
+        sheet.data = [[1, 2], [3, 4], [5, 6]]
+        writer.add_sheet(sheet)
+        writer.save(path)
+        ExcelReader(path, "native")
+        with ExcelReader(path, "native", lazy=True) as reader:
+            reader.sheets()[0].data
+    assert current_tracer.get() is None
+    size = os.path.getsize(path)
+
+    phases = [(e.phase, e.sheet) for e in recorder.events]
+    assert phases == [
+        ("setup", None),
+        ("write", None),
+        ("output", None),
+        ("setup", None),
+        ("parse", None),
+        ("setup", None),
+        ("parse", "S"),
+    ]
+    assert all(e.engine == "native" and e.error is None for e in recorder.events)
+    assert recorder.events[2].file == path and recorder.events[2].bytes_out == size
+
+    summary = recorder.summary()
+    assert set(summary) == {
+        ("native", p) for p in ("setup", "write", "output", "parse")
+    }
+    setup, parse = summary["native", "setup"], summary["native", "parse"]
+    assert setup["count"] == 3 and setup["bytes_in"] == 2 * size
+    assert parse["count"] == 2 and parse["rows"] == 6 and parse["cells"] == 12
+    assert summary["native", "write"]["cells"] == 6
+    assert summary["native", "output"]["bytes_out"] == size
+
+
+def test_failing_tracer_only_warns(make_xlsx):
+    path = make_xlsx({"S": [[1]]})
+
+    def tracer(event):
+        raise ValueError("broken")
+
+    with pytest.warns(RuntimeWarning, match="broken"):
+        reader = ExcelReader(path, "native", tracer=tracer)
+    assert reader.sheets()[0].data == [[1]]
@@ -0,0 +1,49 @@
+import pytest
+
+from PyAutoExcel import ExcelReader
+from PyAutoExcel.Utils import parse_usecols, resolve_columns
+
+BOOK = {
+    "Orders": [["ID", "Name", "Qty", "Price"], [1, "a", 2, 1.5], [2, "b", 4, 2.5]],
+    "Notes": [["Note", "Qty"], ["x", 7]],
+}
+
+
+def test_parse_usecols_letters_and_names():
+    assert parse_usecols("A,C:D") == ({0, 2, 3}, [])
+    assert parse_usecols(["ID", "C:D", 5, "Unit price"]) == (
+        {2, 3, 5},
+        ["ID", "Unit price"],
+    )
+
+
+def test_resolve_columns_names_first():
+    header = ["SKU", "ID", "B"]
+    assert resolve_columns(["ID"], header) == [1]
+    assert resolve_columns(["B"], header) == [2]
+    assert resolve_columns(["C"], header) == [2]  # Not a header name, read as letters.
+    with pytest.raises(ValueError):
+        resolve_columns(["Price"], header)
+    assert resolve_columns(["Price", "SKU"], header, strict=False) == [0]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_usecols_by_name(reader_file, lazy):
+    path, engine = reader_file(BOOK)
+    reader = ExcelReader(path, engine, usecols=["ID", "Qty"], header_row=0, lazy=lazy)
+    assert reader.sheet_by_index(0).data == [["ID", "Qty"], [1, 2], [2, 4]]
+    # The other sheet has no 'ID' column, only 'Qty' is read.
+    assert reader.sheet_by_index(1).data == [["Qty"], [7]]
+
+
+def test_usecols_by_letters(reader_file):
+    path, engine = reader_file(BOOK)
+    reader = ExcelReader(path, engine, usecols="B:C")
+    assert reader.sheet_by_index(0).data == [["Name", "Qty"], ["a", 2], ["b", 4]]
+    assert reader.sheet_by_index(1).data == [["Qty"], [7]]
+
+
+def test_usecols_unknown_name(reader_file):
+    path, engine = reader_file(BOOK)
+    with pytest.raises(ValueError, match="Discount"):
+        ExcelReader(path, engine, usecols=["ID", "Discount"])
@@ -0,0 +1,43 @@
+import zipfile
+
+import pytest
+
+from PyAutoExcel import CellRange, ExcelReader, Sheet
+
+# A worksheet declaring A1:Z1000, whose values only fill A2:B4.
+WORKSHEET = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<dimension ref="A1:Z1000"/><sheetData><row r="1"/>'
+    '<row r="2"><c r="B2"><v>1</v></c>'
+    '<c r="C2" t="inlineStr"><is><t></t></is></c><c r="E2"/></row>'
+    '<row r="4"><c r="A4"><v>3</v></c><c r="B4" t="inlineStr"><is><t>x</t></is></c></row>'
+    '<row r="1000"><c r="Z1000" t="inlineStr"><is><t></t></is></c></row>'
+    "</sheetData></worksheet>"
+)
+
+
+def test_used_range():
+    sheet = Sheet("S")
+    assert sheet.used_range is None
+    sheet.data = [[None, ""], [None, None, 1, ""], [], [2, None, None, None, ""]]
+    assert sheet.used_range == CellRange(1, 0, 3, 2)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("engine", ["native", "openpyxl", "sxl"])
+def test_declared_dimension_is_trimmed(make_xlsx, tmp_path, engine, lazy):
+    if engine != "native":
+        pytest.importorskip(engine)
+    source = make_xlsx({"S": [[1]]})
+    path = str(tmp_path / "dimension.xlsx")
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(path, "w") as dst:
+        for name in src.namelist():
+            content = src.read(name)
+            dst.writestr(name, WORKSHEET if name.endswith("sheet1.xml") else content)
+
+    with ExcelReader(path, engine, lazy=lazy) as reader:
+        sheet = reader.sheets()[0]
+        assert (sheet.nrows(), sheet.ncols()) == (4, 2)
+        assert sheet.data[1] == [None, 1] and sheet.data[3] == [3, "x"]
+        assert sheet.used_range == CellRange(1, 0, 3, 1)
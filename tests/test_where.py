@@ -0,0 +1,79 @@
+import pytest
+
+from PyAutoExcel import ExcelReader
+from PyAutoExcel.RowFilter import PaddedRow, RowFilter
+
+# A blank row and a row shorter than the others, as most engines give them.
+BOOK = {"S": [["Name", "Qty", "Note"], ["a", 3], [], ["b"], ["c", 3, "x"], ["d", 1]]}
+KEPT = [["Name", "Qty", "Note"], ["a", 3, ""], ["c", 3, "x"]]
+# The second sheet has no Qty column.
+ORDERS = {"Orders": [["ID", "Qty"], [1, 3], [2, 1]], "Notes": [["Note"], ["x"]]}
+
+
+def test_padded_row():
+    row = PaddedRow(["a"])
+    assert row[0] == "a" and row[5] is None and row[-1] == "a"
+    assert RowFilter(lambda r: r[2] is None).bind({})(())
+
+
+@pytest.mark.parametrize("where", [lambda r: r[1] == 3, "Qty == 3", "B == 3"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_where(reader_file, where, lazy):
+    path, engine = reader_file(BOOK)
+    reader = ExcelReader(path, engine, header_row=0, where=where, lazy=lazy)
+    assert reader.sheet_by_index(0).data == KEPT
+
+
+def test_where_header_names_before_letters():
+    where = RowFilter("ID == 1 and C > 0")
+    assert where.columns(["ID", "Name"]) == {"ID": 0, "C": 2}
+    assert where.columns() == {"ID": 237, "C": 2}
+    with pytest.raises(ValueError, match="Qty"):
+        RowFilter("Qty == 1").columns(["ID"])
+    assert RowFilter("Qty == 1").columns(["ID"], strict=False) == {}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_where_per_sheet(reader_file, lazy):
+    path, engine = reader_file(ORDERS)
+    reader = ExcelReader(path, engine, header_row=0, where="Qty == 3", lazy=lazy)
+    # The sheet without the column has no data rows.
+    assert [sheet.data for sheet in reader.sheets()] == [
+        [["ID", "Qty"], [1, 3]],
+        [["Note"]],
+    ]
+    reader = ExcelReader(path, engine, header_row=0, where="ID == 1", lazy=lazy)
+    assert reader.sheet_by_index(0).data == [["ID", "Qty"], [1, 3]]
+
+
+@pytest.mark.parametrize(
+    "where", ["'x' * 100000000000 == Qty", "Qty * [1] == []", "(1, 2) * Qty"]
+)
+def test_where_rejects_repetition(where):
+    with pytest.raises(ValueError, match="repeated"):
+        RowFilter(where)
+
+
+def test_where_does_not_repeat_cells():
+    # A string cell is not repeated either, the row is rejected.
+    test = RowFilter("Name * 100000000000 == ''").bind({"Name": 0})
+    assert not test(["a"])
+    assert RowFilter("Qty * 2 == 6").bind({"Qty": 0})([3])
+
+
+def test_where_unknown_name(reader_file):
+    path, engine = reader_file(ORDERS)
+    with pytest.raises(ValueError, match="Price"):
+        ExcelReader(path, engine, header_row=0, where="Price > 1")
+
+
+def test_where_with_usecols(reader_file):
+    path, engine = reader_file(BOOK)
+    reader = ExcelReader(
+        path,
+        engine,
+        header_row=0,
+        usecols=["Name", "Note"],
+        where=lambda r: r[1] == "x",
+    )
+    assert reader.sheet_by_index(0).data == [["Name", "Note"], ["c", "x"]]
@@ -0,0 +1,35 @@
+import pytest
+
+from PyAutoExcel import ExcelReader
+
+BOOK = {"S": [["Title"], ["Name", "Qty"], ["a", 1], ["b", 2], ["c", 3], ["d", 4]]}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_header_row_skiprows_nrows(reader_file, lazy):
+    path, engine = reader_file(BOOK)
+    reader = ExcelReader(path, engine, header_row=1, skiprows=1, nrows=2, lazy=lazy)
+    assert reader.sheet_by_index(0).data == [["Name", "Qty"], ["b", 2], ["c", 3]]
+
+
+def test_skiprows_without_header(reader_file):
+    path, engine = reader_file(BOOK)
+    reader = ExcelReader(path, engine, skiprows=4)
+    assert reader.sheet_by_index(0).data == [["c", 3], ["d", 4]]
+
+
+def test_nrows_past_the_end(reader_file):
+    path, engine = reader_file(BOOK)
+    reader = ExcelReader(path, engine, header_row=1, nrows=100, usecols=["Qty"])
+    assert reader.sheet_by_index(0).data == [["Qty"], [1], [2], [3], [4]]
+
+
+def test_lazy_iter_rows_stops_at_the_window(reader_file):
+    path, engine = reader_file(BOOK)
+    with ExcelReader(path, engine, lazy=True, nrows=3) as reader:
+        assert list(reader.iter_rows()) == [["Title"], ["Name", "Qty"], ["a", 1]]
+
+
+def test_negative_window():
+    with pytest.raises(ValueError):
+        ExcelReader(b"", "native", skiprows=-1)